@@ -1,20 +1,18 @@
 import asyncio
 import concurrent.futures
+import contextlib
 import json
 import logging
 import shlex
 import shutil
 import time
 from dataclasses import dataclass
-from pathlib import Path
-
-import yaml
 
 from sregym.conductor.constants import StartProblemResult
 from sregym.conductor.oracles.detection import DetectionOracle
 from sregym.conductor.oracles.diagnosis_oracle import DiagnosisOracle
 from sregym.conductor.problems.registry import ProblemRegistry
-from sregym.conductor.utils import is_ordered_subset
+from sregym.conductor.utils import is_ordered_subset, load_tasklist
 from sregym.generators.fault.inject_remote_os import RemoteOSFaultInjector
 from sregym.generators.fault.inject_virtual import VirtualizationFaultInjector
 from sregym.generators.noise.manager import get_noise_manager
@@ -30,6 +28,12 @@ from sregym.service.kubectl import KubeCtl
 from sregym.service.mcp_server import MCPServer
 from sregym.service.telemetry.loki import Loki
 from sregym.service.telemetry.prometheus import Prometheus
+from sregym.utils.cache import cached_manifest_path
+
+METRICS_SERVER_MANIFEST_URL = (
+    "https://github.com/kubernetes-sigs/metrics-server/releases/latest/download/components.yaml"
+)
+OPENEBS_OPERATOR_MANIFEST_URL = "https://openebs.github.io/charts/openebs-operator.yaml"
 
 
 @dataclass
@@ -46,7 +50,7 @@ class Conductor:
 
         # core services
         self.problems = ProblemRegistry()
-        self.kubectl = KubeCtl()
+        self.kubectl = KubeCtl.instance()
         self.prometheus = Prometheus()
         self.jaeger = Jaeger()
         self.otel_collector = OtelCollector()
@@ -128,22 +132,19 @@ class Conductor:
                 raise RuntimeError(f"[❌] Required dependency '{b}' not found.")
 
     def get_problem_stages(self):
-        file_dir = Path(__file__).resolve().parent
-        tasklist_path = file_dir / "tasklist.yml"
+        tasklist = load_tasklist()
 
         # If tasklist file doesn't exist, default to running diagnosis + mitigation
-        if not tasklist_path.exists():
+        if tasklist is None:
             self.logger.info("No tasklist.yml found. Defaulting to running diagnosis and mitigation for this problem.")
             self.tasklist = ["diagnosis", "mitigation"]
             return
 
-        with open(tasklist_path) as f:
-            tasklist = yaml.safe_load(f)
-            if not tasklist:
-                msg = "Badly formatted tasklist.yml"
-                self.logger.error(msg)
-                raise RuntimeError(msg)
-            problems = tasklist["all"]["problems"]
+        if not tasklist:
+            msg = "Badly formatted tasklist.yml"
+            self.logger.error(msg)
+            raise RuntimeError(msg)
+        problems = tasklist["all"]["problems"]
 
         if self.problem_id not in (problems if problems else []):
             self.logger.warning("problem_id not found in tasklist. Defaulting to running diagnosis and mitigation.")
@@ -579,7 +580,7 @@ class Conductor:
             )
 
             problem = CalicoRouteReflectorLabelDriftHotelReservation
-            kubectl = KubeCtl()
+            kubectl = KubeCtl.instance()
 
             def kubectl_json(command):
                 output = kubectl.exec_command(command)
@@ -730,7 +731,7 @@ class Conductor:
                 PodCIDRExhaustionHotelReservation,
             )
 
-            kubectl = KubeCtl()
+            kubectl = KubeCtl.instance()
             kubectl.exec_command(
                 f"kubectl patch ippool {PodCIDRExhaustionHotelReservation.DEFAULT_POOL_NAME} --type=merge "
                 '-p \'{"spec":{"disabled":false}}\''
@@ -779,6 +780,29 @@ class Conductor:
 
         self.logger.info("Fix Kubernetes completed.")
 
+    def _setup_metrics_server(self):
+        self.logger.info("[DEPLOY] Setting up metrics-server…")
+        self.kubectl.exec_command(f"kubectl apply -f {cached_manifest_path(METRICS_SERVER_MANIFEST_URL)}")
+        self.kubectl.exec_command(
+            "kubectl -n kube-system patch deployment metrics-server "
+            "--type=json -p='["
+            '{"op":"add","path":"/spec/template/spec/containers/0/args/-","value":"--kubelet-insecure-tls"},'
+            '{"op":"add","path":"/spec/template/spec/containers/0/args/-","value":"--kubelet-preferred-address-types=InternalIP"}'
+            "]'"
+        )
+        self.kubectl.wait_for_ready("kube-system")
+
+    def _setup_openebs(self):
+        self.logger.info("[DEPLOY] Setting up OpenEBS…")
+        self._preflight_openebs_udev_mount()
+        self.kubectl.exec_command(f"kubectl apply -f {cached_manifest_path(OPENEBS_OPERATOR_MANIFEST_URL)}")
+        self.kubectl.exec_command(
+            "kubectl patch storageclass openebs-hostpath "
+            '-p \'{"metadata":{"annotations":{"storageclass.kubernetes.io/is-default-class":"true"}}}\''
+        )
+        self.kubectl.wait_for_ready("openebs")
+        self._ensure_openebs_device_storageclass()
+
     def deploy_app(self):
         """Kubectl + Prometheus + problem.app deployment."""
         problem = self.current_problem
@@ -795,52 +819,34 @@ class Conductor:
                 self.cluster_state.save_baseline_state(CLUSTER_BASELINE_STATE_FILE)
             self._baseline_captured = True
 
-        self.logger.info("[DEPLOY] Setting up metrics-server…")
-        self.kubectl.exec_command(
-            "kubectl apply -f https://github.com/kubernetes-sigs/metrics-server/"
-            "releases/latest/download/components.yaml"
-        )
-        self.kubectl.exec_command(
-            "kubectl -n kube-system patch deployment metrics-server "
-            "--type=json -p='["
-            '{"op":"add","path":"/spec/template/spec/containers/0/args/-","value":"--kubelet-insecure-tls"},'
-            '{"op":"add","path":"/spec/template/spec/containers/0/args/-","value":"--kubelet-preferred-address-types=InternalIP"}'
-            "]'"
-        )
-        self.kubectl.wait_for_ready("kube-system")
+        # metrics-server and OpenEBS don't depend on each other; install and wait on them side by side.
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [executor.submit(self._setup_metrics_server), executor.submit(self._setup_openebs)]
+            for future in futures:
+                future.result()
 
         # Only deploy Khaos if the problem requires it
         if problem.requires_khaos():
-            self.logger.info("[DEPLOY] Deploying Khaos DaemonSet...")
-            self.khaos.ensure_deployed()
+            with self._deploy_phase("Khaos DaemonSet"):
+                self.khaos.ensure_deployed()
 
-        self.logger.info("[DEPLOY] Setting up OpenEBS…")
-        self._preflight_openebs_udev_mount()
-        self.kubectl.exec_command("kubectl apply -f https://openebs.github.io/charts/openebs-operator.yaml")
-        self.kubectl.exec_command(
-            "kubectl patch storageclass openebs-hostpath "
-            '-p \'{"metadata":{"annotations":{"storageclass.kubernetes.io/is-default-class":"true"}}}\''
-        )
-        self.kubectl.wait_for_ready("openebs")
-        self._ensure_openebs_device_storageclass()
-
-        self.logger.info("[DEPLOY] Deploying Prometheus…")
-        self.prometheus.deploy()
+        with self._deploy_phase("Prometheus"):
+            self.prometheus.deploy()
 
-        self.logger.info("[DEPLOY] Deploying Jaeger…")
-        self.jaeger.deploy()
+        with self._deploy_phase("Jaeger"):
+            self.jaeger.deploy()
 
-        self.logger.info("[DEPLOY] Deploying OTel Collector…")
-        self.otel_collector.deploy()
+        with self._deploy_phase("OTel Collector"):
+            self.otel_collector.deploy()
 
         if self.config.deploy_loki:
-            self.logger.info("[DEPLOY] Deploying Loki…")
-            self.loki.deploy()
+            with self._deploy_phase("Loki"):
+                self.loki.deploy()
         else:
             self.logger.info("[DEPLOY] Skipping Loki deployment (external harness mode)")
 
-        self.logger.info("[DEPLOY] Deploying MCP server…")
-        self.mcp_server.deploy()
+        with self._deploy_phase("MCP server"):
+            self.mcp_server.deploy()
 
         self.logger.info("[ENV] Set up necessary components: metrics-server, Khaos, OpenEBS, Prometheus, Jaeger, Loki")
 
@@ -854,14 +860,11 @@ class Conductor:
 
         if is_train_ticket:
             for ns in app_namespaces:
-                self.kubectl.exec_command(
-                    f"kubectl create namespace {ns} --dry-run=client -o yaml | kubectl apply -f -"
-                )
+                self.kubectl.create_namespace_if_not_exist(ns)
                 self.jaeger.create_external_name_service(ns)
 
-        self.logger.info("[DEPLOY] Deploying and starting workload")
-        problem.app.deploy()
-        self.logger.info(f"[ENV] Deploy application: {problem.app.name}")
+        with self._deploy_phase(f"application {problem.app.name}"):
+            problem.app.deploy()
 
         if not is_train_ticket:
             for ns in app_namespaces:
@@ -873,6 +876,14 @@ class Conductor:
         else:
             self.logger.info("[ENV] Default application workload disabled for this problem")
 
+    @contextlib.contextmanager
+    def _deploy_phase(self, component: str):
+        """Log the start of a deploy step and how long it took, so slow setup steps show up in the run log."""
+        self.logger.info("[DEPLOY] Deploying %s…", component)
+        start = time.perf_counter()
+        yield
+        self.logger.info("[DEPLOY] %s deployed in %.1fs", component, time.perf_counter() - start)
+
     def undeploy_app(self):
         """Teardown problem.app and, if no other apps running, OpenEBS/Prometheus."""
         if self.problem:
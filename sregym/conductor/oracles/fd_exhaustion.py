@@ -1,4 +1,3 @@
-import subprocess
 import time
 
 from sregym.conductor.oracles.mitigation import MitigationOracle
@@ -19,8 +18,7 @@ class FDMitigationOracle(MitigationOracle):
         self.wait_seconds = wait_seconds
 
     def _get_logs(self):
-        cmd = ["kubectl", "logs", f"deployment/{self.faulty_service}", "-n", self.namespace, "--tail=50"]
-        result = subprocess.run(cmd, capture_output=True, text=True)
+        result = self.kubectl.run(["logs", f"deployment/{self.faulty_service}", "--tail=50"], namespace=self.namespace)
         return result.stdout if result.returncode == 0 else ""
 
     def evaluate(self) -> dict:
@@ -12,9 +12,6 @@ from enum import StrEnum
 from pathlib import Path
 
 import yaml
-from langchain_core.messages import HumanMessage, SystemMessage
-
-from llm_backend.init_backend import get_llm_backend_for_judge
 
 # ---------------------------------------------------------------------------
 # Exceptions and enums
@@ -35,6 +32,18 @@ class JudgmentResult(StrEnum):
 
 
 class LLMJudge:
+    _SYSTEM_PROMPT = (
+        "You are an expert judge evaluating whether an agent's diagnosis of a system "
+        "issue matches the expected root cause.\n\n"
+        "Your task is to compare the agent's answer with the expected root cause and "
+        "determine if they are semantically equivalent.\n\n"
+        "Classification criteria:\n"
+        "- **True**: The agent correctly identified the root cause.\n"
+        "- **False**: The agent did not identify the root cause.\n\n"
+        "Respond with EXACTLY this JSON:\n"
+        '{"judgment": "True|False", "reasoning": "..."}'
+    )
+
     def __init__(
         self,
         provider: str | None = None,
@@ -57,6 +66,9 @@ class LLMJudge:
         """Lazily initialize the LLM backend only when needed."""
         if self._backend is None:
             try:
+                # Deferred: importing the backend pulls in litellm, which dominates problem-registry import time.
+                from llm_backend.init_backend import get_llm_backend_for_judge
+
                 self._backend = get_llm_backend_for_judge()
             except (SystemExit, Exception) as e:
                 print(f"Warning: Failed to initialize LLM backend for judge: {e}")
@@ -68,18 +80,6 @@ class LLMJudge:
         if self.backend is None:
             return None, "LLM judge backend is not initialized - skipping evaluation"
 
-        system_prompt = (
-            "You are an expert judge evaluating whether an agent's diagnosis of a system "
-            "issue matches the expected root cause.\n\n"
-            "Your task is to compare the agent's answer with the expected root cause and "
-            "determine if they are semantically equivalent.\n\n"
-            "Classification criteria:\n"
-            "- **True**: The agent correctly identified the root cause.\n"
-            "- **False**: The agent did not identify the root cause.\n\n"
-            "Respond with EXACTLY this JSON:\n"
-            '{"judgment": "True|False", "reasoning": "..."}'
-        )
-
         user_prompt = (
             f"Expected Root Cause:\n"
             f"{expectation if expectation else '(No fault - system is operating normally)'}\n\n"
@@ -87,7 +87,10 @@ class LLMJudge:
             "Evaluate whether the agent's answer correctly identifies the root cause."
         )
 
-        messages = [SystemMessage(content=system_prompt), HumanMessage(content=user_prompt)]
+        # Deferred: langchain_core is the bulk of problem-registry import time and is only needed to call the judge.
+        from langchain_core.messages import HumanMessage, SystemMessage
+
+        messages = [SystemMessage(content=self._SYSTEM_PROMPT), HumanMessage(content=user_prompt)]
         try:
             response = self.backend.inference(messages)
             return self._parse_judgment(response.content.strip())
@@ -257,12 +260,16 @@ fences, no preamble, no commentary.
         self._system_prompt = self._SYSTEM_PROMPT_TEMPLATE.replace(
             "{{num_questions}}", str(self._num_questions)
         ).replace("{{num_dimensions}}", str(self._num_dimensions))
+        self._checklist_prompt = self._build_checklist_prompt()
 
     @property
     def backend(self):
         """Lazily initialize the LLM backend only when needed."""
         if self._backend is None:
             try:
+                # Deferred: importing the backend pulls in litellm, which dominates problem-registry import time.
+                from llm_backend.init_backend import get_llm_backend_for_judge
+
                 self._backend = get_llm_backend_for_judge()
             except (SystemExit, Exception) as e:
                 print(f"Warning: Failed to initialize LLM backend for judge: {e}")
@@ -404,6 +411,14 @@ fences, no preamble, no commentary.
         lines.append(solution)
         lines.append("")
 
+        # ---- Sections 3 and 4 depend only on the checklist ----
+        lines.append(self._checklist_prompt)
+        return "\n".join(lines)
+
+    def _build_checklist_prompt(self) -> str:
+        """Render the evaluation checklist and required response format, which are fixed per checklist."""
+        lines: list[str] = []
+
         # ---- Section 3: Evaluation checklist ----
         lines.append("## Evaluation Checklist")
         for dim in self._config["dimensions"]:
@@ -433,6 +448,8 @@ fences, no preamble, no commentary.
 
     def _call_llm_with_retry(self, user_msg: str) -> list[dict]:
         """Call the LLM and parse the response, retrying up to once per failure mode."""
+        from langchain_core.messages import HumanMessage, SystemMessage
+
         messages = [
             SystemMessage(content=self._system_prompt),
             HumanMessage(content=user_msg),
@@ -4,6 +4,9 @@ from sregym.conductor.oracles.base import Oracle
 class ValkeyAuthMitigation(Oracle):
     importance = 1.0
 
+    # Separates the CONFIG GET and PING replies of the single combined exec.
+    OUTPUT_SEPARATOR = "--sregym-valkey-ping--"
+
     @staticmethod
     def _requirepass_is_clear(output: str) -> bool:
         lines = output.splitlines()
@@ -32,17 +35,18 @@ class ValkeyAuthMitigation(Oracle):
         valkey_pod = valkey_pods[0]
         print(f"🔍 Found Valkey pod: {valkey_pod}")
 
-        # Check the current password setting in Valkey
+        # Check the current password setting and unauthenticated access in one exec
         try:
-            command = f"kubectl exec -n {namespace} {valkey_pod} -- valkey-cli CONFIG GET requirepass"
-            output = kubectl.exec_command(command)
+            command = (
+                f"kubectl exec -n {namespace} {valkey_pod} -- sh -c "
+                f"'valkey-cli CONFIG GET requirepass; echo {self.OUTPUT_SEPARATOR}; valkey-cli PING'"
+            )
+            output, _, ping_output = kubectl.exec_command(command).partition(f"{self.OUTPUT_SEPARATOR}\n")
 
             if not self._requirepass_is_clear(output):
                 print(f"❌ Unexpected valkey-cli CONFIG GET output: {output}")
                 return results
 
-            ping_command = f"kubectl exec -n {namespace} {valkey_pod} -- valkey-cli PING"
-            ping_output = kubectl.exec_command(ping_command)
             if ping_output.strip() != "PONG":
                 print(f"❌ Valkey still requires authentication: {ping_output}")
                 return results
@@ -12,7 +12,7 @@ from sregym.utils.decorators import mark_fault_injected
 class AdServiceHighCpu(Problem):
     def __init__(self):
         super().__init__(app=AstronomyShop())
-        self.kubectl = KubeCtl()
+        self.kubectl = KubeCtl.instance()
         self.injector = OtelFaultInjector(namespace=self.namespace)
         self.faulty_service = "ad"
         self.feature_flag = "adHighCpu"
@@ -62,7 +62,7 @@ class AdmissionWebhookTLSMismatch(Problem):
         app = self.APPS[app_name]()
         super().__init__(app=app)
 
-        self.kubectl = KubeCtl()
+        self.kubectl = KubeCtl.instance()
         self.admission_api = client.AdmissionregistrationV1Api()
         self.core_api = client.CoreV1Api()
         self.wrong_ca_bundle = None
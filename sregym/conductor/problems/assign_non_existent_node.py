@@ -1,7 +1,5 @@
 """Assign pods to non existent node problem for the SocialNetwork application."""
 
-import time
-
 from sregym.conductor.oracles.assign_non_existent_node_mitigation import AssignNonExistentNodeMitigationOracle
 from sregym.conductor.oracles.llm_as_a_judge.llm_as_a_judge_oracle import LLMAsAJudgeOracle
 from sregym.conductor.problems.base import Problem
@@ -14,7 +12,7 @@ from sregym.utils.decorators import mark_fault_injected
 class AssignNonExistentNode(Problem):
     def __init__(self):
         super().__init__(app=SocialNetwork())
-        self.kubectl = KubeCtl()
+        self.kubectl = KubeCtl.instance()
         self.faulty_service = "user-service"
         self.root_cause = self.build_structured_root_cause(
             component=self.faulty_service,
@@ -40,7 +38,9 @@ class AssignNonExistentNode(Problem):
             fault_type="assign_to_non_existent_node",
             microservices=[self.faulty_service],
         )
-        time.sleep(25)
+        # Wait until the redeployed pods are actually stuck Pending rather than sleeping a fixed interval
+        selector = self.kubectl.get_deployment_label_selector(self.faulty_service, self.namespace)
+        self.kubectl.wait_for_pods_unschedulable(self.namespace, selector, timeout=25)
         print(f"Service: {self.faulty_service} | Namespace: {self.namespace}\n")
 
     @mark_fault_injected
@@ -12,7 +12,7 @@ from sregym.utils.decorators import mark_fault_injected
 class MongoDBAuthMissing(Problem):
     def __init__(self):
         super().__init__(app=SocialNetwork())
-        self.kubectl = KubeCtl()
+        self.kubectl = KubeCtl.instance()
         self.faulty_service = "url-shorten-mongodb"
         self.root_cause = self.build_structured_root_cause(
             component=f"service/{self.faulty_service}",
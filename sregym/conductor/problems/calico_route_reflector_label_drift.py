@@ -63,7 +63,7 @@ class CalicoRouteReflectorLabelDriftHotelReservation(Problem):
         self.app = HotelReservation()
         self.namespace = self.app.namespace
         super().__init__(app=self.app, namespace=self.namespace)
-        self.kubectl = KubeCtl()
+        self.kubectl = KubeCtl.instance()
         self.core_v1 = client.CoreV1Api()
         self.apps_v1 = client.AppsV1Api()
         self.route_reflector_node = None
@@ -15,7 +15,7 @@ class ConfigMapDrift(Problem):
 
         super().__init__(app=HotelReservation())
 
-        self.kubectl = KubeCtl()
+        self.kubectl = KubeCtl.instance()
         self.root_cause = self.build_structured_root_cause(
             component=self.faulty_service,
             namespace=self.namespace,
@@ -122,7 +122,7 @@ class CronJobSidecarBlocksCompletionHotelReservation(Problem):
 
         super().__init__(app=HotelReservation())
 
-        self.kubectl = KubeCtl()
+        self.kubectl = KubeCtl.instance()
         self.batch_v1 = client.BatchV1Api()
         self.core_v1 = client.CoreV1Api()
 
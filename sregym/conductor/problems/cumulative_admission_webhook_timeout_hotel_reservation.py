@@ -419,7 +419,7 @@ srv.serve_forever()
 
     def __init__(self):
         super().__init__(app=HotelReservation())
-        self.kubectl = KubeCtl()
+        self.kubectl = KubeCtl.instance()
         self.core_v1 = client.CoreV1Api()
         self.apps_v1 = client.AppsV1Api()
         self.networking_v1 = client.NetworkingV1Api()
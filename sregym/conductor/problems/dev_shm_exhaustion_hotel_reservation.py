@@ -31,7 +31,7 @@ class DevShmExhaustionHotelReservation(Problem):
     def __init__(self):
         super().__init__(app=HotelReservation())
 
-        self.kubectl = KubeCtl()
+        self.kubectl = KubeCtl.instance()
         self.apps_v1 = client.AppsV1Api()
         self.core_v1 = client.CoreV1Api()
 
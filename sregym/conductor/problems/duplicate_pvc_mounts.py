@@ -24,7 +24,7 @@ class DuplicatePVCMounts(Problem):
             raise ValueError(f"Unsupported app name: {app_name}")
 
         super().__init__(app=app)
-        self.kubectl = KubeCtl()
+        self.kubectl = KubeCtl.instance()
         self.root_cause = self.build_structured_root_cause(
             component=f"deployment/{self.faulty_service}",
             namespace=self.namespace,
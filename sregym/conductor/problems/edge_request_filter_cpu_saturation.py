@@ -22,7 +22,7 @@ class EdgeRequestFilterCPUSaturation(Problem):
 
     def __init__(self):
         super().__init__(app=AstronomyShop())
-        self.kubectl = KubeCtl()
+        self.kubectl = KubeCtl.instance()
         self.faulty_service = "frontend-proxy"
         self.traffic_source = "load-generator"
         self.regex_env = "WAF_RULE_REGEX"
@@ -17,7 +17,7 @@ class EnvVariableShadowing(Problem):
         self.faulty_service = faulty_service
 
         super().__init__(app=AstronomyShop())
-        self.kubectl = KubeCtl()
+        self.kubectl = KubeCtl.instance()
         self.root_cause = self.build_structured_root_cause(
             component=f"deployment/{self.faulty_service}",
             namespace=self.namespace,
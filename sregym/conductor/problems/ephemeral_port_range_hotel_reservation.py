@@ -15,7 +15,7 @@ DEFAULT_RANGE = "32768 60999"
 class EphemeralPortRangeHotelReservation(Problem):
     def __init__(self):
         super().__init__(app=HotelReservation())
-        self.kubectl = KubeCtl()
+        self.kubectl = KubeCtl.instance()
         self.faulty_service = "all"
 
         self.root_cause = self.build_structured_root_cause(
@@ -27,7 +27,7 @@ class ExpiredTlsHotelReservation(Problem):
     def __init__(self):
         super().__init__(app=HotelReservation())
 
-        self.kubectl = KubeCtl()
+        self.kubectl = KubeCtl.instance()
         self.problem_id = "expired_tls_hotel_reservation"
         self.secret_name = "hotel-frontend-tls"
         self.ingress_name = "frontend-ingress"
@@ -63,7 +63,7 @@ class ExpiredTlsHotelReservation(Problem):
         cert_pem, key_pem = self._generate_expired_cert()
         self._create_tls_secret(cert_pem, key_pem)
 
-        KubeCtl().apply_configs(self.namespace, self.ingress_yaml_path)
+        KubeCtl.instance().apply_configs(self.namespace, self.ingress_yaml_path)
 
         # Delete the NGINX default certificate so it cannot fall back to a working cert.
         # This forces clients to receive the expired certificate directly.
@@ -88,7 +88,7 @@ class ExpiredTlsHotelReservation(Problem):
         # redeploying IngressNginx or recreating the secret.
         # IngressNginx().deploy()
 
-        KubeCtl().delete_configs(self.namespace, self.ingress_yaml_path)
+        KubeCtl.instance().delete_configs(self.namespace, self.ingress_yaml_path)
 
         v1 = client.CoreV1Api()
         try:
@@ -1,5 +1,7 @@
 """Otel demo failedReadinessProbe feature flag fault."""
 
+from kubernetes.client.rest import ApiException
+
 from sregym.conductor.oracles.alert_oracle import AlertOracle
 from sregym.conductor.oracles.llm_as_a_judge.llm_as_a_judge_oracle import LLMAsAJudgeOracle
 from sregym.conductor.problems.base import Problem
@@ -12,7 +14,7 @@ from sregym.utils.decorators import mark_fault_injected
 class FailedReadinessProbe(Problem):
     def __init__(self):
         super().__init__(app=AstronomyShop())
-        self.kubectl = KubeCtl()
+        self.kubectl = KubeCtl.instance()
         self.injector = OtelFaultInjector(namespace=self.namespace)
         self.faulty_service = "cart"
         self.root_cause = self.build_structured_root_cause(
@@ -38,21 +40,31 @@ class FailedReadinessProbe(Problem):
         self.injector.inject_fault("failedReadinessProbe")
         # Add a gRPC readiness probe to the cart deployment so the failed flag
         # causes Kubernetes to mark the pod as not ready.
-        patch = (
-            '{"spec":{"template":{"spec":{"containers":[{"name":"cart",'
-            '"readinessProbe":{"grpc":{"port":8080},"periodSeconds":5,"failureThreshold":2}}]}}}}'
-        )
-        self.kubectl.exec_command(
-            f"kubectl patch deployment {self.faulty_service} -n {self.namespace} --type=strategic -p '{patch}'"
-        )
+        # A dict body is sent as a strategic merge patch, so only the cart container's probe changes.
+        patch = {
+            "spec": {
+                "template": {
+                    "spec": {
+                        "containers": [
+                            {
+                                "name": "cart",
+                                "readinessProbe": {"grpc": {"port": 8080}, "periodSeconds": 5, "failureThreshold": 2},
+                            }
+                        ]
+                    }
+                }
+            }
+        }
+        self.kubectl.patch_deployment(self.faulty_service, self.namespace, patch)
         print(f"Fault: failedReadinessProbe | Namespace: {self.namespace}\n")
 
     @mark_fault_injected
     def recover_fault(self):
         print("== Fault Recovery ==")
         self.injector.recover_fault("failedReadinessProbe")
-        # Remove the readiness probe added during injection.
-        patch = '[{"op":"remove","path":"/spec/template/spec/containers/0/readinessProbe"}]'
-        self.kubectl.exec_command(
-            f"kubectl patch deployment {self.faulty_service} -n {self.namespace} --type=json -p '{patch}'"
-        )
+        # Remove the readiness probe added during injection (a list body is sent as a JSON patch).
+        patch = [{"op": "remove", "path": "/spec/template/spec/containers/0/readinessProbe"}]
+        try:
+            self.kubectl.patch_deployment(self.faulty_service, self.namespace, patch)
+        except ApiException as e:
+            print(f"Failed to remove readiness probe from {self.faulty_service}: {e.reason}")
@@ -31,7 +31,7 @@ class FeatureFlagLatentBugHotelReservation(Problem):
         self.namespace = self.app.namespace
         super().__init__(app=self.app, namespace=self.namespace)
 
-        self.kubectl = KubeCtl()
+        self.kubectl = KubeCtl.instance()
         self.root_cause = self.build_structured_root_cause(
             component=f"deployment/{self.faulty_service}",
             namespace=self.namespace,
@@ -25,7 +25,7 @@ class FileDescriptorExhaustion(Problem):
         self.forced_ulimit = 1024
 
         super().__init__(app=self.app, namespace=self.namespace)
-        self.kubectl = KubeCtl()
+        self.kubectl = KubeCtl.instance()
         self.root_cause = self.build_structured_root_cause(
             component=f"deployment/{self.faulty_service}",
             namespace=f"{self.namespace}",
@@ -53,7 +53,7 @@ class FinalizerDeadlockController(Problem):
         self.app = HotelReservation()
         super().__init__(app=self.app, namespace=self.app.namespace)
 
-        self.kubectl = KubeCtl()
+        self.kubectl = KubeCtl.instance()
         self.rbac_v1 = client.RbacAuthorizationV1Api()
         self.configmap_name = _CONFIGMAP_NAME
         self.finalizer = _FINALIZER
@@ -13,7 +13,7 @@ from sregym.utils.decorators import mark_fault_injected
 class GCCapacityDegradation(Problem):
     def __init__(self):
         super().__init__(app=BlueprintHotelReservation())
-        self.kubectl = KubeCtl()
+        self.kubectl = KubeCtl.instance()
         self.faulty_service = "garbage collection"
         self.root_cause = self.build_structured_root_cause(
             component="deployments/all",
@@ -38,7 +38,7 @@ class HPAMissingEffectiveCPURequest(Problem):
 
         super().__init__(app=HotelReservation())
 
-        self.kubectl = KubeCtl()
+        self.kubectl = KubeCtl.instance()
 
         self.root_cause = self.build_structured_root_cause(
             component=(
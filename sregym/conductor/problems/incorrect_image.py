@@ -10,7 +10,7 @@ from sregym.utils.decorators import mark_fault_injected
 class IncorrectImage(Problem):
     def __init__(self):
         super().__init__(app=AstronomyShop())
-        self.kubectl = KubeCtl()
+        self.kubectl = KubeCtl.instance()
         self.faulty_service = ["product-catalog"]
         self.injector = ApplicationFaultInjector(namespace=self.namespace)
         self.root_cause = self.build_structured_root_cause(
@@ -13,7 +13,7 @@ from sregym.utils.decorators import mark_fault_injected
 class IncorrectPortAssignment(Problem):
     def __init__(self, **kwargs):
         super().__init__(app=AstronomyShop())
-        self.kubectl = KubeCtl()
+        self.kubectl = KubeCtl.instance()
         self.faulty_service = "checkout"
         self.env_var = "PRODUCT_CATALOG_ADDR"
         self.incorrect_port = "8082"
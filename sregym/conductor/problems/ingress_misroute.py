@@ -12,7 +12,7 @@ from sregym.utils.decorators import mark_fault_injected
 class IngressMisroute(Problem):
     def __init__(self, path="/api", correct_service="frontend-service", wrong_service="recommendation-service"):
         super().__init__(app=HotelReservation())
-        self.kubectl = KubeCtl()
+        self.kubectl = KubeCtl.instance()
         self.path = path
         self.correct_service = correct_service
         self.wrong_service = wrong_service
@@ -61,7 +61,7 @@ class InitContainerDependencyHang(Problem):
 
         super().__init__(app=app)
 
-        self.kubectl = KubeCtl()
+        self.kubectl = KubeCtl.instance()
         self.root_cause = self.build_structured_root_cause(
             component=f"deployment/{self.faulty_service}",
             namespace=self.namespace,
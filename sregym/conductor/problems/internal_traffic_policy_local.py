@@ -82,7 +82,7 @@ class InternalTrafficPolicyLocalAstronomyShop(Problem):
 
     def __init__(self):
         super().__init__(app=AstronomyShop())
-        self.kubectl = KubeCtl()
+        self.kubectl = KubeCtl.instance()
         self.core_v1 = client.CoreV1Api()
         self.apps_v1 = client.AppsV1Api()
         self.faulty_service = self.FAULTY_SERVICE
@@ -17,7 +17,7 @@ class KafkaPoisonPillHOLBlock(Problem):
     def __init__(self):
         super().__init__(app=AstronomyShop())
 
-        self.kubectl = KubeCtl()
+        self.kubectl = KubeCtl.instance()
         self.injector = KafkaFaultInjector(namespace=self.namespace)
         self.faulty_service = self.CONSUMER_DEPLOYMENT
         self.poison_offset = KafkaFaultInjector.INITIAL_RECORD_COUNT
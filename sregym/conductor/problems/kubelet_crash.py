@@ -10,7 +10,7 @@ from sregym.utils.decorators import mark_fault_injected
 class KubeletCrash(Problem):
     def __init__(self):
         super().__init__(app=AstronomyShop())
-        self.kubectl = KubeCtl()
+        self.kubectl = KubeCtl.instance()
         self.rollout_services = ["frontend", "frontend-proxy", "currency"]
         self.injector = RemoteOSFaultInjector()
 
@@ -20,7 +20,7 @@ class KubeletEvictionThresholdMisconfig(Problem):
             f"KubeletEvictionThresholdMisconfig.NAMESPACE {self.NAMESPACE!r}"
         )
         super().__init__(app=app)
-        self.kubectl = KubeCtl()
+        self.kubectl = KubeCtl.instance()
         self.faulty_service = "currency"
         self.injector = RemoteOSFaultInjector()
         self.target_node = self._pick_worker_node()
@@ -31,7 +31,7 @@ class LivenessProbeMisconfiguration(Problem):
 
         super().__init__(app=app)
 
-        self.kubectl = KubeCtl()
+        self.kubectl = KubeCtl.instance()
         self.injector = VirtualizationFaultInjector(namespace=self.app.namespace)
         self.root_cause = self.build_structured_root_cause(
             component=self.faulty_service,
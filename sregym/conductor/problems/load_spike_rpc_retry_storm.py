@@ -26,7 +26,7 @@ _REVERT_SECONDS = 3510
 class LoadSpikeRPCRetryStorm(Problem):
     def __init__(self):
         super().__init__(app=BlueprintHotelReservation())
-        self.kubectl = KubeCtl()
+        self.kubectl = KubeCtl.instance()
         self.faulty_service = "rpc"
         self.root_cause = self.build_structured_root_cause(
             component=f"configmap/{self.faulty_service}",
@@ -12,7 +12,7 @@ from sregym.utils.decorators import mark_fault_injected
 class MisconfigAppHotelRes(Problem):
     def __init__(self):
         super().__init__(app=HotelReservation())
-        self.kubectl = KubeCtl()
+        self.kubectl = KubeCtl.instance()
         self.faulty_service = ["geo"]
         self.root_cause = self.build_structured_root_cause(
             component="deployment/geo",
@@ -28,7 +28,7 @@ class MissingEnvVariable(Problem):
             ),
         )
 
-        self.kubectl = KubeCtl()
+        self.kubectl = KubeCtl.instance()
         self.diagnosis_oracle = LLMAsAJudgeOracle(problem=self, expected=self.root_cause)
 
         self.app.create_workload()
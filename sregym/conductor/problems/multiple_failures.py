@@ -1,6 +1,6 @@
 """Simulating multiple failures in microservice applications, implemented by composing multiple single-fault problems."""
 
-import time
+from concurrent.futures import ThreadPoolExecutor
 
 from sregym.conductor.oracles.compound import CompoundedOracle
 from sregym.conductor.oracles.llm_as_a_judge.llm_as_a_judge_oracle import LLMAsAJudgeOracle
@@ -48,14 +48,38 @@ class MultipleIndependentFailures(Problem):
         if mitigation_oracles:
             self.mitigation_oracle = CompoundedOracle(self, *mitigation_oracles)
 
+    def _run_on_problems(self, action: str):
+        """Call ``action`` (``inject_fault``/``recover_fault``) on every sub-problem.
+
+        Problems in different namespaces run concurrently; problems sharing a namespace
+        run in listed order since they may touch the same resources. Every problem is
+        attempted, and all failures are raised together so one cannot mask another.
+        """
+        groups: dict[str, list[Problem]] = {}
+        for p in self.problems:
+            groups.setdefault(p.namespace, []).append(p)
+
+        def run_group(problems: list[Problem]) -> list[str]:
+            errors = []
+            for p in problems:
+                try:
+                    getattr(p, action)()
+                except Exception as e:
+                    errors.append(f"{p.__class__.__name__} ({p.namespace}): {e!r}")
+            return errors
+
+        with ThreadPoolExecutor(max_workers=max(len(groups), 1)) as executor:
+            errors = [error for group_errors in executor.map(run_group, groups.values()) for error in group_errors]
+        if errors:
+            raise RuntimeError(f"{action} failed for {len(errors)} problem(s): " + "; ".join(errors))
+
     @mark_fault_injected
     def inject_fault(self):
         print("== Fault Injection ==")
         for p in self.problems:
             print(f"Injecting Fault: {p.__class__.__name__} | Namespace: {p.namespace}")
-            p.inject_fault()
-            time.sleep(1)
         self.faults_str = " | ".join([f"{p.__class__.__name__}" for p in self.problems])
+        self._run_on_problems("inject_fault")
         print(
             f"Injecting Fault: Multiple faults from included problems: [{self.faults_str}] | Namespace: {self.namespaces}\n"
         )
@@ -65,8 +89,7 @@ class MultipleIndependentFailures(Problem):
         print("== Fault Recovery ==")
         for p in self.problems:
             print(f"Recovering Fault: {p.__class__.__name__} | Namespace: {p.namespace}")
-            p.recover_fault()
-            time.sleep(1)
+        self._run_on_problems("recover_fault")
         print(
             f"Recovering Fault: Multiple faults from included problems: [{self.faults_str}] | Namespace: {self.namespaces}\n"
         )
@@ -40,6 +40,7 @@ import subprocess
 import tempfile
 import textwrap
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 from kubernetes import client
@@ -165,7 +166,7 @@ class MutatingWebhookResourceLimits(Problem):
         super().__init__(app=self.app, namespace=self.app.namespace)
 
         self.namespace = self.app.namespace
-        self.kubectl = KubeCtl()
+        self.kubectl = KubeCtl.instance()
         self.admission_api = client.AdmissionregistrationV1Api()
         self.core_api = client.CoreV1Api()
         self.ca_bundle = None
@@ -660,9 +661,16 @@ spec:
         # spec vs. a populated one on the running pod. With the spec carrying
         # 128Mi/256Mi, only the *value* gap (spec 128/256 vs. pod 16/16) leaks
         # the mutation.
-        self._patch_target_deployment_resources()
-
-        self._ensure_webhook_backend()
+        # The pre-patch rollout and the webhook backend rollout touch different
+        # namespaces, so they run side by side; both must finish before any
+        # webhook is registered.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [
+                executor.submit(self._patch_target_deployment_resources),
+                executor.submit(self._ensure_webhook_backend),
+            ]
+            for future in futures:
+                future.result()
 
         # Install decoys before the real webhook so the cluster's admission
         # surface looks like a real policy/mesh stack the moment the fault
@@ -709,6 +717,21 @@ spec:
     @mark_fault_injected
     def recover_fault(self):
         print("== Fault Recovery ==")
+        # The webhook deletes are independent API calls; the restart below must
+        # only start once every webhook is gone, so join them first.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [executor.submit(self._remove_active_webhook), executor.submit(self._remove_decoy_webhooks)]
+            for future in futures:
+                future.result()
+
+        # Nothing calls the backend any more, so tear it down while the target restarts.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [executor.submit(self._remove_webhook_backend), executor.submit(self._restart_target_deployment)]
+            for future in futures:
+                future.result()
+        print(f"Service: {self.faulty_service} | Namespace: {self.namespace}\n")
+
+    def _remove_active_webhook(self):
         try:
             self.admission_api.delete_mutating_webhook_configuration(name=self.WEBHOOK_NAME)
             print(f"Deleted MutatingWebhookConfiguration: {self.WEBHOOK_NAME}")
@@ -718,14 +741,14 @@ spec:
             else:
                 raise
 
-        self._remove_decoy_webhooks()
-
+    def _remove_webhook_backend(self):
         subprocess.run(
             ["kubectl", "delete", "namespace", self.BACKEND_SVC_NAMESPACE, "--ignore-not-found"],
             check=False,
             text=True,
         )
 
+    def _restart_target_deployment(self):
         self._run(
             [
                 "kubectl",
@@ -747,4 +770,3 @@ spec:
                 "--timeout=120s",
             ]
         )
-        print(f"Service: {self.faulty_service} | Namespace: {self.namespace}\n")
@@ -18,7 +18,7 @@ class NamespaceMemoryLimit(Problem):
 
     def __init__(self):
         super().__init__(app=HotelReservation())
-        self.kubectl = KubeCtl()
+        self.kubectl = KubeCtl.instance()
         self.faulty_service = "search"
         self.root_cause = self.build_structured_root_cause(
             component=f"resourcequota/{self.QUOTA_NAME}",
@@ -15,7 +15,7 @@ class NetworkPolicyBlock(Problem):
 
     def __init__(self, faulty_service="recommendation"):
         super().__init__(app=HotelReservation())
-        self.kubectl = KubeCtl()
+        self.kubectl = KubeCtl.instance()
         self.faulty_service = faulty_service
         self.policy_name = f"deny-all-{faulty_service}"
 
@@ -28,7 +28,7 @@ class NightlyRebalanceOOM(Problem):
             raise ValueError(f"Unsupported app name: {app_name}")
         self.app = HotelReservation()
         super().__init__(app=self.app, namespace=self.app.namespace)
-        self.kubectl = KubeCtl()
+        self.kubectl = KubeCtl.instance()
         self.namespace = self.app.namespace
         self.faulty_service = faulty_service
         self._target_container = None
@@ -68,7 +68,7 @@ class NodeClockDriftHotelReservation(Problem):
     def __init__(self):
         self.app = HotelReservation()
         super().__init__(app=self.app, namespace=self.app.namespace)
-        self.kubectl = KubeCtl()
+        self.kubectl = KubeCtl.instance()
         self.core_v1 = client.CoreV1Api()
         self.root_cause = self.build_structured_root_cause(
             component="node/system-clock",
@@ -270,31 +270,35 @@ class NodeClockDriftHotelReservation(Problem):
     def _wait_for_sidecar_rollout(self, timeout: int = 600) -> None:
         """Wait until a Running frontend pod exists with the tls-health-check sidecar
         fully ready, on a worker node.
+
+        Watches the frontend pods, so this returns on the event that makes the new pod
+        ready rather than on the next poll.
         """
-        deadline = time.monotonic() + timeout
-        while time.monotonic() < deadline:
-            try:
-                pods = self.core_v1.list_namespaced_pod(
-                    self.namespace, label_selector="io.kompose.service=frontend"
-                ).items
-            except Exception:
-                pods = self.core_v1.list_namespaced_pod(self.namespace).items
-            for pod in pods:
-                container_names = [c.name for c in pod.spec.containers]
-                if (
-                    pod.status.phase == "Running"
-                    and pod.spec.node_name
-                    and "tls-health-check" in container_names
-                    and pod.status.container_statuses
-                    and all(cs.ready for cs in pod.status.container_statuses)
-                    and not self._is_control_plane_node(pod.spec.node_name)
-                ):
-                    return
-            time.sleep(3)
-        raise RuntimeError(
-            f"Timed out after {timeout}s waiting for a Running frontend pod "
-            f"with the tls-health-check sidecar to appear on a worker node."
-        )
+        control_plane_nodes: dict[str, bool] = {}
+
+        def on_control_plane(node_name: str) -> bool:
+            if node_name not in control_plane_nodes:
+                control_plane_nodes[node_name] = self._is_control_plane_node(node_name)
+            return control_plane_nodes[node_name]
+
+        def sidecar_ready(pods) -> bool:
+            return any(
+                pod.status.phase == "Running"
+                and pod.spec.node_name
+                and "tls-health-check" in [c.name for c in pod.spec.containers]
+                and pod.status.container_statuses
+                and all(cs.ready for cs in pod.status.container_statuses)
+                and not on_control_plane(pod.spec.node_name)
+                for pod in pods.values()
+            )
+
+        if not self.kubectl.wait_for_pods_condition(
+            self.namespace, "io.kompose.service=frontend", sidecar_ready, timeout=timeout
+        ):
+            raise RuntimeError(
+                f"Timed out after {timeout}s waiting for a Running frontend pod "
+                f"with the tls-health-check sidecar to appear on a worker node."
+            )
 
     # ── Fault Injection ─────────────────────────────────────────────────────────
     @mark_fault_injected
@@ -419,24 +423,39 @@ class NodeClockDriftHotelReservation(Problem):
         try:
             self.core_v1.create_namespaced_pod(self.clock_injector_namespace, pod_spec)
             print(f"Created node probe pod: {pod_name}")
-            time.sleep(15)
+            if self._wait_for_probe_log_line(pod_name, "Clock drift injection complete") is None:
+                print(f"Warning: node probe {pod_name} did not report completion; continuing")
             # Parse the injector's own logs to find out which service(s) it
             # actually stopped, so recover_fault restores exactly those.
             self.stopped_services = []
             try:
-                logs = self.core_v1.read_namespaced_pod_log(pod_name, self.clock_injector_namespace)
-                for line in logs.splitlines():
-                    if line.startswith("DISCOVERED_SERVICES:"):
-                        services_str = line.split(":", 1)[1].strip()
-                        if services_str:
-                            self.stopped_services = services_str.split()
-                        break
+                # The probe stays alive after injecting, so stop reading its log at the marker line.
+                line = self.kubectl.find_pod_log_line(pod_name, self.clock_injector_namespace, "DISCOVERED_SERVICES:")
+                if line:
+                    self.stopped_services = line.split(":", 1)[1].split()
             except ApiException as e:
                 print(f"Warning: could not read injector logs to determine stopped services: {e}")
         except ApiException as e:
             print(f"Failed to create node probe pod: {e}")
             raise
 
+    def _wait_for_probe_log_line(self, pod_name: str, prefix: str, timeout: int = 60) -> str | None:
+        """Poll the probe pod's log until a line starting with `prefix` appears.
+
+        Returns the line as soon as it is logged, or None after `timeout` seconds.
+        """
+        deadline = time.monotonic() + timeout
+        while True:
+            try:
+                line = self.kubectl.find_pod_log_line(pod_name, self.clock_injector_namespace, prefix)
+                if line:
+                    return line
+            except ApiException:
+                pass  # the container has not started yet, so there is no log to read
+            if time.monotonic() >= deadline:
+                return None
+            time.sleep(1)
+
     def _restore_node_clock(self, node: str) -> None:
         """Step the node's clock back to cluster time and restore the time-sync service.
 
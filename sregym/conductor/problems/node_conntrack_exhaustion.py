@@ -27,7 +27,7 @@ class NodeConntrackExhaustionHotelReservation(Problem):
 
     def __init__(self):
         super().__init__(app=HotelReservation())
-        self.kubectl = KubeCtl()
+        self.kubectl = KubeCtl.instance()
         self.apps_v1 = client.AppsV1Api()
         self.core_v1 = client.CoreV1Api()
         self.victim_node = self.gateway_node = None
@@ -15,7 +15,7 @@ class K8SOperatorInvalidAffinityTolerationFault(Problem):
     def __init__(self, faulty_service="tidb-app"):
         super().__init__(app=FleetCast(), namespace="tidb-cluster")
         self.faulty_service = faulty_service
-        self.kubectl = KubeCtl()
+        self.kubectl = KubeCtl.instance()
         self.root_cause = self.build_structured_root_cause(
             component="customresource/tidbcluster/basic",
             namespace="tidb-cluster",
@@ -24,7 +24,6 @@ class K8SOperatorInvalidAffinityTolerationFault(Problem):
                 "satisfied and TiDB pods remain Pending with unschedulable events."
             ),
         )
-        self.app.create_workload()
         self.diagnosis_oracle = LLMAsAJudgeOracle(problem=self, expected=self.root_cause)
 
         self.mitigation_oracle = InvalidAffinityMitigationOracle(problem=self, deployment_name="basic")
@@ -17,7 +17,7 @@ class K8SOperatorNonExistentStorageFault(Problem):
     def __init__(self, faulty_service="tidb-app"):
         super().__init__(app=FleetCast(), namespace="tidb-cluster")
         self.faulty_service = faulty_service
-        self.kubectl = KubeCtl()
+        self.kubectl = KubeCtl.instance()
         self.problem_id = "operator_non_existent_storage"
         self.root_cause = self.build_structured_root_cause(
             component="customresource/tidbcluster/basic",
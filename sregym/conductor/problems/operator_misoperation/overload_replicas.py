@@ -18,7 +18,7 @@ class K8SOperatorOverloadReplicasFault(Problem):
     def __init__(self, faulty_service="tidb-app"):
         super().__init__(app=FleetCast(), namespace="tidb-cluster")
         self.faulty_service = faulty_service
-        self.kubectl = KubeCtl()
+        self.kubectl = KubeCtl.instance()
         self.root_cause = self.build_structured_root_cause(
             component="customresource/tidbcluster/basic",
             namespace="tidb-cluster",
@@ -27,7 +27,6 @@ class K8SOperatorOverloadReplicasFault(Problem):
                 "reconciliation so only a tiny subset of pods ever becomes ready."
             ),
         )
-        self.app.create_workload()
         self.diagnosis_oracle = LLMAsAJudgeOracle(problem=self, expected=self.root_cause)
         self.mitigation_oracle = OverloadReplicasMitigationOracle(problem=self, deployment_name="basic")
 
@@ -15,7 +15,7 @@ class K8SOperatorSecurityContextFault(Problem):
     def __init__(self, faulty_service="tidb-app"):
         super().__init__(app=FleetCast(), namespace="tidb-cluster")
         self.faulty_service = faulty_service
-        self.kubectl = KubeCtl()
+        self.kubectl = KubeCtl.instance()
         self.root_cause = self.build_structured_root_cause(
             component="customresource/tidbcluster/basic",
             namespace="tidb-cluster",
@@ -26,7 +26,6 @@ class K8SOperatorSecurityContextFault(Problem):
         )
         self.diagnosis_oracle = LLMAsAJudgeOracle(problem=self, expected=self.root_cause)
         self.mitigation_oracle = SecurityContextMitigationOracle(problem=self, deployment_name="basic")
-        self.app.create_workload()
 
     @mark_fault_injected
     def inject_fault(self):
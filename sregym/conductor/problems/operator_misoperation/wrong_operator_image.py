@@ -15,7 +15,7 @@ class K8SOperatorWrongOperatorImage(Problem):
     def __init__(self, faulty_service="tidb-app"):
         super().__init__(app=FleetCast(), namespace="tidb-cluster")
         self.faulty_service = faulty_service
-        self.kubectl = KubeCtl()
+        self.kubectl = KubeCtl.instance()
         self.root_cause = self.build_structured_root_cause(
             component="deployment/tidb-operator-controller-manager",
             namespace="tidb-operator",
@@ -24,7 +24,6 @@ class K8SOperatorWrongOperatorImage(Problem):
                 "managed TiDB resources in unhealthy or stale states."
             ),
         )
-        self.app.create_workload()
 
         # ============ Attach Evaluation Oracles ============
         self.diagnosis_oracle = LLMAsAJudgeOracle(problem=self, expected=self.root_cause)
@@ -10,7 +10,7 @@ from sregym.utils.decorators import mark_fault_injected
 class PersistentVolumeAffinityViolation(Problem):
     def __init__(self, faulty_service: str = "user-service"):
         super().__init__(app=SocialNetwork())
-        self.kubectl = KubeCtl()
+        self.kubectl = KubeCtl.instance()
         self.faulty_service = faulty_service
         self.root_cause = self.build_structured_root_cause(
             component=self.faulty_service,
@@ -1,7 +1,5 @@
 """Pod Anti-Affinity Deadlock problem for microservice applications."""
 
-import time
-
 from sregym.conductor.oracles.llm_as_a_judge.llm_as_a_judge_oracle import LLMAsAJudgeOracle
 from sregym.conductor.oracles.mitigation import MitigationOracle
 from sregym.conductor.problems.base import Problem
@@ -14,7 +12,7 @@ from sregym.utils.decorators import mark_fault_injected
 class PodAntiAffinityDeadlock(Problem):
     def __init__(self, faulty_service: str = "user-service"):
         super().__init__(app=SocialNetwork())
-        self.kubectl = KubeCtl()
+        self.kubectl = KubeCtl.instance()
         self.faulty_service = faulty_service
         self.root_cause = self.build_structured_root_cause(
             component=self.faulty_service,
@@ -36,9 +34,11 @@ class PodAntiAffinityDeadlock(Problem):
 
     @mark_fault_injected
     def inject_fault(self):
-        print("== Fault Injection ==")
-        print("Creating Pod Anti-Affinity Deadlock...")
-        print("Setting requiredDuringScheduling anti-affinity that excludes all nodes")
+        print(
+            "== Fault Injection ==\n"
+            "Creating Pod Anti-Affinity Deadlock...\n"
+            "Setting requiredDuringScheduling anti-affinity that excludes all nodes"
+        )
 
         injector = VirtualizationFaultInjector(namespace=self.namespace)
         injector._inject(
@@ -46,18 +46,23 @@ class PodAntiAffinityDeadlock(Problem):
             microservices=[self.faulty_service],
         )
 
-        # Wait for the deadlock to manifest
-        time.sleep(30)
+        # Wait for the deadlock to manifest: the scheduler reports the new pods as Unschedulable
+        selector = self.kubectl.get_deployment_label_selector(self.faulty_service, self.namespace)
+        self.kubectl.wait_for_pods_unschedulable(self.namespace, selector, timeout=30)
 
-        print("Expected effect: Pods should be in Pending state with:")
-        print("  '0/X nodes are available: X node(s) didn't match pod anti-affinity rules'")
-        print(f"Service: {self.faulty_service} | Namespace: {self.namespace}\n")
+        print(
+            "Expected effect: Pods should be in Pending state with:\n"
+            "  '0/X nodes are available: X node(s) didn't match pod anti-affinity rules'\n"
+            f"Service: {self.faulty_service} | Namespace: {self.namespace}\n"
+        )
 
     @mark_fault_injected
     def recover_fault(self):
-        print("== Fault Recovery ==")
-        print("Removing pod anti-affinity deadlock...")
-        print("Changing requiredDuring to preferredDuring or removing anti-affinity rules")
+        print(
+            "== Fault Recovery ==\n"
+            "Removing pod anti-affinity deadlock...\n"
+            "Changing requiredDuring to preferredDuring or removing anti-affinity rules"
+        )
 
         injector = VirtualizationFaultInjector(namespace=self.namespace)
         injector._recover(
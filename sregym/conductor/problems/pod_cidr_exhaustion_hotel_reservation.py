@@ -38,7 +38,7 @@ class PodCIDRExhaustionHotelReservation(Problem):
         self.faulty_service = faulty_service
         self.app = HotelReservation()
         self.namespace = self.app.namespace
-        self.kubectl = KubeCtl()
+        self.kubectl = KubeCtl.instance()
         super().__init__(app=self.app, namespace=self.namespace)
 
         self.root_cause = self.build_structured_root_cause(
@@ -1,7 +1,10 @@
 import logging
 import os
+import shlex
 import time
 
+from kubernetes.client.rest import ApiException
+
 from sregym.conductor.oracles.llm_as_a_judge.llm_as_a_judge_oracle import LLMAsAJudgeOracle
 from sregym.conductor.oracles.postgres_lock_mitigation import PostgresLockMitigationOracle
 from sregym.conductor.problems.base import Problem
@@ -44,10 +47,19 @@ class PostgresLockContentionProductCatalog(Problem):
     HOLDER_JOB = "catalog-maintenance"
     HOLDER_SELECTOR = "app=catalog-maintenance"
 
+    TERMINATE_LOCK_HOLDER_SQL = (
+        "SELECT pg_terminate_backend(l.pid) "
+        "FROM pg_locks l "
+        "JOIN pg_class c ON l.relation = c.oid "
+        "JOIN pg_namespace n ON c.relnamespace = n.oid "
+        "WHERE n.nspname = 'catalog' AND c.relname = 'products' "
+        "AND l.mode = 'AccessExclusiveLock' AND l.pid <> pg_backend_pid();"
+    )
+
     def __init__(self):
         super().__init__(app=AstronomyShop())
 
-        self.kubectl = KubeCtl()
+        self.kubectl = KubeCtl.instance()
         self.problem_id = "postgres_lock_contention_product_catalog"
         self.faulty_service = ["product-catalog"]
         self.manifest_path = os.path.join(os.path.dirname(__file__), "manifests", "pg_lock_holder.yaml")
@@ -103,9 +115,8 @@ class PostgresLockContentionProductCatalog(Problem):
         # Always remove the lock-holder from khaos first (khaos persists across
         # runs, so a leftover holder would re-block the next run).
         self.kubectl.delete_configs(self.HOLDER_NAMESPACE, self.manifest_path)
-        self.kubectl.exec_command(
-            f"kubectl delete pod -n {self.HOLDER_NAMESPACE} "
-            f"-l {self.HOLDER_SELECTOR} --force --grace-period=0 --ignore-not-found"
+        self.kubectl.core_v1_api.delete_collection_namespaced_pod(
+            self.HOLDER_NAMESPACE, label_selector=self.HOLDER_SELECTOR, grace_period_seconds=0
         )
 
         # If the app namespace is already gone (e.g. an upstream deploy failure
@@ -119,9 +130,9 @@ class PostgresLockContentionProductCatalog(Problem):
 
         # Actively terminate that backend: the same action an SRE/agent
         # takes (pg_terminate_backend), retrying until reads succeed again.
+        # Each attempt terminates and re-reads in one psql session, so it costs a single exec.
         def released() -> bool:
-            self._terminate_lock_holder_backend()
-            return self._catalog_read_status() == "ok"
+            return self._catalog_read_status(terminate_lock_holder=True) == "ok"
 
         self._wait_until(released, timeout=120)
 
@@ -134,47 +145,27 @@ class PostgresLockContentionProductCatalog(Problem):
         logger.info("Postgres lock-contention fault recovered.")
         return True
 
-    def _terminate_lock_holder_backend(self) -> None:
-        """
-        Terminate any backend holding an ACCESS EXCLUSIVE lock on
-        catalog.products, which releases the lock immediately.
-        """
-        sql = (
-            "SELECT pg_terminate_backend(l.pid) "
-            "FROM pg_locks l "
-            "JOIN pg_class c ON l.relation = c.oid "
-            "JOIN pg_namespace n ON c.relnamespace = n.oid "
-            "WHERE n.nspname = 'catalog' AND c.relname = 'products' "
-            "AND l.mode = 'AccessExclusiveLock' AND l.pid <> pg_backend_pid();"
-        )
-        cmd = (
-            f"kubectl exec -n {self.namespace} deploy/{self.POSTGRES_DEPLOY} -- "
-            f'env PGPASSWORD=otel psql -U root -d otel -c "{sql}"'
-        )
-        self.kubectl.exec_command(cmd)
-
     def _set_postgres_memory(self, memory: str) -> None:
         """Patch the postgres container's memory limit (index-based JSON patch)."""
-        patch = (
-            f"kubectl -n {self.namespace} patch deploy {self.POSTGRES_DEPLOY} --type=json "
-            f'-p=\'[{{"op":"replace",'
-            f'"path":"/spec/template/spec/containers/0/resources/limits/memory",'
-            f'"value":"{memory}"}}]\''
-        )
-        self.kubectl.exec_command_checked(patch, timeout=30)
+        # A list body is sent as a JSON patch.
+        patch = [{"op": "replace", "path": "/spec/template/spec/containers/0/resources/limits/memory", "value": memory}]
+        self.kubectl.patch_deployment(self.POSTGRES_DEPLOY, self.namespace, patch)
 
     def _namespace_exists(self) -> bool:
         """True if the problem's app namespace currently exists."""
-        out = self.kubectl.exec_command(f"kubectl get namespace {self.namespace} --no-headers --ignore-not-found")
-        return self.namespace in out
+        try:
+            self.kubectl.core_v1_api.read_namespace(self.namespace)
+        except ApiException as e:
+            if e.status == 404:
+                return False
+            raise
+        return True
 
     def _ensure_holder_namespace(self) -> None:
         """Create the hidden khaos namespace if absent (idempotent)."""
-        self.kubectl.exec_command(
-            f"kubectl get ns {self.HOLDER_NAMESPACE} >/dev/null 2>&1 || kubectl create ns {self.HOLDER_NAMESPACE}"
-        )
+        self.kubectl.create_namespace_if_not_exist(self.HOLDER_NAMESPACE)
 
-    def _catalog_read_status(self) -> str:
+    def _catalog_read_status(self, terminate_lock_holder: bool = False) -> str:
         """
         Probe whether catalog.products is readable:
 
@@ -182,16 +173,24 @@ class PostgresLockContentionProductCatalog(Problem):
         when psql exits 0, so a failing query (lock timeout, missing table,
         connection error) can never be mistaken for success by matching text.
 
+        With `terminate_lock_holder`, the same psql session first terminates any
+        backend holding an ACCESS EXCLUSIVE lock on catalog.products, which
+        releases the lock for the read that follows.
+
         Returns one of:
             "ok"     - the table was read (no conflicting lock held)
             "locked" - the read was blocked by a lock (lock_timeout fired)
             "other"  - some other failure (postgres restarting, table missing, ...)
         """
+        statements = ["SET lock_timeout = 3000;", "SELECT 1 FROM catalog.products LIMIT 1;"]
+        if terminate_lock_holder:
+            statements.insert(0, self.TERMINATE_LOCK_HOLDER_SQL)
+        psql = "env PGPASSWORD=otel psql -U root -d otel -v ON_ERROR_STOP=1 -t -A " + " ".join(
+            f"-c {shlex.quote(statement)}" for statement in statements
+        )
         cmd = (
             f"kubectl exec -n {self.namespace} deploy/{self.POSTGRES_DEPLOY} -- "
-            'sh -c "env PGPASSWORD=otel psql -U root -d otel -v ON_ERROR_STOP=1 -t -A '
-            "-c 'SET lock_timeout = 3000;' "
-            "-c 'SELECT 1 FROM catalog.products LIMIT 1;' && echo READ_OK\""
+            f"sh -c {shlex.quote(psql + ' && echo READ_OK')}"
         )
         out = self.kubectl.exec_command(cmd)
         if "READ_OK" in out:
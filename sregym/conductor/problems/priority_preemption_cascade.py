@@ -55,7 +55,7 @@ class PriorityPreemptionCascadeHotelReservation(Problem):
     def __init__(self, faulty_service: str = "reservation"):
         super().__init__(app=HotelReservation())
         self.faulty_service = faulty_service
-        self.kubectl = KubeCtl()
+        self.kubectl = KubeCtl.instance()
         self.apps_v1 = client.AppsV1Api()
         self.core_v1 = client.CoreV1Api()
         self.scheduling_v1 = client.SchedulingV1Api()
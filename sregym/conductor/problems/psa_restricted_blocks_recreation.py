@@ -65,7 +65,7 @@ class PSARestrictedBlocksRecreation(Problem):
         self.app = self.APPS[app_name]()
         super().__init__(app=self.app, namespace=self.app.namespace)
 
-        self.kubectl = KubeCtl()
+        self.kubectl = KubeCtl.instance()
         self.core_api = client.CoreV1Api()
         # Remembers the namespace's PSA label values before injection so recovery
         # restores the exact original state (rather than blindly deleting labels).
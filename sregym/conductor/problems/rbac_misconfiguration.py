@@ -10,7 +10,7 @@ from sregym.utils.decorators import mark_fault_injected
 class RBACMisconfiguration(Problem):
     def __init__(self, faulty_service: str = "frontend"):
         super().__init__(app=AstronomyShop())
-        self.kubectl = KubeCtl()
+        self.kubectl = KubeCtl.instance()
         self.faulty_service = faulty_service
 
         self.root_cause = self.build_structured_root_cause(
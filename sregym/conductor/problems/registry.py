@@ -1,9 +1,5 @@
 # ruff: noqa: I001
 
-from pathlib import Path
-
-import yaml
-
 from sregym.conductor.problems.ad_service_failure import AdServiceFailure
 from sregym.conductor.problems.ad_service_high_cpu import AdServiceHighCpu
 from sregym.conductor.problems.ad_service_manual_gc import AdServiceManualGc
@@ -115,6 +111,7 @@ from sregym.conductor.problems.workload_imbalance import WorkloadImbalance
 from sregym.conductor.problems.wrong_bin_usage import WrongBinUsage
 from sregym.conductor.problems.wrong_dns_policy import WrongDNSPolicy
 from sregym.conductor.problems.wrong_service_selector import WrongServiceSelector
+from sregym.conductor.utils import load_tasklist
 from sregym.service.kubectl import KubeCtl
 
 
@@ -355,7 +352,7 @@ class ProblemRegistry:
             "operator_wrong_operator_image": K8SOperatorWrongOperatorImage,
         }
 # fmt: on
-        self.kubectl = KubeCtl()
+        self.kubectl = KubeCtl.instance()
         self.non_emulated_cluster_problems = ["node_clock_drift_hotel_reservation"]
 
     def get_problem_instance(self, problem_id: str):
@@ -378,15 +375,12 @@ class ProblemRegistry:
             return list(self.PROBLEM_REGISTRY)
 
         # by default, only run problems defined in tasklist.yml
-        file_dir = Path(__file__).parent.parent
-        tasklist_path = file_dir / "tasklist.yml"
+        tasklist = load_tasklist()
 
-        if not tasklist_path.exists():
+        if tasklist is None:
             # if tasklist.yml does not exist, run all the problems
             return list(self.PROBLEM_REGISTRY)
 
-        with open(tasklist_path) as f:
-            tasklist = yaml.safe_load(f)
         return list(tasklist["all"]["problems"])
 
 
@@ -27,7 +27,7 @@ class ResourceRequest(Problem):
             raise ValueError(f"Unsupported app_name: {app_name}")
 
         super().__init__(app=app)
-        self.kubectl = KubeCtl()
+        self.kubectl = KubeCtl.instance()
         # Note: root_cause will be set in subclasses (ResourceRequestTooLarge/ResourceRequestTooSmall)
         # diagnosis_oracle will be set in subclasses after root_cause is set
         self.app.create_workload()
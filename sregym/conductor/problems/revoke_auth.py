@@ -15,7 +15,7 @@ class MongoDBRevokeAuth(Problem):
 
     def __init__(self, faulty_service: str = "mongodb-geo"):
         super().__init__(app=HotelReservation(mount_failure_scripts=False))
-        self.kubectl = KubeCtl()
+        self.kubectl = KubeCtl.instance()
         self.faulty_service = faulty_service
         self.root_cause = self.build_structured_root_cause(
             component=f"service/{self.faulty_service}-db",
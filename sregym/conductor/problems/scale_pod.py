@@ -1,7 +1,5 @@
 """Scale pod replica to zero problem for the SocialNetwork application."""
 
-import time
-
 from sregym.conductor.oracles.llm_as_a_judge.llm_as_a_judge_oracle import LLMAsAJudgeOracle
 from sregym.conductor.oracles.scale_pod_zero_mitigation import ScalePodZeroMitigationOracle
 from sregym.conductor.problems.base import Problem
@@ -14,7 +12,7 @@ from sregym.utils.decorators import mark_fault_injected
 class ScalePodSocialNet(Problem):
     def __init__(self):
         super().__init__(app=SocialNetwork())
-        self.kubectl = KubeCtl()
+        self.kubectl = KubeCtl.instance()
         # self.faulty_service = "url-shorten-mongodb"
         self.faulty_service = "user-service"
         # Choose a very front service to test - this will directly cause an exception
@@ -42,8 +40,9 @@ class ScalePodSocialNet(Problem):
             fault_type="scale_pods_to_zero",
             microservices=[self.faulty_service],
         )
-        # Terminating the pod may take long time when scaling
-        time.sleep(30)
+        # Terminating the pod may take long time when scaling; watch until the last pod is gone
+        selector = self.kubectl.get_deployment_label_selector(self.faulty_service, self.namespace)
+        self.kubectl.wait_for_pods_deleted(self.namespace, selector, timeout=60)
         print(f"Service: {self.faulty_service} | Namespace: {self.namespace}\n")
 
     @mark_fault_injected
@@ -58,7 +58,7 @@ class SearchRateRetryCollapse(Problem):
                 deployment_env_overrides=self._vulnerable_deployment_env(),
             )
         )
-        self.kubectl = KubeCtl()
+        self.kubectl = KubeCtl.instance()
         self.workload = HotelSearchWorkload(self.namespace, base_rate=self.base_rate)
         self._injection_attempted = False
         self.root_cause = self.build_structured_root_cause(
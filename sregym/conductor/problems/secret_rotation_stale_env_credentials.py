@@ -30,7 +30,7 @@ class SecretRotationStaleEnvCredentialsAstronomyShop(Problem):
         self.app = AstronomyShop()
         self.namespace = self.app.namespace
         super().__init__(app=self.app, namespace=self.namespace)
-        self.kubectl = KubeCtl()
+        self.kubectl = KubeCtl.instance()
 
         self.faulty_service = "product-catalog"
         self.backend_service = "postgresql"
@@ -75,6 +75,14 @@ class SecretRotationStaleEnvCredentialsAstronomyShop(Problem):
         logger.debug("[secret-rotation] %s", command)
         return self.kubectl.exec_command(command, input_data=input_data)
 
+    def _run_checked(self, command: str, failure: str) -> str:
+        """Run a kubectl command and raise ``RuntimeError(failure)`` if it exits non-zero."""
+        logger.debug("[secret-rotation] %s", command)
+        try:
+            return self.kubectl.exec_command_checked(command)
+        except RuntimeError as e:
+            raise RuntimeError(f"{failure}: {e}") from e
+
     def _apply_secret(self, conn_string: str) -> None:
         """Create or update the DB connection Secret with the given connection string."""
         literal = shlex.quote(f"{self.secret_key}={conn_string}")
@@ -88,32 +96,29 @@ class SecretRotationStaleEnvCredentialsAstronomyShop(Problem):
 
     def _set_product_catalog_secret_env(self) -> None:
         """Make product-catalog read DB_CONNECTION_STRING from the Secret."""
-        output = self._run(
+        self._run_checked(
             f"kubectl set env deployment/{self.faulty_service} -n {self.namespace} "
-            f"--containers={self.faulty_service} --from=secret/{self.secret_name} --keys={self.secret_key}"
+            f"--containers={self.faulty_service} --from=secret/{self.secret_name} --keys={self.secret_key}",
+            f"Failed to set {self.secret_key} from Secret",
         )
-        if "error" in output.lower() or "invalid" in output.lower():
-            raise RuntimeError(f"Failed to set {self.secret_key} from Secret: {output}")
 
     def _set_product_catalog_literal_env(self, conn_string: str) -> None:
         """Make product-catalog use a literal DB_CONNECTION_STRING value (used for reset)."""
-        output = self._run(
+        self._run_checked(
             f"kubectl set env deployment/{self.faulty_service} -n {self.namespace} "
-            f"--containers={self.faulty_service} {self.secret_key}={shlex.quote(conn_string)}"
+            f"--containers={self.faulty_service} {self.secret_key}={shlex.quote(conn_string)}",
+            f"Failed to set literal {self.secret_key}",
         )
-        if "error" in output.lower() or "invalid" in output.lower():
-            raise RuntimeError(f"Failed to set literal {self.secret_key}: {output}")
 
     def _set_literal_db_clients_password(self, password: str) -> None:
         """Update non-faulty pods' credentials so only product-catalog keeps wrong credentials."""
         conn_index = 0 if password == self.old_password else 1
         for deployment, conn_strings in self.literal_db_clients.items():
-            output = self._run(
+            self._run_checked(
                 f"kubectl set env deployment/{deployment} -n {self.namespace} "
-                f"--containers={deployment} {self.secret_key}={shlex.quote(conn_strings[conn_index])}"
+                f"--containers={deployment} {self.secret_key}={shlex.quote(conn_strings[conn_index])}",
+                f"Failed to set literal {self.secret_key} for {deployment}",
             )
-            if "error" in output.lower() or "invalid" in output.lower():
-                raise RuntimeError(f"Failed to set literal {self.secret_key} for {deployment}: {output}")
             self._run(f"kubectl rollout status deployment/{deployment} -n {self.namespace} --timeout=180s")
 
     def _rollout_restart(self, deployment: str, timeout: str = "180s") -> None:
@@ -213,12 +218,11 @@ class SecretRotationStaleEnvCredentialsAstronomyShop(Problem):
 
         updated_sql = init_sql.replace(from_line, to_line)
         patch = json.dumps({"data": {self.postgresql_init_key: updated_sql}})
-        output = self._run(
+        self._run_checked(
             f"kubectl patch configmap {self.postgresql_init_configmap} -n {self.namespace} "
-            f"--type=merge -p {shlex.quote(patch)}"
+            f"--type=merge -p {shlex.quote(patch)}",
+            f"Failed to patch {self.postgresql_init_configmap}",
         )
-        if "error" in output.lower() or "invalid" in output.lower():
-            raise RuntimeError(f"Failed to patch {self.postgresql_init_configmap}: {output}")
 
     def _get_product_catalog_pod(self):
         """Return the current product-catalog pod object, preferring a running pod."""
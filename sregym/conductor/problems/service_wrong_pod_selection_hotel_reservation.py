@@ -21,7 +21,7 @@ class ServiceWrongPodSelectionHotelReservation(Problem):
         self.expected_endpoint_pod_label = "frontend"
 
         super().__init__(app=HotelReservation())
-        self.kubectl = KubeCtl()
+        self.kubectl = KubeCtl.instance()
         self.root_cause = self.build_structured_root_cause(
             component=f"service/{self.frontend_service}",
             namespace=self.namespace,
@@ -1,4 +1,5 @@
 import json
+import random
 from enum import StrEnum
 
 from sregym.conductor.oracles.alert_oracle import AlertOracle
@@ -27,7 +28,7 @@ class SilentDataCorruption(Problem):
         up_interval: int = 0,  # Seconds device is healthy
         down_interval: int = 1,  # Seconds device corrupts data
     ):
-        self.kubectl = KubeCtl()
+        self.kubectl = KubeCtl.instance()
         self.namespace = namespace
         self.deploy = target_deploy
         self.injector = KernelInjector(self.kubectl)
@@ -206,8 +207,6 @@ class SilentDataCorruption(Problem):
         )
 
         print("[SDC] Triggering MongoDB write and read to exercise corruption...")
-        import random
-
         for _ in range(10):
             test_id = "SDC_TRIGGER_" + str(random.randint(0, 10000))
             lat = 30 + random.randint(0, 10000) * 0.0001
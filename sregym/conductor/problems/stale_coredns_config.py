@@ -25,7 +25,7 @@ class StaleCoreDNSConfig(Problem):
 
         super().__init__(app=app)
 
-        self.kubectl = KubeCtl()
+        self.kubectl = KubeCtl.instance()
         self.root_cause = self.build_structured_root_cause(
             component="configmap/coredns",
             namespace="kube-system",
@@ -15,7 +15,7 @@ class MongoDBUserUnregistered(Problem):
 
     def __init__(self, faulty_service: str = "mongodb-geo"):
         super().__init__(app=HotelReservation(mount_failure_scripts=False))
-        self.kubectl = KubeCtl()
+        self.kubectl = KubeCtl.instance()
         self.faulty_service = faulty_service
         # NOTE: change the faulty service to mongodb-rate to create another scenario
         # self.faulty_service = "mongodb-rate"
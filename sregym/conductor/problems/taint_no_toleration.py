@@ -9,7 +9,7 @@ from sregym.utils.decorators import mark_fault_injected
 
 class TaintNoToleration(Problem):
     def __init__(self):
-        self.kubectl = KubeCtl()
+        self.kubectl = KubeCtl.instance()
         super().__init__(app=SocialNetwork())
 
         # ── pick all nodes so the control-plane cannot be used as fallback ──
@@ -13,7 +13,7 @@ class K8STargetPortMisconfig(Problem):
     def __init__(self, faulty_service="user-service"):
         super().__init__(app=SocialNetwork())
         self.faulty_service = faulty_service
-        self.kubectl = KubeCtl()
+        self.kubectl = KubeCtl.instance()
         self.root_cause = self.build_structured_root_cause(
             component=f"service/{self.faulty_service}",
             namespace=self.namespace,
@@ -10,7 +10,7 @@ from sregym.utils.decorators import mark_fault_injected
 class TopOfRackRouterPartitionHotelReservation(Problem):
     def __init__(self, faulty_service: str = "network-connectivity"):
         super().__init__(app=HotelReservation())
-        self.kubectl = KubeCtl()
+        self.kubectl = KubeCtl.instance()
         self.faulty_service = faulty_service
         self.fault_type = "tor_network_partition"
         self.root_cause = self.build_structured_root_cause(
@@ -32,14 +32,16 @@ class TopOfRackRouterPartitionHotelReservation(Problem):
 
         self.faulty_microservices: list[str] = []
 
+    def _find_faulty_microservices(self) -> list[str]:
+        """Names of the deployments in the faulty group, listed through the API client rather than kubectl."""
+        deployments = self.kubectl.list_deployments(self.namespace).items
+        return [d.metadata.name for d in deployments if self.faulty_service in d.metadata.name]
+
     @mark_fault_injected
     def inject_fault(self):
         print("== Fault Injection ==")
 
-        deps = self.kubectl.exec_command(
-            f"kubectl get deploy -n {self.namespace} -o jsonpath='{{.items[*].metadata.name}}'"
-        ).split()
-        self.faulty_microservices = [d for d in deps if self.faulty_service in d]
+        self.faulty_microservices = self._find_faulty_microservices()
 
         if not self.faulty_microservices:
             raise RuntimeError(
@@ -59,10 +61,7 @@ class TopOfRackRouterPartitionHotelReservation(Problem):
         print("== Fault Recovery ==")
 
         if not self.faulty_microservices:
-            deps = self.kubectl.exec_command(
-                f"kubectl get deploy -n {self.namespace} -o jsonpath='{{.items[*].metadata.name}}'"
-            ).split()
-            self.faulty_microservices = [d for d in deps if self.faulty_service in d]
+            self.faulty_microservices = self._find_faulty_microservices()
 
         injector = VirtualizationFaultInjector(namespace=self.namespace)
         injector._recover(fault_type=self.fault_type, microservices=self.faulty_microservices or ["_unused_"])
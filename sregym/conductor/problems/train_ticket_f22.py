@@ -26,7 +26,7 @@ class TrainTicketF22(Problem):
                 "fail at execution time and related API operations return errors."
             ),
         )
-        self.kubectl = KubeCtl()
+        self.kubectl = KubeCtl.instance()
         self.diagnosis_oracle = LLMAsAJudgeOracle(problem=self, expected=self.root_cause)
         self.mitigation_oracle = AlertOracle(problem=self)
 
@@ -27,7 +27,7 @@ class TrainTicketF17(Problem):
             ),
         )
 
-        self.kubectl = KubeCtl()
+        self.kubectl = KubeCtl.instance()
         self.diagnosis_oracle = LLMAsAJudgeOracle(problem=self, expected=self.root_cause)
 
         self.app.create_workload()
@@ -9,7 +9,7 @@ from sregym.utils.decorators import mark_fault_injected
 
 class UpdateIncompatibleCorrelated(Problem):
     def __init__(self):
-        self.kubectl = KubeCtl()
+        self.kubectl = KubeCtl.instance()
         self.faulty_service = [
             "mongodb-geo",
             "mongodb-profile",
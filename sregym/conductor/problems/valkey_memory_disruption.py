@@ -11,7 +11,7 @@ class ValkeyMemoryDisruption(Problem):
     def __init__(self):
         super().__init__(app=AstronomyShop())
         self.faulty_service = "valkey-cart"
-        self.kubectl = KubeCtl()
+        self.kubectl = KubeCtl.instance()
         self.root_cause = self.build_structured_root_cause(
             component=f"service/{self.faulty_service}",
             namespace=self.namespace,
@@ -11,7 +11,7 @@ from sregym.utils.decorators import mark_fault_injected
 
 class WorkloadImbalance(Problem):
     def __init__(self):
-        self.kubectl = KubeCtl()
+        self.kubectl = KubeCtl.instance()
         super().__init__(app=AstronomyShop())
         self.faulty_service = ["frontend"]
         self.injector = VirtualizationFaultInjector(namespace="kube-system")
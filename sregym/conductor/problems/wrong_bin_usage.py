@@ -13,7 +13,7 @@ from sregym.utils.decorators import mark_fault_injected
 class WrongBinUsage(Problem):
     def __init__(self, faulty_service: str = "profile"):
         super().__init__(app=HotelReservation())
-        self.kubectl = KubeCtl()
+        self.kubectl = KubeCtl.instance()
         self.faulty_service = faulty_service
         self.root_cause = self.build_structured_root_cause(
             component=f"deployment/{self.faulty_service}",
@@ -24,7 +24,7 @@ class WrongServiceSelector(Problem):
             raise ValueError(f"Unsupported app name: {app_name}")
         self.expected_service_port = 9090 if app_name == "social_network" else app.frontend_port
         super().__init__(app=app)
-        self.kubectl = KubeCtl()
+        self.kubectl = KubeCtl.instance()
         self.root_cause = self.build_structured_root_cause(
             component=self.faulty_service,
             namespace=self.namespace,
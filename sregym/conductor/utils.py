@@ -1,4 +1,35 @@
+from functools import lru_cache
+from pathlib import Path
+
+import yaml
+
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
+TASKLIST_PATH = Path(__file__).resolve().parent / "tasklist.yml"
+
+
 def is_ordered_subset(A: list, B: list) -> bool:
     """Check if list A is a subset of B and in the same order."""
     it = iter(B)
     return all(a in it for a in A)
+
+
+def load_tasklist(path: Path = TASKLIST_PATH) -> dict | None:
+    """Return the parsed tasklist, ``{}`` if it is empty, or None if the file does not exist.
+
+    The file is parsed once per modification time and the result is shared, so callers must not mutate it.
+    """
+    try:
+        mtime_ns = path.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
+    return _parse_tasklist(path, mtime_ns)
+
+
+@lru_cache(maxsize=8)
+def _parse_tasklist(path: Path, mtime_ns: int) -> dict:
+    with open(path) as f:
+        return yaml.load(f, Loader=_YamlLoader) or {}
@@ -16,7 +16,7 @@ FEATURE_FLAG_EXPERIMENTAL_ROUTING_IMAGE = HOTEL_RESERVATION_APPLICATION_IMAGE
 class ApplicationFaultInjector(FaultInjector):
     def __init__(self, namespace: str):
         self.namespace = namespace
-        self.kubectl = KubeCtl()
+        self.kubectl = KubeCtl.instance()
         self.mongo_service_pod_map = {"mongodb-rate": "rate", "mongodb-geo": "geo"}
 
     def delete_service_pods(self, target_service_pods: list[str]):
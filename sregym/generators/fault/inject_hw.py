@@ -13,7 +13,7 @@ class HWFaultInjector(FaultInjector):
     """
 
     def __init__(self, khaos_namespace: str = "khaos", khaos_label: str = "app=khaos"):
-        self.kubectl = KubeCtl()
+        self.kubectl = KubeCtl.instance()
         self.khaos_ns = khaos_namespace
         self.khaos_daemonset_label = khaos_label
 
@@ -3,7 +3,6 @@
 import base64
 import json
 import logging
-import shlex
 import time
 
 from kubernetes import client
@@ -147,7 +146,6 @@ class KafkaBrokerClient:
     """Run bounded Kafka administration and data-plane inspection commands."""
 
     _BIN_DIR = "/opt/kafka/bin"
-    _SUCCESS_MARKER = "__STREAM_ADMIN_OK__"
     _BROKER_LABEL = "app.kubernetes.io/name"
     _BROKER_LABEL_VALUE = "kafka"
 
@@ -185,13 +183,11 @@ class KafkaBrokerClient:
         if not script.startswith("kafka-") or not script.endswith(".sh"):
             raise ValueError(f"unsupported Kafka command: {script}")
 
-        command = ["kubectl", "exec"]
+        command = ["exec"]
         if input_data is not None:
             command.append("-i")
         command.extend(
             [
-                "-n",
-                self.namespace,
                 self._broker_pod_name(),
                 "--",
                 "env",
@@ -201,12 +197,10 @@ class KafkaBrokerClient:
                 *args,
             ]
         )
-        shell_command = " ".join(shlex.quote(part) for part in command)
-        shell_command += f" && printf '\\n{self._SUCCESS_MARKER}\\n'"
-        output = self.kubectl.exec_command(shell_command, input_data=input_data)
-        if self._SUCCESS_MARKER not in output:
-            raise RuntimeError(f"Kafka command {script} failed: {output.strip()[-1000:]}")
-        return output.replace(self._SUCCESS_MARKER, "").strip()
+        result = self.kubectl.run(command, namespace=self.namespace, input_data=input_data)
+        if result.returncode != 0:
+            raise RuntimeError(f"Kafka command {script} failed: {(result.stdout + result.stderr).strip()[-1000:]}")
+        return result.stdout.strip()
 
     def delete_group(self, group: str) -> None:
         try:
@@ -353,25 +347,11 @@ print("STREAM_STATE=" + json.dumps(state, separators=(",", ":")))
 """
         encoded = base64.b64encode(probe.encode("utf-8")).decode("ascii")
         python = f"import base64;exec(base64.b64decode({encoded!r}))"
-        command = [
-            "kubectl",
-            "exec",
-            "-n",
-            self.namespace,
-            self._pipeline_pod_name(),
-            "--",
-            "python",
-            "-c",
-            python,
-            source_topic,
-            output_topic,
-            group,
-        ]
-        shell_command = " ".join(shlex.quote(part) for part in command)
-        shell_command += f" && printf '\\n{self._SUCCESS_MARKER}\\n'"
-        output = self.kubectl.exec_command(shell_command)
-        if self._SUCCESS_MARKER not in output:
-            raise RuntimeError(f"Kafka pipeline inspection failed: {output.strip()[-1000:]}")
+        command = ["exec", self._pipeline_pod_name(), "--", "python", "-c", python, source_topic, output_topic, group]
+        result = self.kubectl.run(command, namespace=self.namespace)
+        if result.returncode != 0:
+            raise RuntimeError(f"Kafka pipeline inspection failed: {(result.stdout + result.stderr).strip()[-1000:]}")
+        output = result.stdout
         for line in output.splitlines():
             if line.startswith("STREAM_STATE="):
                 state = json.loads(line.removeprefix("STREAM_STATE="))
@@ -401,7 +381,7 @@ class KafkaFaultInjector(FaultInjector):
 
     def __init__(self, namespace: str):
         self.namespace = namespace
-        self.kubectl = KubeCtl()
+        self.kubectl = KubeCtl.instance()
         self.broker = KafkaBrokerClient(self.kubectl, namespace)
         self.blocked_offset = self.INITIAL_RECORD_COUNT
 
@@ -456,33 +436,14 @@ class KafkaFaultInjector(FaultInjector):
             self.CONSUMER_DEPLOYMENT, self.namespace, {"spec": {"replicas": replicas}}
         )
 
-    def _pipeline_pods(self, names: set[str]):
-        return [
-            pod
-            for pod in self.kubectl.list_pods(self.namespace).items
-            if (pod.metadata.labels or {}).get("app") in names
-        ]
-
     def _wait_pipeline_pods_gone(self, timeout: int = 120) -> None:
-        names = {
-            self.PRODUCER_DEPLOYMENT,
-            self.CONSUMER_DEPLOYMENT,
-            self.LEGACY_ARCHIVER_DEPLOYMENT,
-        }
-        deadline = time.time() + timeout
-        while time.time() < deadline:
-            if not self._pipeline_pods(names):
-                return
-            time.sleep(3)
-        raise TimeoutError("previous Kafka pipeline pods did not terminate")
+        names = ", ".join((self.PRODUCER_DEPLOYMENT, self.CONSUMER_DEPLOYMENT, self.LEGACY_ARCHIVER_DEPLOYMENT))
+        if not self.kubectl.wait_for_pods_deleted(self.namespace, f"app in ({names})", timeout=timeout):
+            raise TimeoutError("previous Kafka pipeline pods did not terminate")
 
     def _wait_consumer_pods_gone(self, timeout: int = 120) -> None:
-        deadline = time.time() + timeout
-        while time.time() < deadline:
-            if not self._pipeline_pods({self.CONSUMER_DEPLOYMENT}):
-                return
-            time.sleep(3)
-        raise TimeoutError("orders-validator pods did not terminate")
+        if not self.kubectl.wait_for_pods_deleted(self.namespace, f"app={self.CONSUMER_DEPLOYMENT}", timeout=timeout):
+            raise TimeoutError("orders-validator pods did not terminate")
 
     def _apply_configmap(self) -> None:
         body = client.V1ConfigMap(
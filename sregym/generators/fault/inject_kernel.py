@@ -1,6 +1,5 @@
 import json
 import shlex
-import subprocess
 from collections.abc import Iterable
 
 from sregym.service.kubectl import KubeCtl
@@ -151,8 +150,7 @@ class KernelInjector:
         if node in self._pod_cache:
             return self._pod_cache[node]
 
-        cmd = f"kubectl -n {shlex.quote(self.khaos_ns)} get pods -l {shlex.quote(self.khaos_label)} -o json"
-        out = self.kubectl.exec_command(cmd)
+        out = self._kubectl_output(["get", "pods", "-l", self.khaos_label, "-o", "json"])
         if not out:
             raise RuntimeError("Failed to get pods: empty response")
 
@@ -185,21 +183,19 @@ class KernelInjector:
 
     # --- pod exec helpers ---
 
+    def _kubectl_output(self, args: list[str]) -> str:
+        """Run kubectl in the Khaos namespace; returns stdout, or stderr if the command failed."""
+        result = self.kubectl.run(args, namespace=self.khaos_ns)
+        return result.stdout if result.returncode == 0 else result.stderr
+
     def _exists(self, pod: str, path: str) -> bool:
         """Check if a path exists in the pod."""
-        cmd = (
-            f"kubectl -n {shlex.quote(self.khaos_ns)} exec {shlex.quote(pod)} -- "
-            f"sh -lc 'test -e {shlex.quote(path)} && echo OK || true'"
-        )
-        out = self.kubectl.exec_command(cmd)
+        out = self._kubectl_output(["exec", pod, "--", "sh", "-lc", f"test -e {shlex.quote(path)} && echo OK || true"])
         return (out or "").strip() == "OK"
 
     def _write(self, pod: str, path: str, value: str, *, must_exist: bool = True) -> None:
         """Write a value to a path in the pod."""
         cmd = [
-            "kubectl",
-            "-n",
-            self.khaos_ns,
             "exec",
             pod,
             "--",
@@ -207,23 +203,18 @@ class KernelInjector:
             "-lc",
             f"printf %s {shlex.quote(value)} > {shlex.quote(path)} 2>/dev/null || true",
         ]
-        rc = subprocess.run(cmd, capture_output=True, text=True)
+        rc = self.kubectl.run(cmd, namespace=self.khaos_ns)
         if must_exist and rc.returncode != 0:
             raise RuntimeError(f"Failed to write '{value}' to {path} in {pod}: rc={rc.returncode}, err={rc.stderr}")
 
     def _sh(self, pod: str, script: str) -> str:
         """Execute a shell script in the pod."""
-        cmd = ["kubectl", "-n", self.khaos_ns, "exec", pod, "--", "sh", "-lc", script]
-        out = self.kubectl.exec_command(" ".join(shlex.quote(x) for x in cmd))
-        return out or ""
+        return self._kubectl_output(["exec", pod, "--", "sh", "-lc", script]) or ""
 
     def _exec_on_node(self, node: str, script: str) -> str:
         """Execute a script on the node using nsenter (runs in the Khaos pod on that node)."""
         pod = self._get_khaos_pod_on_node(node)
         cmd = [
-            "kubectl",
-            "-n",
-            self.khaos_ns,
             "exec",
             pod,
             "--",
@@ -239,16 +230,12 @@ class KernelInjector:
             "-c",
             script,
         ]
-        out = self.kubectl.exec_command(" ".join(shlex.quote(x) for x in cmd))
-        return out or ""
+        return self._kubectl_output(cmd) or ""
 
     def _exec_with_nsenter_mount(self, node: str, script: str, check: bool = True) -> tuple[int, str, str]:
         """Execute a script using nsenter with mount namespace, returns (returncode, stdout, stderr)."""
         pod = self._get_khaos_pod_on_node(node)
         cmd = [
-            "kubectl",
-            "-n",
-            self.khaos_ns,
             "exec",
             pod,
             "--",
@@ -258,7 +245,7 @@ class KernelInjector:
             "-lc",
             script,
         ]
-        rc = subprocess.run(cmd, capture_output=True, text=True)
+        rc = self.kubectl.run(cmd, namespace=self.khaos_ns)
         if check and rc.returncode != 0:
             raise RuntimeError(
                 f"Command failed on node {node}: rc={rc.returncode}, stdout={rc.stdout}, stderr={rc.stderr}"
@@ -4,37 +4,29 @@ import yaml
 
 from sregym.generators.fault.base import FaultInjector
 from sregym.service.kubectl import KubeCtl
+from sregym.utils.cache import cached_manifest_path
 
 
 class K8SOperatorFaultInjector(FaultInjector):
+    CLEAN_TIDB_CLUSTER_URL = (
+        "https://raw.githubusercontent.com/pingcap/tidb-operator/v1.6.0/examples/basic/tidb-cluster.yaml"
+    )
+    OPERATOR_NAMESPACE = "tidb-operator"
+    YAML_PATH_TEMPLATE = "/tmp/{}.yaml"
+    # Bound on a single API request, so a stuck apiserver call fails fast instead of hanging the injector.
+    REQUEST_TIMEOUT = "10s"
+    # Overall bound for commands that wait on the cluster (e.g. foreground deletes), which
+    # --request-timeout would cut short.
+    WAIT_TIMEOUT = 600
+
     def __init__(self, namespace: str):
         self.namespace = namespace
-        self.kubectl = KubeCtl()
+        self.kubectl = KubeCtl.instance()
         self.kubectl.create_namespace_if_not_exist(namespace)
 
-    def _apply_yaml(self, cr_name: str, cr_yaml: dict):
-        yaml_path = f"/tmp/{cr_name}.yaml"
-        with open(yaml_path, "w") as file:
-            yaml.dump(cr_yaml, file)
-
-        command = f"kubectl apply -f {yaml_path} -n {self.namespace}"
-        print(f"Namespace: {self.namespace}")
-        result = self.kubectl.exec_command(command)
-        print(f"Injected {cr_name}: {result}")
-
-    def _delete_yaml(self, cr_name: str):
-        yaml_path = f"/tmp/{cr_name}.yaml"
-        command = f"kubectl delete -f {yaml_path} -n {self.namespace}"
-        result = self.kubectl.exec_command(command)
-        print(f"Recovered from misconfiguration {cr_name}: {result}")
-
-    def inject_overload_replicas(self):
-        """
-        Injects a TiDB misoperation custom resource.
-        The misconfiguration sets an unreasonably high number of TiDB replicas.
-        """
-        cr_name = "overload-tidbcluster"
-        cr_yaml = {
+    def _tidb_cluster_cr(self, pd: dict | None = None, tikv: dict | None = None, tidb: dict | None = None) -> dict:
+        """Build the 'basic' TidbCluster CR, merging the per-component fields a fault overrides."""
+        return {
             "apiVersion": "pingcap.com/v1alpha1",
             "kind": "TidbCluster",
             "metadata": {"name": "basic", "namespace": self.namespace},
@@ -47,23 +39,73 @@ class K8SOperatorFaultInjector(FaultInjector):
                     "replicas": 3,
                     "requests": {"storage": "1Gi"},
                     "config": {},
+                    **(pd or {}),
                 },
                 "tikv": {
                     "baseImage": "pingcap/tikv",
                     "replicas": 3,
                     "requests": {"storage": "1Gi"},
                     "config": {},
+                    **(tikv or {}),
                 },
                 "tidb": {
                     "baseImage": "pingcap/tidb",
-                    "replicas": 100000,  # Intentional misconfiguration
+                    "replicas": 2,
                     "service": {"type": "ClusterIP"},
                     "config": {},
+                    **(tidb or {}),
                 },
             },
         }
 
-        self._apply_yaml(cr_name, cr_yaml)
+    def _operator_pod_manifest(self, image: str) -> dict:
+        """Build a manifest that replaces the operator pod's container image."""
+        pod_name, container_name = self._get_operator_pod_and_container()
+        return {
+            "apiVersion": "v1",
+            "kind": "Pod",
+            "metadata": {"name": pod_name, "namespace": self.OPERATOR_NAMESPACE},
+            "spec": {"containers": [{"name": container_name, "image": image}]},
+        }
+
+    def _run_kubectl(self, args: str, namespace: str | None = None, wait: bool = False) -> str:
+        """Run `kubectl <args> -n <namespace>` with a bounded runtime."""
+        if wait:
+            command = f"timeout {self.WAIT_TIMEOUT} kubectl {args} -n {namespace or self.namespace}"
+        else:
+            command = f"kubectl --request-timeout={self.REQUEST_TIMEOUT} {args} -n {namespace or self.namespace}"
+        return self.kubectl.exec_command(command)
+
+    def _apply_yaml(self, cr_name: str, cr_yaml: dict, namespace: str | None = None):
+        yaml_path = self.YAML_PATH_TEMPLATE.format(cr_name)
+        with open(yaml_path, "w") as file:
+            yaml.dump(cr_yaml, file)
+
+        print(f"Namespace: {self.namespace}")
+        result = self._run_kubectl(f"apply -f {yaml_path}", namespace=namespace)
+        print(f"Injected {cr_name}: {result}")
+
+    def _delete_yaml(self, cr_name: str):
+        yaml_path = self.YAML_PATH_TEMPLATE.format(cr_name)
+        # The fault CR may already be gone (e.g. injection never completed); make that a clean no-op.
+        result = self._run_kubectl(f"delete -f {yaml_path} --ignore-not-found=true", wait=True)
+        print(f"Recovered from misconfiguration {cr_name}: {result}")
+
+    def _get_operator_pod_and_container(self) -> tuple[str, str]:
+        """Return the operator pod's name and first container name from a single pod list call.
+
+        Pod names are not static like the 'basic' TidbCluster name, so they are looked up at runtime.
+        """
+        pod = self.kubectl.list_pods(self.OPERATOR_NAMESPACE).items[0]
+        return pod.metadata.name, pod.spec.containers[0].name
+
+    def inject_overload_replicas(self):
+        """
+        Injects a TiDB misoperation custom resource.
+        The misconfiguration sets an unreasonably high number of TiDB replicas.
+        """
+        cr_yaml = self._tidb_cluster_cr(tidb={"replicas": 100000})  # Intentional misconfiguration
+        self._apply_yaml("overload-tidbcluster", cr_yaml)
 
     def recover_overload_replicas(self):
         self.recover_fault("overload-tidbcluster")
@@ -72,45 +114,20 @@ class K8SOperatorFaultInjector(FaultInjector):
         """
         This misoperation specifies an invalid toleration effect.
         """
-        cr_name = "affinity-toleration-fault"
-        cr_yaml = {
-            "apiVersion": "pingcap.com/v1alpha1",
-            "kind": "TidbCluster",
-            "metadata": {"name": "basic", "namespace": self.namespace},
-            "spec": {
-                "version": "v3.0.8",
-                "timezone": "UTC",
-                "pvReclaimPolicy": "Delete",
-                "pd": {
-                    "baseImage": "pingcap/pd",
-                    "replicas": 3,
-                    "requests": {"storage": "1Gi"},
-                    "config": {},
-                },
-                "tikv": {
-                    "baseImage": "pingcap/tikv",
-                    "replicas": 3,
-                    "requests": {"storage": "1Gi"},
-                    "config": {},
-                },
-                "tidb": {
-                    "baseImage": "pingcap/tidb",
-                    "replicas": 2,
-                    "service": {"type": "ClusterIP"},
-                    "config": {},
-                    "tolerations": [
-                        {
-                            "key": "test-keys",
-                            "operator": "Equal",
-                            "value": "test-value",
-                            "effect": "TAKE_SOME_EFFECT",  # Buggy: invalid toleration effect
-                            "tolerationSeconds": 0,
-                        }
-                    ],
-                },
-            },
-        }
-        self._apply_yaml(cr_name, cr_yaml)
+        cr_yaml = self._tidb_cluster_cr(
+            tidb={
+                "tolerations": [
+                    {
+                        "key": "test-keys",
+                        "operator": "Equal",
+                        "value": "test-value",
+                        "effect": "TAKE_SOME_EFFECT",  # Buggy: invalid toleration effect
+                        "tolerationSeconds": 0,
+                    }
+                ]
+            }
+        )
+        self._apply_yaml("affinity-toleration-fault", cr_yaml)
 
     def recover_invalid_affinity_toleration(self):
         self.recover_fault("affinity-toleration-fault")
@@ -119,37 +136,8 @@ class K8SOperatorFaultInjector(FaultInjector):
         """
         The fault sets an invalid runAsUser value.
         """
-        cr_name = "security-context-fault"
-        cr_yaml = {
-            "apiVersion": "pingcap.com/v1alpha1",
-            "kind": "TidbCluster",
-            "metadata": {"name": "basic", "namespace": self.namespace},
-            "spec": {
-                "version": "v3.0.8",
-                "timezone": "UTC",
-                "pvReclaimPolicy": "Delete",
-                "pd": {
-                    "baseImage": "pingcap/pd",
-                    "replicas": 3,
-                    "requests": {"storage": "1Gi"},
-                    "config": {},
-                },
-                "tikv": {
-                    "baseImage": "pingcap/tikv",
-                    "replicas": 3,
-                    "requests": {"storage": "1Gi"},
-                    "config": {},
-                },
-                "tidb": {
-                    "baseImage": "pingcap/tidb",
-                    "replicas": 2,
-                    "service": {"type": "ClusterIP"},
-                    "config": {},
-                    "podSecurityContext": {"runAsUser": -1},  # invalid runAsUser value
-                },
-            },
-        }
-        self._apply_yaml(cr_name, cr_yaml)
+        cr_yaml = self._tidb_cluster_cr(tidb={"podSecurityContext": {"runAsUser": -1}})  # invalid runAsUser value
+        self._apply_yaml("security-context-fault", cr_yaml)
 
     def recover_security_context_fault(self):
         self.recover_fault("security-context-fault")
@@ -158,37 +146,8 @@ class K8SOperatorFaultInjector(FaultInjector):
         """
         This fault specifies an invalid update strategy.
         """
-        cr_name = "deployment-update-strategy-fault"
-        cr_yaml = {
-            "apiVersion": "pingcap.com/v1alpha1",
-            "kind": "TidbCluster",
-            "metadata": {"name": "basic", "namespace": self.namespace},
-            "spec": {
-                "version": "v3.0.8",
-                "timezone": "UTC",
-                "pvReclaimPolicy": "Delete",
-                "pd": {
-                    "baseImage": "pingcap/pd",
-                    "replicas": 3,
-                    "requests": {"storage": "1Gi"},
-                    "config": {},
-                },
-                "tikv": {
-                    "baseImage": "pingcap/tikv",
-                    "replicas": 3,
-                    "requests": {"storage": "1Gi"},
-                    "config": {},
-                },
-                "tidb": {
-                    "baseImage": "pingcap/tidb",
-                    "replicas": 2,
-                    "service": {"type": "ClusterIP"},
-                    "config": {},
-                    "statefulSetUpdateStrategy": "SomeStrategyForUpdate",  # invalid update strategy
-                },
-            },
-        }
-        self._apply_yaml(cr_name, cr_yaml)
+        cr_yaml = self._tidb_cluster_cr(tidb={"statefulSetUpdateStrategy": "SomeStrategyForUpdate"})  # invalid
+        self._apply_yaml("deployment-update-strategy-fault", cr_yaml)
 
     def recover_wrong_update_strategy(self):
         self.recover_fault("deployment-update-strategy-fault")
@@ -203,35 +162,8 @@ class K8SOperatorFaultInjector(FaultInjector):
         pods remain stuck in Pending — making the fault observable.
         """
         cr_name = "non-existent-storage-fault"
-        cr_yaml = {
-            "apiVersion": "pingcap.com/v1alpha1",
-            "kind": "TidbCluster",
-            "metadata": {"name": "basic", "namespace": self.namespace},
-            "spec": {
-                "version": "v3.0.8",
-                "timezone": "UTC",
-                "pvReclaimPolicy": "Delete",
-                "pd": {
-                    "baseImage": "pingcap/pd",
-                    "replicas": 3,
-                    "requests": {"storage": "1Gi"},
-                    "config": {},
-                    "storageClassName": "nonexistent-storage-class",  # non-existent storage class (RFC 1123 valid so PVC creation passes validation and lands in Pending)
-                },
-                "tikv": {
-                    "baseImage": "pingcap/tikv",
-                    "replicas": 3,
-                    "requests": {"storage": "1Gi"},
-                    "config": {},
-                },
-                "tidb": {
-                    "baseImage": "pingcap/tidb",
-                    "replicas": 2,
-                    "service": {"type": "ClusterIP"},
-                    "config": {},
-                },
-            },
-        }
+        # Non-existent storage class (RFC 1123 valid so PVC creation passes validation and lands in Pending)
+        cr_yaml = self._tidb_cluster_cr(pd={"storageClassName": "nonexistent-storage-class"})
         self._apply_yaml(cr_name, cr_yaml)
 
         # StatefulSet volumeClaimTemplates are immutable, so the operator
@@ -242,11 +174,9 @@ class K8SOperatorFaultInjector(FaultInjector):
         # provision, and leave PD pods stuck in Pending.
         pd_labels = "app.kubernetes.io/instance=basic,app.kubernetes.io/component=pd"
         print("[FAULT] Deleting PD PVCs to force reprovisioning with the bogus storage class...")
-        self.kubectl.exec_command(f"kubectl delete pvc -n {self.namespace} -l {pd_labels} --wait=false")
+        self._run_kubectl(f"delete pvc -l {pd_labels} --wait=false")
         print("[FAULT] Deleting PD StatefulSet so the operator rebuilds it from the updated CR...")
-        self.kubectl.exec_command(
-            f"kubectl delete statefulset basic-pd -n {self.namespace} --ignore-not-found=true --wait=false"
-        )
+        self._run_kubectl("delete statefulset basic-pd --ignore-not-found=true --wait=false")
 
     def recover_non_existent_storage(self):
         # Recovery has to be serialized: if the bogus PVCs are still around
@@ -256,94 +186,35 @@ class K8SOperatorFaultInjector(FaultInjector):
         # fully before applying the clean CR.
         pd_labels = "app.kubernetes.io/instance=basic,app.kubernetes.io/component=pd"
         print("[RECOVER] Deleting bogus TidbCluster (foreground cascade)...")
-        result = self.kubectl.exec_command(
-            f"kubectl delete -f /tmp/non-existent-storage-fault.yaml -n {self.namespace} "
-            f"--ignore-not-found=true --cascade=foreground"
+        result = self._run_kubectl(
+            f"delete -f {self.YAML_PATH_TEMPLATE.format('non-existent-storage-fault')} "
+            "--ignore-not-found=true --cascade=foreground",
+            wait=True,
         )
         print(f"[RECOVER] CR delete: {result}")
         print("[RECOVER] Deleting bogus PD PVCs (no consumers now)...")
-        result = self.kubectl.exec_command(
-            f"kubectl delete pvc -n {self.namespace} -l {pd_labels} --ignore-not-found=true"
-        )
+        result = self._run_kubectl(f"delete pvc -l {pd_labels} --ignore-not-found=true", wait=True)
         print(f"[RECOVER] PVC delete: {result}")
         print("[RECOVER] Applying clean TidbCluster CR...")
-        clean_url = "https://raw.githubusercontent.com/pingcap/tidb-operator/v1.6.0/examples/basic/tidb-cluster.yaml"
-        result = self.kubectl.exec_command(f"kubectl apply -f {clean_url} -n {self.namespace}")
+        clean_cr_path = cached_manifest_path(self.CLEAN_TIDB_CLUSTER_URL)
+        result = self._run_kubectl(f"apply -f {clean_cr_path}")
         print(f"Restored clean TiDBCluster: {result}")
 
     def inject_wrong_operator_image(self):
         """
         Fault: Replaces the operator pod image with a typo-version to trigger ImagePullBackOff.
         """
-        # 1. Get the dynamic pod name and container name from the namespace
-        # We use kubectl here because Pod names are not static like the 'basic' TidbCluster name
-        pod_name = self.kubectl.exec_command(
-            "kubectl get pods -n tidb-operator -o jsonpath='{.items[0].metadata.name}'"
-        ).strip()
-        container_name = self.kubectl.exec_command(
-            f"kubectl get pod {pod_name} -n tidb-operator -o jsonpath='{{.spec.containers[0].name}}'"
-        ).strip()
-
-        # 2. Define the fault manifest as a python dict
-        cr_name = "wrong-operator-image-fault"
-        pod_yaml = {
-            "apiVersion": "v1",
-            "kind": "Pod",
-            "metadata": {"name": pod_name, "namespace": "tidb-operator"},
-            "spec": {
-                "containers": [
-                    {
-                        "name": container_name,
-                        "image": "pingcap/tidb-operatorr:v1.6.3",  # Typo in 'operatorr'
-                    }
-                ]
-            },
-        }
-
-        # 3. Apply the fault
-        yaml_path = f"/tmp/{cr_name}.yaml"
-        with open(yaml_path, "w") as file:
-            yaml.dump(pod_yaml, file)
-
-        command = f"kubectl apply -f {yaml_path} -n tidb-operator"
-        print(f"Namespace: {self.namespace}")
-        result = self.kubectl.exec_command(command)
-        print(f"Injected {cr_name}: {result}")
+        pod_yaml = self._operator_pod_manifest("pingcap/tidb-operatorr:v1.6.3")  # Typo in 'operatorr'
+        self._apply_yaml("wrong-operator-image-fault", pod_yaml, namespace=self.OPERATOR_NAMESPACE)
 
     def recover_wrong_operator_image(self):
-        # 1. Get the dynamic pod name and container name from the namespace
-        # We use kubectl here because Pod names are not static like the 'basic' TidbCluster name
-        pod_name = self.kubectl.exec_command(
-            "kubectl get pods -n tidb-operator -o jsonpath='{.items[0].metadata.name}'"
-        ).strip()
-        container_name = self.kubectl.exec_command(
-            f"kubectl get pod {pod_name} -n tidb-operator -o jsonpath='{{.spec.containers[0].name}}'"
-        ).strip()
-
-        # 2. Define the fault manifest as a python dict
-        cr_name = "recover-wrong-operator-image-fault"
-        pod_yaml = {
-            "apiVersion": "v1",
-            "kind": "Pod",
-            "metadata": {"name": pod_name, "namespace": "tidb-operator"},
-            "spec": {"containers": [{"name": container_name, "image": "pingcap/tidb-operator:v1.6.3"}]},
-        }
-
-        # 3. Recover the fault
-        yaml_path = f"/tmp/{cr_name}.yaml"
-        with open(yaml_path, "w") as file:
-            yaml.dump(pod_yaml, file)
-
-        command = f"kubectl apply -f {yaml_path} -n tidb-operator"
-        print(f"Namespace: {self.namespace}")
-        result = self.kubectl.exec_command(command)
-        print(f"Injected {cr_name}: {result}")
+        pod_yaml = self._operator_pod_manifest("pingcap/tidb-operator:v1.6.3")
+        self._apply_yaml("recover-wrong-operator-image-fault", pod_yaml, namespace=self.OPERATOR_NAMESPACE)
 
     def recover_fault(self, cr_name: str):
         self._delete_yaml(cr_name)
-        clean_url = "https://raw.githubusercontent.com/pingcap/tidb-operator/v1.6.0/examples/basic/tidb-cluster.yaml"
-        command = f"kubectl apply -f {clean_url} -n {self.namespace}"
-        result = self.kubectl.exec_command(command)
+        clean_cr_path = cached_manifest_path(self.CLEAN_TIDB_CLUSTER_URL)
+        result = self._run_kubectl(f"apply -f {clean_cr_path}")
         print(f"Restored clean TiDBCluster: {result}")
 
 
@@ -41,7 +41,7 @@ _FLAG_INJECT_VARIANT: dict[str, str] = {
 class OtelFaultInjector(FaultInjector):
     def __init__(self, namespace: str):
         self.namespace = namespace
-        self.kubectl = KubeCtl()
+        self.kubectl = KubeCtl.instance()
         self.configmap_name = "flagd-config"
 
     def _restart_flagd_and_consumers(self, feature_flag: str) -> None:
@@ -3,14 +3,13 @@
 import contextlib
 import json
 import os
+import random
 import re
 import shlex
 import subprocess
 import time
 
-import paramiko
 import yaml
-from paramiko.client import AutoAddPolicy
 
 from sregym.generators.fault.base import FaultInjector
 from sregym.paths import BASE_DIR
@@ -22,7 +21,7 @@ NODE_NOT_READY_POLL_INTERVAL = 5  # seconds
 
 class RemoteOSFaultInjector(FaultInjector):
     def __init__(self):
-        self.kubectl = KubeCtl()
+        self.kubectl = KubeCtl.instance()
         self.worker_info = None
         self._is_kind = None
 
@@ -94,6 +93,10 @@ class RemoteOSFaultInjector(FaultInjector):
 
     def _ssh_exec(self, host: str, user: str, command: str):
         """Run a command on a remote host via SSH."""
+        # Deferred: paramiko is slow to import and only needed on non-Kind clusters.
+        import paramiko
+        from paramiko.client import AutoAddPolicy
+
         ssh = paramiko.SSHClient()
         ssh.set_missing_host_key_policy(AutoAddPolicy())
         try:
@@ -386,22 +389,24 @@ class RemoteOSFaultInjector(FaultInjector):
             f"{list(node_to_services.keys()) or 'unknown'}. Cleaning up and restoring."
         )
 
-        for pod_name in pod_names:
-            try:
-                self.kubectl.exec_command(
-                    f"kubectl delete pod {pod_name} -n default --ignore-not-found --grace-period=0 --force"
-                )
-            except Exception as e:
-                print(f"Could not delete leftover pod {pod_name}: {e}")
+        # The deletes are independent, so issue them as one kubectl call instead of one per pod.
+        try:
+            self.kubectl.exec_command(
+                f"kubectl delete pod {' '.join(pod_names)} -n default --ignore-not-found --grace-period=0 --force"
+            )
+        except Exception as e:
+            print(f"Could not delete leftover pods {pod_names}: {e}")
 
         for node_name, services in node_to_services.items():
             self._restore_node_time_sync(node_name, services)
 
     def _read_pod_logs_with_retry(
-        self, pod_name: str, namespace: str = "default", retries: int = 3, delay: int = 5
+        self, pod_name: str, namespace: str = "default", retries: int = 5, max_delay: float = 8.0
     ) -> str:
-        """Read pod logs, retrying if the result looks like a connectivity
-        error rather than real log output.
+        """Read pod logs, retrying with capped exponential backoff if the result
+        looks like a connectivity error rather than real log output.
+
+        A NotFound error is final: the pod is gone, so waiting longer cannot help.
         """
         for attempt in range(retries):
             try:
@@ -413,11 +418,16 @@ class RemoteOSFaultInjector(FaultInjector):
             if logs and "Unable to connect to the server" not in logs and "Error from server" not in logs:
                 return logs
 
+            if "(NotFound)" in logs:
+                print(f"Pod {pod_name} no longer exists; not retrying log read")
+                break
+
             if attempt < retries - 1:
-                print(f"Log read for {pod_name} looked unusable; retrying ({attempt + 1}/{retries})...")
+                delay = min(0.5 * 2**attempt, max_delay) + random.uniform(0, 0.25)
+                print(f"Log read for {pod_name} looked unusable; retrying in {delay:.1f}s ({attempt + 1}/{retries})...")
                 time.sleep(delay)
 
-        print(f"Warning: could not get usable logs from {pod_name} after {retries} attempts")
+        print(f"Warning: could not get usable logs from {pod_name} after {attempt + 1} attempt(s)")
         return ""
 
     def _restore_node_time_sync(self, node_name: str, known_services: set[str] | None = None):
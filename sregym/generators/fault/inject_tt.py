@@ -1,4 +1,3 @@
-import json
 import logging
 import random
 import time
@@ -13,10 +12,12 @@ logger = logging.getLogger(__name__)
 
 
 class TrainTicketFaultInjector(FaultInjector):
+    FLAGD_ROLLOUT_TIMEOUT = 60
+
     def __init__(self, namespace: str = "train-ticket"):
         super().__init__(namespace)
         self.namespace = namespace
-        self.kubectl = KubeCtl()
+        self.kubectl = KubeCtl.instance()
         self.configmap_name = "flagd-config"
         self.flagd_deployment = "flagd"
 
@@ -49,10 +50,8 @@ class TrainTicketFaultInjector(FaultInjector):
 
     def _get_configmap(self) -> dict[str, Any]:
         try:
-            result = self.kubectl.exec_command(
-                f"kubectl get configmap {self.configmap_name} -n {self.namespace} -o json"
-            )
-            return json.loads(result) if result else {}
+            configmap = self.kubectl.core_v1_api.read_namespaced_config_map(self.configmap_name, self.namespace)
+            return configmap.to_dict()
         except Exception as e:
             logger.error(f"Error getting ConfigMap: {e}")
             return {}
@@ -93,9 +92,9 @@ class TrainTicketFaultInjector(FaultInjector):
             if result:
                 print(f"✅ {fault_type} set to {state}")
 
-                verification = self._get_configmap()
-                if verification and "data" in verification:
-                    flags_verification = yaml.safe_load(verification["data"]["flags.yaml"])
+                # The replace call returns the stored object, so verify that instead of re-reading the ConfigMap.
+                if result.data and "flags.yaml" in result.data:
+                    flags_verification = yaml.safe_load(result.data["flags.yaml"])
                     actual_value = flags_verification["flags"][fault_type]["defaultVariant"]
                     if actual_value == state:
                         print(f"✅ ConfigMap verified: {fault_type} = {state}")
@@ -103,11 +102,11 @@ class TrainTicketFaultInjector(FaultInjector):
                         print(f"❌ ConfigMap verification failed: expected {state}, got {actual_value}")
                         return False
 
-                self._restart_flagd()
-                print("✅ flagd restarted successfully")
-
-                print("Sleeping for 20 seconds for flag value change to take effect...")
-                time.sleep(20)
+                if self._restart_flagd():
+                    print("✅ flagd restarted and serving the new flag values")
+                else:
+                    print("Sleeping for 20 seconds for flag value change to take effect...")
+                    time.sleep(20)
                 return True
             else:
                 print("Failed to update ConfigMap")
@@ -117,15 +116,24 @@ class TrainTicketFaultInjector(FaultInjector):
             print(f"❌ Error updating fault: {e}")
             return False
 
-    def _restart_flagd(self):
+    def _restart_flagd(self) -> bool:
+        """Restart flagd and wait until the new pods (which load the updated ConfigMap) are rolled out.
+
+        Returns False when the rollout could not be confirmed, so callers can fall back to a fixed delay.
+        """
         print("[TrainTicket] Restarting flagd deployment...")
         try:
-            result = self.kubectl.exec_command(
-                f"kubectl rollout restart deployment/{self.flagd_deployment} -n {self.namespace}"
+            if self.kubectl.trigger_rollout(self.flagd_deployment, self.namespace) is None:
+                return False
+            print("[TrainTicket] flagd deployment restarted")
+            self.kubectl.exec_command_checked(
+                f"kubectl rollout status deployment/{self.flagd_deployment} -n {self.namespace} "
+                f"--timeout={self.FLAGD_ROLLOUT_TIMEOUT}s"
             )
-            print(f"[TrainTicket] flagd deployment restarted: {result}")
+            return True
         except Exception as e:
             logger.error(f"Error restarting flagd: {e}")
+            return False
 
     def activate_decoy_flags(self, count: int = 3) -> bool:
         """Turn on a random subset of dud flags so the real fault doesn't stand out.
@@ -3,6 +3,8 @@
 import contextlib
 import copy
 import json
+import re
+import tempfile
 import time
 from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
@@ -15,12 +17,14 @@ from sregym.paths import TARGET_MICROSERVICES
 from sregym.service.helm import Helm
 from sregym.service.kubectl import KubeCtl
 
+_NETWORKCHAOS_GROUP_VERSION = ("chaos-mesh.org", "v1alpha1")
+
 
 class VirtualizationFaultInjector(FaultInjector):
     def __init__(self, namespace: str):
         super().__init__(namespace)
         self.namespace = namespace
-        self.kubectl = KubeCtl()
+        self.kubectl = KubeCtl.instance()
         self.mongo_service_pod_map = {
             "url-shorten-mongodb": "url-shorten-service",
         }
@@ -820,8 +824,6 @@ class VirtualizationFaultInjector(FaultInjector):
 
     def recover_wrong_service_selector(self, microservices: list[str]):
         for service in microservices:
-            service_config = self.kubectl.get_service_json(service, self.namespace)
-
             service_config = self.kubectl.get_service_json(service, self.namespace)
             current_selectors = service_config.get("spec", {}).get("selector", {})
 
@@ -1209,8 +1211,6 @@ class VirtualizationFaultInjector(FaultInjector):
         - stale_coredns_config: `template ANY ANY svc.cluster.local`
         - service_dns_resolution_failure: `template ANY ANY {service}.{namespace}.svc.cluster.local`
         """
-        import re
-
         cm_yaml = self.kubectl.exec_command("kubectl -n kube-system get cm coredns -o yaml")
         cm_data = yaml.safe_load(cm_yaml)
         corefile = cm_data["data"]["Corefile"]
@@ -1474,23 +1474,18 @@ class VirtualizationFaultInjector(FaultInjector):
                 },
             ]
 
-            # Check if volumes array exists, if not create it
-            check_volumes_cmd = (
-                f"kubectl get deployment {service} -n {self.namespace} -o jsonpath='{{.spec.template.spec.volumes}}'"
-            )
-            volumes_exist = self.kubectl.exec_command(check_volumes_cmd).strip()
+            # One read of the deployment answers both "do the volumes / volumeMounts arrays exist" checks.
+            pod_spec = self.kubectl.get_deployment(service, self.namespace).spec.template.spec
 
-            if not volumes_exist or volumes_exist == "[]":
+            # Check if volumes array exists, if not create it
+            if not pod_spec.volumes:
                 # Need to create the volumes array first
                 json_patch[0]["op"] = "add"
                 json_patch[0]["path"] = "/spec/template/spec/volumes"
                 json_patch[0]["value"] = [json_patch[0]["value"]]
 
             # Check if volumeMounts array exists
-            check_mounts_cmd = f"kubectl get deployment {service} -n {self.namespace} -o jsonpath='{{.spec.template.spec.containers[0].volumeMounts}}'"
-            mounts_exist = self.kubectl.exec_command(check_mounts_cmd).strip()
-
-            if not mounts_exist or mounts_exist == "[]":
+            if not pod_spec.containers[0].volume_mounts:
                 # Need to create the volumeMounts array first
                 json_patch[1]["op"] = "add"
                 json_patch[1]["path"] = "/spec/template/spec/containers/0/volumeMounts"
@@ -1919,8 +1914,6 @@ class VirtualizationFaultInjector(FaultInjector):
 
     # Inject Rolling Update Misconfiguration
     def inject_rolling_update_misconfigured(self, microservices: list[str]):
-        import tempfile
-
         for service in microservices:
             base_dep = {
                 "apiVersion": "apps/v1",
@@ -1999,8 +1992,6 @@ class VirtualizationFaultInjector(FaultInjector):
 
     def deploy_custom_service(self, service_name: str, script_path: str):
         print(f"Deploying {service_name} Service...................................")
-        import tempfile
-
         import yaml
 
         with open(script_path) as sf:
@@ -2400,18 +2391,12 @@ class VirtualizationFaultInjector(FaultInjector):
                 "data": {"routes.json": '{"enabled": true, "version": "1.0"}'},
             }
 
-            cm_json = json.dumps(configmap_manifest)
-            self.kubectl.exec_command(f"kubectl apply -f - <<EOF\n{cm_json}\nEOF")
-
             sa_manifest = {
                 "apiVersion": "v1",
                 "kind": "ServiceAccount",
                 "metadata": {"name": f"{service}-rbac-sa", "namespace": self.namespace},
             }
 
-            sa_json = json.dumps(sa_manifest)
-            self.kubectl.exec_command(f"kubectl apply -f - <<EOF\n{sa_json}\nEOF")
-
             # ClusterRole WITHOUT configmaps permission
             clusterrole_manifest = {
                 "apiVersion": "rbac.authorization.k8s.io/v1",
@@ -2420,9 +2405,6 @@ class VirtualizationFaultInjector(FaultInjector):
                 "rules": [{"apiGroups": [""], "resources": ["pods", "services"], "verbs": ["get", "list", "watch"]}],
             }
 
-            cr_json = json.dumps(clusterrole_manifest)
-            self.kubectl.exec_command(f"kubectl apply -f - <<EOF\n{cr_json}\nEOF")
-
             clusterrolebinding_manifest = {
                 "apiVersion": "rbac.authorization.k8s.io/v1",
                 "kind": "ClusterRoleBinding",
@@ -2435,8 +2417,9 @@ class VirtualizationFaultInjector(FaultInjector):
                 "subjects": [{"kind": "ServiceAccount", "name": f"{service}-rbac-sa", "namespace": self.namespace}],
             }
 
-            crb_json = json.dumps(clusterrolebinding_manifest)
-            self.kubectl.exec_command(f"kubectl apply -f - <<EOF\n{crb_json}\nEOF")
+            # Submit all four objects as one multi-document apply instead of one kubectl run each.
+            rbac_manifests = [configmap_manifest, sa_manifest, clusterrole_manifest, clusterrolebinding_manifest]
+            self.kubectl.exec_command("kubectl apply -f -", input_data=yaml.safe_dump_all(rbac_manifests))
 
             deployment_yaml = self._get_deployment_yaml(service)
             original_deployment_yaml = copy.deepcopy(deployment_yaml)
@@ -2470,14 +2453,9 @@ class VirtualizationFaultInjector(FaultInjector):
             )
             self.kubectl.exec_command(f"kubectl apply -f {original_yaml_path} -n {self.namespace}")
             self.kubectl.exec_command(
-                f"kubectl delete clusterrolebinding {service}-rbac-binding --ignore-not-found=true"
-            )
-            self.kubectl.exec_command(f"kubectl delete clusterrole {service}-rbac-role --ignore-not-found=true")
-            self.kubectl.exec_command(
-                f"kubectl delete serviceaccount {service}-rbac-sa -n {self.namespace} --ignore-not-found=true"
-            )
-            self.kubectl.exec_command(
-                f"kubectl delete configmap app-routing-config -n {self.namespace} --ignore-not-found=true"
+                f"kubectl delete clusterrolebinding/{service}-rbac-binding clusterrole/{service}-rbac-role "
+                f"serviceaccount/{service}-rbac-sa configmap/app-routing-config "
+                f"-n {self.namespace} --ignore-not-found=true"
             )
 
             print(f"RBAC fault recovered for {service}")
@@ -2486,29 +2464,22 @@ class VirtualizationFaultInjector(FaultInjector):
 
     def inject_gogc_env_variable_patch(self, gogc_value: str):
         """Set GOGC environment variable for all deployments via patch method"""
-        # Get all deployment names
-        deployments_cmd = f"kubectl get deployments -n {self.namespace} -o jsonpath='{{.items[*].metadata.name}}'"
-        deployment_names = self.kubectl.exec_command(deployments_cmd).split()
-
-        for deployment_name in deployment_names:
-            if not deployment_name:
-                continue
+        # One list call returns every deployment's containers and env, instead of a jsonpath query per field.
+        deployments = self._get_deployments_json()
+        deployment_names = [deployment["metadata"]["name"] for deployment in deployments]
 
+        for deployment in deployments:
+            deployment_name = deployment["metadata"]["name"]
             print(f"Patching GOGC={gogc_value} for deployment: {deployment_name}")
 
             # Construct patch operations
             patch_ops = []
 
-            # Get container count
-            containers_cmd = f"kubectl get deployment {deployment_name} -n {self.namespace} -o jsonpath='{{.spec.template.spec.containers[*].name}}'"
-            container_names = self.kubectl.exec_command(containers_cmd).split()
-
-            for i, _container_name in enumerate(container_names):
-                # Check if env array exists
-                env_check_cmd = f"kubectl get deployment {deployment_name} -n {self.namespace} -o jsonpath='{{.spec.template.spec.containers[{i}].env}}'"
-                existing_env = self.kubectl.exec_command(env_check_cmd).strip()
+            for i, container in enumerate(deployment["spec"]["template"]["spec"]["containers"]):
+                env = container.get("env") or []
+                gogc_index = self._env_index(env, "GOGC")
 
-                if not existing_env or existing_env == "[]":
+                if not env:
                     # Create env array
                     patch_ops.append(
                         {
@@ -2517,40 +2488,26 @@ class VirtualizationFaultInjector(FaultInjector):
                             "value": [{"name": "GOGC", "value": gogc_value}],
                         }
                     )
+                elif gogc_index is not None:
+                    # Update existing GOGC value
+                    patch_ops.append(
+                        {
+                            "op": "replace",
+                            "path": f"/spec/template/spec/containers/{i}/env/{gogc_index}/value",
+                            "value": gogc_value,
+                        }
+                    )
                 else:
-                    # Check if GOGC already exists
-                    gogc_check_cmd = f"kubectl get deployment {deployment_name} -n {self.namespace} -o jsonpath='{{.spec.template.spec.containers[{i}].env[?(@.name==\"GOGC\")].value}}'"
-                    existing_gogc = self.kubectl.exec_command(gogc_check_cmd).strip()
-
-                    if existing_gogc:
-                        # Update existing GOGC value
-                        # Need to find GOGC's index in env array
-                        env_names_cmd = f"kubectl get deployment {deployment_name} -n {self.namespace} -o jsonpath='{{.spec.template.spec.containers[{i}].env[*].name}}'"
-                        env_names = self.kubectl.exec_command(env_names_cmd).split()
-
-                        for j, env_name in enumerate(env_names):
-                            if env_name == "GOGC":
-                                patch_ops.append(
-                                    {
-                                        "op": "replace",
-                                        "path": f"/spec/template/spec/containers/{i}/env/{j}/value",
-                                        "value": gogc_value,
-                                    }
-                                )
-                                break
-                    else:
-                        # Add new GOGC environment variable
-                        patch_ops.append(
-                            {
-                                "op": "add",
-                                "path": f"/spec/template/spec/containers/{i}/env/-",
-                                "value": {"name": "GOGC", "value": gogc_value},
-                            }
-                        )
+                    # Add new GOGC environment variable
+                    patch_ops.append(
+                        {
+                            "op": "add",
+                            "path": f"/spec/template/spec/containers/{i}/env/-",
+                            "value": {"name": "GOGC", "value": gogc_value},
+                        }
+                    )
 
             if patch_ops:
-                import json
-
                 patch_json = json.dumps(patch_ops)
                 patch_cmd = (
                     f"kubectl patch deployment {deployment_name} -n {self.namespace} --type='json' -p='{patch_json}'"
@@ -2580,57 +2537,37 @@ class VirtualizationFaultInjector(FaultInjector):
 
     def recover_gogc_env_variable_patch(self):
         """Recover all deployment GOGC environment variables to default value 100"""
-        # Get all deployment names
-        deployments_cmd = f"kubectl get deployments -n {self.namespace} -o jsonpath='{{.items[*].metadata.name}}'"
-        deployment_names = self.kubectl.exec_command(deployments_cmd).split()
-
-        for deployment_name in deployment_names:
-            if not deployment_name:
-                continue
+        deployments = self._get_deployments_json()
+        deployment_names = [deployment["metadata"]["name"] for deployment in deployments]
 
+        for deployment in deployments:
+            deployment_name = deployment["metadata"]["name"]
             print(f"Recovering GOGC to default (100) for deployment: {deployment_name}")
 
             # Construct patch operations
             patch_ops = []
 
-            # Get container count
-            containers_cmd = f"kubectl get deployment {deployment_name} -n {self.namespace} -o jsonpath='{{.spec.template.spec.containers[*].name}}'"
-            container_names = self.kubectl.exec_command(containers_cmd).split()
-
-            for i, container_name in enumerate(container_names):
-                # Check if env array exists
-                env_check_cmd = f"kubectl get deployment {deployment_name} -n {self.namespace} -o jsonpath='{{.spec.template.spec.containers[{i}].env}}'"
-                existing_env = self.kubectl.exec_command(env_check_cmd).strip()
-
-                if existing_env and existing_env != "[]":
-                    # Check if GOGC exists
-                    gogc_check_cmd = f"kubectl get deployment {deployment_name} -n {self.namespace} -o jsonpath='{{.spec.template.spec.containers[{i}].env[?(@.name==\"GOGC\")].value}}'"
-                    existing_gogc = self.kubectl.exec_command(gogc_check_cmd).strip()
+            for i, container in enumerate(deployment["spec"]["template"]["spec"]["containers"]):
+                container_name = container["name"]
+                env = container.get("env") or []
+                gogc_index = self._env_index(env, "GOGC")
 
-                    if existing_gogc:
-                        # Find GOGC's index in env array and update to 100
-                        env_names_cmd = f"kubectl get deployment {deployment_name} -n {self.namespace} -o jsonpath='{{.spec.template.spec.containers[{i}].env[*].name}}'"
-                        env_names = self.kubectl.exec_command(env_names_cmd).split()
-
-                        for j, env_name in enumerate(env_names):
-                            if env_name == "GOGC":
-                                patch_ops.append(
-                                    {
-                                        "op": "replace",
-                                        "path": f"/spec/template/spec/containers/{i}/env/{j}/value",
-                                        "value": "100",
-                                    }
-                                )
-                                print(f"Found GOGC={existing_gogc} in container {container_name}, updating to 100")
-                                break
-                    else:
-                        print(f"No GOGC environment variable found in container {container_name}")
-                else:
+                if not env:
                     print(f"No environment variables found in container {container_name}")
+                elif gogc_index is None:
+                    print(f"No GOGC environment variable found in container {container_name}")
+                else:
+                    patch_ops.append(
+                        {
+                            "op": "replace",
+                            "path": f"/spec/template/spec/containers/{i}/env/{gogc_index}/value",
+                            "value": "100",
+                        }
+                    )
+                    existing_gogc = env[gogc_index].get("value")
+                    print(f"Found GOGC={existing_gogc} in container {container_name}, updating to 100")
 
             if patch_ops:
-                import json
-
                 patch_json = json.dumps(patch_ops)
                 patch_cmd = (
                     f"kubectl patch deployment {deployment_name} -n {self.namespace} --type='json' -p='{patch_json}'"
@@ -2724,25 +2661,13 @@ class VirtualizationFaultInjector(FaultInjector):
         if not microservices:
             raise ValueError("inject_tor_network_partition requires a non-empty `microservices` list (faulty group).")
 
-        # Check ChaosMesh is installed (fail-fast if not)
-        crd_check = self.kubectl.exec_command("kubectl get crd networkchaos.chaos-mesh.org")
-        if "NotFound" in crd_check or "Error" in crd_check:
-            raise RuntimeError(
-                "ChaosMesh NetworkChaos CRD not found. Install Chaos Mesh before running tor_network_partition."
-            )
-
-        # If the chaos object already exists, recover first to avoid double-injections
-        existing = self.kubectl.exec_command(
-            f"kubectl get networkchaos {chaos_resource_name} -n {self.namespace} -o name --ignore-not-found=true"
-        ).strip()
-        if existing:
+        # Fails fast if ChaosMesh is not installed; if the chaos object already exists, recover first to avoid
+        # double-injections
+        if self._networkchaos_exists(chaos_resource_name):
             print("NetworkChaos already instantiated, recovering from previous injection.")
             self.recover_tor_network_partition(microservices)
 
-            existing = self.kubectl.exec_command(
-                f"kubectl get networkchaos {chaos_resource_name} -n {self.namespace} -o name --ignore-not-found=true"
-            ).strip()
-            if existing:
+            if self._networkchaos_exists(chaos_resource_name):
                 raise RuntimeError("Previous NetworkChaos still present after recovery attempt.")
 
         # Prepare nodes (require >=2 workers)
@@ -2759,23 +2684,22 @@ class VirtualizationFaultInjector(FaultInjector):
         print(f"Selected faulty node: {faulty_node}")
         print(f"Selected healthy node: {healthy_node}")
 
-        self.kubectl.exec_command(f"kubectl label node {faulty_node} {tor_node_label_key}={faulty_group} --overwrite")
-        self.kubectl.exec_command(f"kubectl label node {healthy_node} {tor_node_label_key}={healthy_group} --overwrite")
-        for n in nodes[2:]:
-            self.kubectl.exec_command(f"kubectl label node {n} {tor_node_label_key}={healthy_group} --overwrite")
-
-        dep_names = self.kubectl.exec_command(
-            f"kubectl get deployments -n {self.namespace} -o jsonpath='{{.items[*].metadata.name}}'"
-        ).split()
-        dep_names = [d for d in dep_names if d]
+        # Every node past the faulty one joins the healthy segment
+        self._label_tor_nodes(
+            tor_node_label_key, {node: faulty_group if node == faulty_node else healthy_group for node in nodes}
+        )
 
-        if not dep_names:
+        # A single list call returns every manifest, instead of a name listing plus one get per deployment
+        deployments = self._list_deployment_manifests()
+        if not deployments:
             raise RuntimeError(f"No deployments found in namespace {self.namespace}; is the app deployed?")
 
-        # Force deployments onto specific node groups and pods
-        for dep in dep_names:
-            dep_yaml = self._get_deployment_yaml(dep)
-            group = faulty_group if dep in microservices else healthy_group
+        # Force deployments onto specific node groups and pods; faulty names are matched exactly, so one set lookup each
+        faulty_services = frozenset(microservices)
+        modified_deployments = []
+        for dep_yaml in deployments:
+            dep = dep_yaml["metadata"]["name"]
+            group = faulty_group if dep in faulty_services else healthy_group
 
             dep_yaml.setdefault("spec", {}).setdefault("template", {}).setdefault("metadata", {}).setdefault(
                 "labels", {}
@@ -2786,18 +2710,14 @@ class VirtualizationFaultInjector(FaultInjector):
                 "nodeSelector", {}
             )
             dep_yaml["spec"]["template"]["spec"]["nodeSelector"][tor_node_label_key] = group
-
-            modified_yaml_path = self._write_yaml_to_file(dep, dep_yaml)
-
-            self.kubectl.exec_command(f"kubectl delete deployment {dep} -n {self.namespace}")
-            self.kubectl.exec_command(f"kubectl apply -f {modified_yaml_path} -n {self.namespace}")
+            modified_deployments.append(dep_yaml)
 
             print(
                 f"[{dep}] Forced placement: nodeSelector {tor_node_label_key}={group}; "
                 f"pod label {tor_pod_group_label_key}={group}"
             )
 
-        self.kubectl.wait_for_stable(self.namespace)
+        self._redeploy_tor_deployments(modified_deployments)
 
         # Apply NetworkChaos faulty/healthy partition
         networkchaos_manifest = {
@@ -2822,8 +2742,9 @@ class VirtualizationFaultInjector(FaultInjector):
             },
         }
 
-        networkchaos_manifest_path = self._write_yaml_to_file("tor-networkchaos", networkchaos_manifest)
-        self.kubectl.exec_command(f"kubectl apply -f {networkchaos_manifest_path} -n {self.namespace}")
+        self.kubectl.custom_api.create_namespaced_custom_object(
+            *_NETWORKCHAOS_GROUP_VERSION, self.namespace, "networkchaos", networkchaos_manifest
+        )
 
         print(f"Injected network partition: {chaos_resource_name} (faulty <-> healthy) in namespace {self.namespace}")
 
@@ -2834,19 +2755,19 @@ class VirtualizationFaultInjector(FaultInjector):
         tor_pod_group_label_key = "network-segment"
 
         # Delete NetworkChaos first to restore network
-        self.kubectl.exec_command(
-            f"kubectl delete networkchaos {chaos_resource_name} -n {self.namespace} --ignore-not-found=true"
-        )
+        try:
+            self.kubectl.custom_api.delete_namespaced_custom_object(
+                *_NETWORKCHAOS_GROUP_VERSION, self.namespace, "networkchaos", chaos_resource_name
+            )
+        except ApiException as exc:
+            if exc.status != 404:
+                raise
         print(f"Deleted NetworkChaos {chaos_resource_name} (if present).")
 
         # Remove nodeSelector keys and pod label keys
-        dep_names = self.kubectl.exec_command(
-            f"kubectl get deployments -n {self.namespace} -o jsonpath='{{.items[*].metadata.name}}'"
-        ).split()
-        dep_names = [d for d in dep_names if d]
-        for dep in dep_names:
-            dep_yaml = self._get_deployment_yaml(dep)
-
+        modified_deployments = []
+        for dep_yaml in self._list_deployment_manifests():
+            dep = dep_yaml["metadata"]["name"]
             tmpl = dep_yaml.get("spec", {}).get("template", {}) or {}
             tmpl_md = tmpl.get("metadata", {}) or {}
             tmpl_labels = (tmpl_md.get("labels", {}) or {}).copy()
@@ -2880,15 +2801,12 @@ class VirtualizationFaultInjector(FaultInjector):
             tmpl["metadata"] = tmpl_md
             tmpl["spec"] = tmpl_spec
             dep_yaml.setdefault("spec", {})["template"] = tmpl
+            modified_deployments.append(dep_yaml)
 
-            modified_yaml_path = self._write_yaml_to_file(dep, dep_yaml)
-
-            self.kubectl.exec_command(f"kubectl delete deployment {dep} -n {self.namespace} --ignore-not-found=true")
-            self.kubectl.exec_command(f"kubectl apply -f {modified_yaml_path} -n {self.namespace}")
-
-            print(f"[{dep}] Removed {tor_pod_group_label_key} label and {tor_node_label_key} nodeSelector; redeployed.")
+            print(f"[{dep}] Removed {tor_pod_group_label_key} label and {tor_node_label_key} nodeSelector.")
 
-        self.kubectl.wait_for_ready(self.namespace)
+        if modified_deployments:
+            self._redeploy_tor_deployments(modified_deployments)
 
         # Remove node labels (best effort cleanup)
         nodes = [
@@ -2897,11 +2815,64 @@ class VirtualizationFaultInjector(FaultInjector):
             if "node-role.kubernetes.io/control-plane" not in (n.metadata.labels or {})
             and "node-role.kubernetes.io/master" not in (n.metadata.labels or {})
         ]
-        for n in nodes:
-            self.kubectl.exec_command(f"kubectl label node {n} {tor_node_label_key}-")
+        self._label_tor_nodes(tor_node_label_key, dict.fromkeys(nodes))
 
         print(f"Recovered network partition and cleaned node labels ({tor_node_label_key}-).")
 
+    def _networkchaos_exists(self, name: str) -> bool:
+        try:
+            chaos = self.kubectl.custom_api.list_namespaced_custom_object(
+                *_NETWORKCHAOS_GROUP_VERSION, self.namespace, "networkchaos"
+            )
+        except ApiException as exc:
+            if exc.status == 404:
+                raise RuntimeError(
+                    "ChaosMesh NetworkChaos CRD not found. Install Chaos Mesh before running tor_network_partition."
+                ) from exc
+            raise
+        return any(item["metadata"]["name"] == name for item in chaos.get("items", []))
+
+    def _label_tor_nodes(self, key: str, values: dict[str, str | None]):
+        """Set each node's ``key`` label to its value in ``values`` (``None`` removes it).
+
+        The patches are independent writes, so they are issued concurrently over the shared connection pool.
+        """
+        if not values:
+            return
+        with ThreadPoolExecutor(max_workers=min(8, len(values))) as pool:
+            futures = [
+                pool.submit(self.kubectl.core_v1_api.patch_node, node, {"metadata": {"labels": {key: value}}})
+                for node, value in values.items()
+            ]
+            for future in futures:
+                future.result()
+
+    def _list_deployment_manifests(self) -> list[dict]:
+        """Return every deployment in the namespace as an apply-able manifest dict."""
+        manifests = []
+        for deployment in self.kubectl.apps_v1_api.list_namespaced_deployment(self.namespace).items:
+            manifest = self.kubectl.api_client.sanitize_for_serialization(deployment)
+            # List responses omit the per-item type metadata that kubectl apply needs
+            manifest["apiVersion"] = "apps/v1"
+            manifest["kind"] = "Deployment"
+            manifests.append(manifest)
+        return manifests
+
+    def _redeploy_tor_deployments(self, deployments: list[dict]):
+        """Recreate deployments with one delete and one multi-document apply, then wait for them to roll out."""
+        names = [dep["metadata"]["name"] for dep in deployments]
+        modified_yaml_path = "/tmp/tor-deployments_modified.yaml"
+        with open(modified_yaml_path, "w") as file:
+            yaml.dump_all(deployments, file)
+        self.kubectl.exec_command(
+            f"kubectl delete deployment {' '.join(names)} -n {self.namespace} --ignore-not-found=true"
+        )
+        self.kubectl.exec_command(f"kubectl apply -f {modified_yaml_path} -n {self.namespace}")
+
+        # Watch the recreated deployments and return once the last one has rolled out, instead of polling pods
+        if not self.kubectl.wait_for_deployments_rolled_out(self.namespace, names):
+            raise RuntimeError(f"Deployments in {self.namespace} did not finish rolling out after the ToR redeploy.")
+
     # V.N - init_container_dependency_hang: Pod stuck in Init because an injected
     # init container loops forever waiting on a non-existent dependency (the
     # classic wait-for-it / `until nslookup dep; do sleep; done` pattern, with a
@@ -3057,12 +3028,10 @@ class VirtualizationFaultInjector(FaultInjector):
 
     ############# HELPER FUNCTIONS ################
     def _wait_for_pods_ready(self, microservices: list[str], timeout: int = 30):
-        for service in microservices:
-            command = (
-                f"kubectl wait --for=condition=ready pod -l app={service} -n {self.namespace} --timeout={timeout}s"
-            )
-            result = self.kubectl.exec_command(command)
-            print(f"Wait result for {service}: {result}")
+        # One watch over all services rather than a `kubectl wait` process per service.
+        selector = f"app in ({','.join(microservices)})"
+        ready = self.kubectl.wait_for_pods_ready(self.namespace, selector, timeout=timeout)
+        print(f"Wait result for {microservices}: {'ready' if ready else 'timed out'}")
 
     def _modify_target_port_config(self, from_port: int, to_port: int, configs: dict):
         for port in configs["spec"]["ports"]:
@@ -3072,7 +3041,7 @@ class VirtualizationFaultInjector(FaultInjector):
         return configs
 
     def _get_values_yaml(self, service_name: str):
-        kubectl = KubeCtl()
+        kubectl = KubeCtl.instance()
         values_yaml = kubectl.exec_command(f"kubectl get configmap {service_name} -n {self.testbed} -o yaml")
         return yaml.safe_load(values_yaml)
 
@@ -3091,12 +3060,20 @@ class VirtualizationFaultInjector(FaultInjector):
         with open(modified_yaml_path, "w") as f:
             f.write(modified_yaml)
 
-        kubectl = KubeCtl()
+        kubectl = KubeCtl.instance()
         kubectl.exec_command(
             f"kubectl create configmap {service_name} -n {self.testbed} --from-file=values.yaml={modified_yaml_path} --dry-run=client -o yaml | kubectl apply -f -"
         )
         kubectl.exec_command(f"kubectl rollout restart deployment {service_name} -n {self.testbed}")
 
+    def _get_deployments_json(self) -> list[dict]:
+        out = self.kubectl.exec_command_checked(f"kubectl get deployments -n {self.namespace} -o json")
+        return json.loads(out)["items"]
+
+    @staticmethod
+    def _env_index(env: list[dict], name: str) -> int | None:
+        return next((j for j, var in enumerate(env) if var.get("name") == name), None)
+
     def _get_deployment_yaml(self, service_name: str):
         deployment_yaml = self.kubectl.exec_command(
             f"kubectl get deployment {service_name} -n {self.namespace} -o yaml"
@@ -9,7 +9,7 @@ from sregym.service.kubectl import KubeCtl
 class ChaosInjector:
     def __init__(self, namespace: str):
         self.namespace = namespace
-        self.kubectl = KubeCtl()
+        self.kubectl = KubeCtl.instance()
         self.kubectl.create_namespace_if_not_exist("chaos-mesh")
         Helm.add_repo("chaos-mesh", "https://charts.chaos-mesh.org")
         chaos_configs = {
@@ -19,6 +19,7 @@ from typing import Any
 import yaml
 
 from sregym.generators.noise.catalog import EXPERIMENT_CATALOG
+from sregym.service.helm import Helm
 from sregym.service.kubectl import KubeCtl
 
 logger = logging.getLogger(__name__)
@@ -46,7 +47,7 @@ class NoiseManager:
             return
         self._initialized = True
 
-        self.kubectl = KubeCtl()
+        self.kubectl = KubeCtl.instance()
         self.running = False
         self.current_stage: str | None = None
         self.target_namespace: str | None = None
@@ -260,8 +261,8 @@ class NoiseManager:
                     return
 
             logger.info("Chaos Mesh not found. Installing...")
-            self.kubectl.exec_command("helm repo add chaos-mesh https://charts.chaos-mesh.org")
-            self.kubectl.exec_command("helm repo update")
+            Helm.add_repo("chaos-mesh", "https://charts.chaos-mesh.org")
+            Helm.repo_update()
             self.kubectl.exec_command(f"kubectl create ns {CHAOS_NAMESPACE}")
 
             # Clean up orphaned CRDs if needed (strip finalizers first to avoid hanging)
@@ -3,13 +3,14 @@ import time
 from datetime import datetime
 
 import yaml
-from kubernetes import client, config
+from kubernetes import client
 
 from logger import console
 from sregym.generators.noise.impl.stress_injector import ChaosInjector
 from sregym.generators.workload.base import WorkloadEntry
 from sregym.generators.workload.stream import StreamWorkloadManager
 from sregym.paths import TARGET_MICROSERVICES
+from sregym.service.kubectl import KubeCtl
 
 # Mimicked the Wrk2 class
 
@@ -28,10 +29,10 @@ class BHotelWrk:
         self.duration = duration
         self.multiplier = multiplier
 
-        config.load_kube_config()
+        self.kubectl = KubeCtl.instance()
 
     def create_configmap(self, config_name, namespace):
-        api_instance = client.CoreV1Api()
+        api_instance = self.kubectl.core_v1_api
         bhotelwrk_job_configmap = (
             TARGET_MICROSERVICES / "BlueprintHotelReservation" / "wlgen" / "wlgen_proc-configmap.yaml"
         )
@@ -65,9 +66,12 @@ class BHotelWrk:
         with open(bhotelwrk_deployment_yaml) as f:
             deployment_template = yaml.safe_load(f)
 
-        api_instance = client.AppsV1Api()
+        api_instance = self.kubectl.apps_v1_api
+        # List by name rather than read-and-catch-404, so the usual fresh-run path raises nothing.
         try:
-            existing = api_instance.read_namespaced_deployment(name=deployment_name, namespace=namespace)
+            existing = api_instance.list_namespaced_deployment(
+                namespace=namespace, field_selector=f"metadata.name={deployment_name}"
+            ).items
             if existing:
                 logger.info(f"Deployment '{deployment_name}' already exists. Deleting it...")
                 api_instance.delete_namespaced_deployment(
@@ -76,9 +80,8 @@ class BHotelWrk:
                     body=client.V1DeleteOptions(propagation_policy="Foreground"),
                 )
         except client.exceptions.ApiException as e:
-            if e.status != 404:
-                logger.error(f"Error checking for existing deployment: {e}")
-                return
+            logger.error(f"Error checking for existing deployment: {e}")
+            return
 
         try:
             response = api_instance.create_namespaced_deployment(namespace=namespace, body=deployment_template)
@@ -87,7 +90,7 @@ class BHotelWrk:
             logger.error(f"Error creating deployment: {e}")
 
     def delete_bhotelwrk_deployment(self, deployment_name, namespace):
-        api_instance = client.AppsV1Api()
+        api_instance = self.kubectl.apps_v1_api
         try:
             api_instance.delete_namespaced_deployment(
                 name=deployment_name,
@@ -104,10 +107,12 @@ class BHotelWrk:
         with open(bhotelwrk_job_yaml) as f:
             job_template = yaml.safe_load(f)
 
-        api_instance = client.BatchV1Api()
+        api_instance = self.kubectl.batch_v1_api
         try:
-            existing_job = api_instance.read_namespaced_job(name=job_name, namespace=namespace)
-            if existing_job:
+            existing_jobs = api_instance.list_namespaced_job(
+                namespace=namespace, field_selector=f"metadata.name={job_name}"
+            ).items
+            if existing_jobs:
                 logger.info(f"Job '{job_name}' already exists. Deleting it...")
                 api_instance.delete_namespaced_job(
                     name=job_name,
@@ -116,9 +121,8 @@ class BHotelWrk:
                 )
                 self.wait_for_job_deletion(job_name, namespace)
         except client.exceptions.ApiException as e:
-            if e.status != 404:
-                logger.error(f"Error checking for existing job: {e}")
-                return
+            logger.error(f"Error checking for existing job: {e}")
+            return
 
         try:
             response = api_instance.create_namespaced_job(namespace=namespace, body=job_template)
@@ -132,21 +136,22 @@ class BHotelWrk:
         self.create_bhotelwrk_job(job_name=job_name, namespace=namespace)
 
     def stop_workload(self, namespace, job_name="bhotelwrk-wlgen-proc"):
-        api_instance = client.BatchV1Api()
+        api_instance = self.kubectl.batch_v1_api
         try:
-            existing_job = api_instance.read_namespaced_job(name=job_name, namespace=namespace)
-            if existing_job:
+            existing_jobs = api_instance.list_namespaced_job(
+                namespace=namespace, field_selector=f"metadata.name={job_name}"
+            ).items
+            if existing_jobs:
                 logger.info(f"Stopping job '{job_name}'...")
                 api_instance.patch_namespaced_job(name=job_name, namespace=namespace, body={"spec": {"suspend": True}})
                 time.sleep(5)
         except client.exceptions.ApiException as e:
-            if e.status != 404:
-                logger.error(f"Error checking for existing job: {e}")
-                return
+            logger.error(f"Error checking for existing job: {e}")
+            return
 
     def wait_for_job_deletion(self, job_name, namespace, sleep=2, max_wait=60):
         """Wait for a Kubernetes Job to be deleted before proceeding."""
-        api_instance = client.BatchV1Api()
+        api_instance = self.kubectl.batch_v1_api
         waited = 0
 
         while waited < max_wait:
@@ -188,9 +193,9 @@ class BHotelWrkWorkloadManager(StreamWorkloadManager):
         self.continuous = continuous
         self.deployment_name = deployment_name
         self.apply_capacity_restraint = apply_capacity_restraint
-        config.load_kube_config()
-        self.core_v1_api = client.CoreV1Api()
-        self.batch_v1_api = client.BatchV1Api()
+        self.kubectl = KubeCtl.instance()
+        self.core_v1_api = self.kubectl.core_v1_api
+        self.batch_v1_api = self.kubectl.batch_v1_api
 
         self.log_pool = []
 
@@ -349,7 +354,7 @@ class BHotelWrkWorkloadManager(StreamWorkloadManager):
             logger.error(f"Error injecting chaos experiments: {e}")
 
     def _deploy_cpu_stress_daemonset(self):
-        apps_v1 = client.AppsV1Api()
+        apps_v1 = self.kubectl.apps_v1_api
         daemonset_name = "cpu-stress-daemon"
 
         try:
@@ -395,7 +400,7 @@ class BHotelWrkWorkloadManager(StreamWorkloadManager):
     def _delete_cpu_stress_daemonset(self):
         if not hasattr(self, "cpu_stress_daemonset_name"):
             return
-        apps_v1 = client.AppsV1Api()
+        apps_v1 = self.kubectl.apps_v1_api
         try:
             apps_v1.delete_namespaced_daemon_set(
                 name=self.cpu_stress_daemonset_name,
@@ -485,7 +490,7 @@ class BHotelWrkWorkloadManager(StreamWorkloadManager):
         logger.info("LimitRange 'capacity-restraint' applied")
 
         # 3. Rolling restart all deployments so pods come up with the 200m CPU limit
-        apps_v1 = client.AppsV1Api()
+        apps_v1 = self.kubectl.apps_v1_api
         deployments = apps_v1.list_namespaced_deployment(self.namespace)
         restart_ts = datetime.now().isoformat()
         for dep in deployments.items:
@@ -2,11 +2,10 @@ import contextlib
 import json
 import logging
 import math
-import time
 from datetime import datetime
 
 import yaml
-from kubernetes import client, config, stream
+from kubernetes import client, stream
 
 from sregym.generators.workload.base import WorkloadEntry
 from sregym.generators.workload.stream import STREAM_WORKLOAD_EPS, StreamWorkloadManager
@@ -28,12 +27,14 @@ class LocustWorkloadManager(StreamWorkloadManager):
         self.log_pool = []
         self.last_log_line_time = None
 
-        config.load_kube_config()
-        self.core_v1_api = client.CoreV1Api()
+        self.kubectl = KubeCtl.instance()
+        self.core_v1_api = self.kubectl.core_v1_api
+        # stream.stream() swaps the websocket transport into the ApiClient it is handed for the duration of the
+        # exec, so pod exec gets a private client; on the shared one, other threads' REST calls would take that path.
+        self.exec_core_v1_api = client.CoreV1Api(client.ApiClient())
 
-        self.kubectl = KubeCtl()
-
-    def remove_fetcher(self):
+    def remove_fetcher(self) -> bool:
+        """Delete any existing locust-fetcher pod; return False if it is still present after the wait."""
         try:
             pods = self.core_v1_api.list_namespaced_pod(namespace=self.namespace, label_selector="app=locust-fetcher")
             if pods.items:
@@ -43,20 +44,17 @@ class LocustWorkloadManager(StreamWorkloadManager):
                     namespace=self.namespace,
                     body=client.V1DeleteOptions(grace_period_seconds=0, propagation_policy="Background"),
                 )
-                while True:
-                    time.sleep(5)
-                    pods = self.core_v1_api.list_namespaced_pod(
-                        namespace=self.namespace, label_selector="app=locust-fetcher"
-                    )
-                    if not pods.items:
-                        break
+                if not self.kubectl.wait_for_pods_deleted(self.namespace, "app=locust-fetcher", timeout=120):
+                    print("Pod locust-fetcher was not deleted in time.")
+                    return False
         except client.exceptions.ApiException as e:
             if e.status != 404:
                 print(f"Error removing pod: {e}")
-                return
+        return True
 
     def create_fetcher(self):
-        self.remove_fetcher()
+        if not self.remove_fetcher():
+            return
 
         wrk_job_yaml = BASE_DIR / "generators" / "workload" / "locust-fetcher-template.yaml"
         with open(wrk_job_yaml) as f:
@@ -73,16 +71,9 @@ class LocustWorkloadManager(StreamWorkloadManager):
                 body=job_template,
             )
             print("Waiting for locust-fetcher pod to be created...")
-            while True:
-                pod = self.core_v1_api.read_namespaced_pod_status(
-                    name="locust-fetcher",
-                    namespace=self.namespace,
-                )
-                conditions = pod.status.conditions or []
-                ready = any(cond.type == "Ready" and cond.status == "True" for cond in conditions)
-                if ready:
-                    break
-                time.sleep(5)
+            if not self.kubectl.wait_for_pods_ready(self.namespace, "app=locust-fetcher"):
+                print("Pod locust-fetcher did not become ready in time.")
+                return
             print("Pod locust-fetcher created.")
         except client.exceptions.ApiException as e:
             print(f"Error creating pod: {e}")
@@ -131,7 +122,7 @@ class LocustWorkloadManager(StreamWorkloadManager):
         }
         if start_time is not None:
             resp = stream.stream(
-                self.core_v1_api.connect_get_namespaced_pod_exec,
+                self.exec_core_v1_api.connect_get_namespaced_pod_exec,
                 name=pods.items[0].metadata.name,
                 namespace=self.namespace,
                 command=["date", "-Ins"],
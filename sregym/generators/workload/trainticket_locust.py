@@ -4,6 +4,7 @@ Extends the base LocustWorkloadManager to provide TrainTicket-specific
 workload generation capabilities.
 """
 
+import json
 import logging
 from typing import Any
 
@@ -103,8 +104,6 @@ class TrainTicketLocustWorkloadManager(LocustWorkloadManager):
             )
 
             if result:
-                import json
-
                 return json.loads(result)
             else:
                 return {}
@@ -6,12 +6,13 @@ from datetime import datetime
 from pathlib import Path
 
 import yaml
-from kubernetes import client, config, stream
+from kubernetes import client, stream
 
 from logger import console
 from sregym.generators.workload.base import WorkloadEntry
 from sregym.generators.workload.stream import STREAM_WORKLOAD_EPS, StreamWorkloadManager
 from sregym.paths import BASE_DIR
+from sregym.service.kubectl import KubeCtl
 
 logger = logging.getLogger("all.infra.workload")
 logger.propagate = True
@@ -32,7 +33,7 @@ class Wrk2:
         self.latency = latency
         self.namespace = namespace
 
-        config.load_kube_config()
+        self.kubectl = KubeCtl.instance()
 
     def create_configmap(self, name, namespace, payload_script_path, url):
         with open(payload_script_path) as script_file:
@@ -67,7 +68,7 @@ class Wrk2:
             },
         )
 
-        api_instance = client.CoreV1Api()
+        api_instance = self.kubectl.core_v1_api
         try:
             logger.info(f"Checking for existing ConfigMap '{name}'...")
             api_instance.delete_namespaced_config_map(name=name, namespace=self.namespace)
@@ -112,10 +113,13 @@ class Wrk2:
             },
         ]
 
-        api_instance = client.BatchV1Api()
+        api_instance = self.kubectl.batch_v1_api
+        # List by name rather than read-and-catch-404, so the usual fresh-run path raises nothing.
         try:
-            existing_job = api_instance.read_namespaced_job(name=job_name, namespace=self.namespace)
-            if existing_job:
+            existing_jobs = api_instance.list_namespaced_job(
+                namespace=self.namespace, field_selector=f"metadata.name={job_name}"
+            ).items
+            if existing_jobs:
                 logger.info(f"Job '{job_name}' already exists. Deleting it...")
                 api_instance.delete_namespaced_job(
                     name=job_name,
@@ -124,9 +128,8 @@ class Wrk2:
                 )
                 self.wait_for_job_deletion(job_name, self.namespace)
         except client.exceptions.ApiException as e:
-            if e.status != 404:
-                logger.error(f"Error checking for existing job: {e}")
-                return
+            logger.error(f"Error checking for existing job: {e}")
+            return
 
         try:
             response = api_instance.create_namespaced_job(namespace=self.namespace, body=job_template)
@@ -144,7 +147,7 @@ class Wrk2:
         self.create_wrk_job(job_name="wrk2-job", namespace=self.namespace, payload_script=payload_script.name)
 
     def stop_workload(self, job_name="wrk2-job"):
-        api_instance = client.BatchV1Api()
+        api_instance = self.kubectl.batch_v1_api
         try:
             existing_job = api_instance.read_namespaced_job(name=job_name, namespace=self.namespace)
             if existing_job:
@@ -161,7 +164,7 @@ class Wrk2:
 
     def wait_for_job_deletion(self, job_name, namespace, sleep=2, max_wait=60):
         """Wait for a Kubernetes Job to be deleted before proceeding."""
-        api_instance = client.BatchV1Api()
+        api_instance = self.kubectl.batch_v1_api
         waited = 0
 
         while waited < max_wait:
@@ -193,9 +196,12 @@ class Wrk2WorkloadManager(StreamWorkloadManager):
         self.job_name = job_name
         self.namespace = namespace
 
-        config.load_kube_config()
-        self.core_v1_api = client.CoreV1Api()
-        self.batch_v1_api = client.BatchV1Api()
+        self.kubectl = KubeCtl.instance()
+        self.core_v1_api = self.kubectl.core_v1_api
+        self.batch_v1_api = self.kubectl.batch_v1_api
+        # stream.stream() swaps the websocket transport into the ApiClient it is handed for the duration of the
+        # exec, so pod exec gets a private client; on the shared one, other threads' REST calls would take that path.
+        self.exec_core_v1_api = client.CoreV1Api(client.ApiClient())
 
         self.log_pool = []
 
@@ -266,7 +272,7 @@ class Wrk2WorkloadManager(StreamWorkloadManager):
         if start_time is not None:
             # Get the current time inside the pod by executing 'date +%s' in the pod
             resp = stream.stream(
-                self.core_v1_api.connect_get_namespaced_pod_exec,
+                self.exec_core_v1_api.connect_get_namespaced_pod_exec,
                 name=pods.items[0].metadata.name,
                 namespace=self.namespace,
                 command=["date", "-Ins"],
@@ -11,6 +11,7 @@ TARGET_MICROSERVICES = BASE_PARENT_DIR / "SREGym-applications"
 # Cache directories
 CACHE_DIR = HOME_DIR / "cache_dir"
 LLM_CACHE_FILE = CACHE_DIR / "llm_cache.json"
+MANIFEST_CACHE_DIR = CACHE_DIR / "manifests"
 
 # Cluster baseline state snapshot (captured from a fresh cluster)
 CLUSTER_BASELINE_STATE_FILE = CACHE_DIR / "cluster_baseline_state.json"
@@ -20,7 +20,7 @@ class AstronomyShop(Application):
     def __init__(self):
         super().__init__(ASTRONOMY_SHOP_METADATA)
         self.load_app_json()
-        self.kubectl = KubeCtl()
+        self.kubectl = KubeCtl.instance()
         self.create_namespace()
 
     def load_app_json(self):
@@ -57,9 +57,8 @@ class AstronomyShop(Application):
         """
         Returns contents of demo.flagd.json from the flagd config map.
         """
-        raw = self.kubectl.exec_command(f"kubectl get configmap {self._FLAGD_CONFIGMAP} -n {self.namespace} -o json")
-        configmap = json.loads(raw)
-        return json.loads(configmap["data"][self._FLAGD_CONFIG_KEY])
+        configmap = self.kubectl.core_v1_api.read_namespaced_config_map(self._FLAGD_CONFIGMAP, self.namespace)
+        return json.loads(configmap.data[self._FLAGD_CONFIG_KEY])
 
     def _write_flagd_config(self, config: dict[str, Any]) -> None:
         """
@@ -107,11 +106,10 @@ class AstronomyShop(Application):
         """Delete the Helm configurations."""
         Helm.uninstall(**self.helm_configs)
         self.kubectl.delete_namespace(self.helm_configs["namespace"])
-        self.kubectl.wait_for_namespace_deletion(self.namespace)
 
     def cleanup(self):
         Helm.uninstall(**self.helm_configs)
-        self.kubectl.delete_namespace(self.helm_configs["namespace"])
+        self.kubectl.delete_namespace(self.helm_configs["namespace"], wait=False)
 
         if hasattr(self, "wrk"):
             self.kubectl.delete_job(label="job=workload", namespace=self.namespace)
@@ -22,6 +22,7 @@ class Application:
         self.helm_deploy = True
         self.helm_configs = {}
         self.k8s_deploy_path = None
+        self._app_json = None
         self.logger = logging.getLogger("all.application")
         self.logger.propagate = True
         self.logger.setLevel(logging.DEBUG)
@@ -31,13 +32,13 @@ class Application:
 
         # NOTE: override this method to load additional attributes!
         """
-        with open(self.config_file) as file:
-            metadata = json.load(file)
+        metadata = self.get_app_json()
 
         self.name = metadata["Name"]
         self.namespace = metadata["Namespace"]
         if "Helm Config" in metadata:
-            self.helm_configs = metadata["Helm Config"]
+            # Copied so resolving chart_path below doesn't rewrite the cached metadata.
+            self.helm_configs = dict(metadata["Helm Config"])
             chart_path = self.helm_configs.get("chart_path")
 
             if chart_path and not self.helm_configs.get("remote_chart", False):
@@ -53,12 +54,15 @@ class Application:
     def get_app_json(self) -> dict:
         """Get application metadata in JSON format.
 
+        The metadata file is parsed once per instance and the same dict is returned afterwards.
+
         Returns:
             dict: application metadata
         """
-        with open(self.config_file) as file:
-            app_json = json.load(file)
-        return app_json
+        if self._app_json is None:
+            with open(self.config_file) as file:
+                self._app_json = json.load(file)
+        return self._app_json
 
     def get_app_summary(self) -> str:
         """Get a summary of the application metadata in string format.
@@ -80,15 +84,12 @@ class Application:
 
     def create_namespace(self):
         """Create the namespace for the application if it doesn't exist."""
-        result = self.kubectl.exec_command(f"kubectl get namespace {self.namespace}")
-        if "notfound" in result.lower():
-            self.logger.info(f"Namespace {self.namespace} not found. Creating namespace.")
-            create_namespace_command = f"kubectl create namespace {self.namespace}"
-            create_result = self.kubectl.exec_command(create_namespace_command)
-            self.logger.info(f"Namespace {self.namespace} created successfully: {create_result}")
-        else:
-            self.logger.info(f"Namespace {self.namespace} already exists.")
+        # Decided on the API's 404 status rather than by scanning `kubectl get` output for "notfound".
+        self.kubectl.create_namespace_if_not_exist(self.namespace)
 
     def cleanup(self):
-        """Delete the entire namespace for the application."""
-        self.kubectl.delete_namespace(self.namespace)
+        """Delete the entire namespace for the application.
+
+        The delete is not awaited: ``create_namespace`` waits out a Terminating namespace on the next deploy.
+        """
+        self.kubectl.delete_namespace(self.namespace, wait=False)
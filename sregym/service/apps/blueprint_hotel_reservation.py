@@ -12,7 +12,7 @@ logger.setLevel(logging.DEBUG)
 class BlueprintHotelReservation(Application):
     def __init__(self):
         super().__init__(BLUEPRINT_HOTEL_RES_METADATA)
-        self.kubectl = KubeCtl()
+        self.kubectl = KubeCtl.instance()
         self.script_dir = FAULT_SCRIPTS
         self.helm_deploy = False
 
@@ -39,10 +39,12 @@ class BlueprintHotelReservation(Application):
         self.kubectl.delete_configs(self.namespace, self.k8s_workload_job_path)
 
     def cleanup(self):
-        """Delete the entire namespace for the hotel reservation application."""
-        self.kubectl.delete_namespace(self.namespace)
-        self.kubectl.wait_for_namespace_deletion(self.namespace)
-        self.kubectl.delete_job(label="job=workload", namespace=self.namespace)
+        """Delete the entire namespace for the hotel reservation application.
+
+        The delete is not awaited (``create_namespace`` waits out a Terminating namespace on the next deploy),
+        and the workload job goes with the namespace.
+        """
+        self.kubectl.delete_namespace(self.namespace, wait=False)
 
     # helper methods
     def _read_script(self, file_path: str) -> str:
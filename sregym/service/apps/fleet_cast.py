@@ -4,6 +4,7 @@ import json
 import os
 import subprocess
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 from sregym.generators.workload.locust import LocustWorkloadManager
 from sregym.observer import tidb_prometheus
@@ -19,8 +20,7 @@ class FleetCast(Application):
     def __init__(self):
         super().__init__(FLEET_CAST_METADATA)
         self.load_app_json()
-        self.kubectl = KubeCtl()
-        self.create_namespace()
+        self.kubectl = KubeCtl.instance()
 
     def _sh(self, cmd: str, check: bool = True, capture: bool = False) -> str:
         """Run a shell command; supports capture."""
@@ -69,27 +69,15 @@ class FleetCast(Application):
                 "--set controller.publishService.enabled=true"
             )
 
-        print("[ingress] waiting for controller to be Running…")
-        for _ in range(60):
-            try:
-                phase = (
-                    self._sh(
-                        "kubectl -n ingress-nginx get pods "
-                        "-l app.kubernetes.io/name=ingress-nginx,app.kubernetes.io/component=controller "
-                        "-o jsonpath='{.items[0].status.phase}'",
-                        capture=True,
-                    )
-                    .strip()
-                    .strip("'")
-                )
-                if phase == "Running":
-                    print("[ingress] controller Running.")
-                    break
-            except Exception:
-                pass
-            time.sleep(2)
-        else:
+        print("[ingress] waiting for controller to be Ready…")
+        if not self.kubectl.wait_for_pods_ready(
+            "ingress-nginx",
+            "app.kubernetes.io/name=ingress-nginx,app.kubernetes.io/component=controller",
+            count=1,
+            timeout=120,
+        ):
             raise RuntimeError("ingress-nginx controller did not become Ready in time.")
+        print("[ingress] controller Ready.")
 
         print("[ingress] waiting for admission webhook to be ready…")
         for _ in range(60):
@@ -112,10 +100,15 @@ class FleetCast(Application):
         """Deploy TiDB, then install FleetCast chart from repo with Ingress enabled on the first install."""
         self.kubectl.create_namespace_if_not_exist(self.namespace)
 
-        self.ensure_ingress_controller()
-
+        # The ingress controller and the TiDB cluster don't depend on each other; bring them up concurrently.
         print("Deploying TiDB Cluster with Operator...")
-        TiDBClusterDeployHelper.running_cluster()
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [
+                executor.submit(self.ensure_ingress_controller),
+                executor.submit(TiDBClusterDeployHelper.running_cluster),
+            ]
+            for future in futures:
+                future.result()
         print("---DEPLOYED TiDB CLUSTER---")
 
         Helm.add_repo("fleetcast", "https://yimingsu01.github.io/FleetCast")
@@ -277,11 +270,11 @@ class FleetCast(Application):
         """Delete the Helm configurations."""
         Helm.uninstall(**self.helm_configs)
         self.kubectl.delete_namespace(self.helm_configs["namespace"])
-        self.kubectl.wait_for_namespace_deletion(self.namespace)
 
     def cleanup(self):
         Helm.uninstall(**self.helm_configs)
-        self.kubectl.delete_namespace(self.helm_configs["namespace"])
+        # Don't block on finalizers; the next deploy's namespace creation waits if it collides.
+        self.kubectl.delete_namespace(self.helm_configs["namespace"], wait=False)
         if hasattr(self, "wrk"):
             self.wrk.stop()
 
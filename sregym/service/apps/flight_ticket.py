@@ -1,7 +1,5 @@
 """Interface to the Flight Ticket application"""
 
-import time
-
 from sregym.paths import FLIGHT_TICKET_METADATA
 from sregym.service.apps.base import Application
 from sregym.service.helm import Helm
@@ -12,7 +10,7 @@ class FlightTicket(Application):
     def __init__(self):
         super().__init__(FLIGHT_TICKET_METADATA)
         self.load_app_json()
-        self.kubectl = KubeCtl()
+        self.kubectl = KubeCtl.instance()
         self.create_namespace()
 
     def load_app_json(self):
@@ -37,11 +35,12 @@ class FlightTicket(Application):
         """Delete the Helm configurations."""
         # NOTE: We should probably clear redis?
         Helm.uninstall(**self.helm_configs)
-        time.sleep(30)
+        # Return as soon as the release's pods are gone rather than always sleeping out the full 30s.
+        self.kubectl.wait_for_pods_deleted(self.helm_configs["namespace"], timeout=30)
 
     def cleanup(self):
         Helm.uninstall(**self.helm_configs)
-        self.kubectl.delete_namespace(self.helm_configs["namespace"])
+        self.kubectl.delete_namespace(self.helm_configs["namespace"], wait=False)
 
 
 # if __name__ == "__main__":
@@ -28,7 +28,7 @@ class HotelReservation(Application):
         deployment_env_overrides: dict[str, dict[str, dict[str, str]]] | None = None,
     ):
         super().__init__(HOTEL_RES_METADATA)
-        self.kubectl = KubeCtl()
+        self.kubectl = KubeCtl.instance()
         self.script_dir = FAULT_SCRIPTS
         self.helm_deploy = False
         self.mount_failure_scripts = mount_failure_scripts
@@ -62,6 +62,12 @@ class HotelReservation(Application):
         "remove-mitigate-admin-geo-mongo.sh",
     ]
 
+    # MongoDB Deployment -> failure-admin configmap mounted at /scripts when mount_failure_scripts is set.
+    FAILURE_SCRIPT_MOUNTS = {
+        "mongodb-geo": "failure-admin-geo",
+        "mongodb-rate": "failure-admin-rate",
+    }
+
     def create_configmaps(self):
         """Create configmaps for the hotel reservation application.
 
@@ -112,38 +118,29 @@ class HotelReservation(Application):
         except Exception as e:
             logger.warning(f"Best-effort clearing of failure configmaps failed: {e}")
 
-    def _patch_mongo_failure_script_mounts(self):
-        """Patch mongodb-geo and mongodb-rate deployments to mount failure configmaps at /scripts.
-
-        Uses JSON patch (append-only) to add the volume and volumeMount without
-        needing to re-specify existing volumes — safer if the YAML changes.
-        """
-        patches = [
-            ("mongodb-geo", "failure-admin-geo"),
-            ("mongodb-rate", "failure-admin-rate"),
-        ]
-        for deployment_name, configmap_name in patches:
-            patch_cmd = (
-                f"kubectl patch deployment {deployment_name} -n {self.namespace} --type=json -p="
-                "'["
-                f'{{"op":"add","path":"/spec/template/spec/volumes/-",'
-                f'"value":{{"name":"failure-script","configMap":{{"name":"{configmap_name}"}}}}}}'
-                f',{{"op":"add","path":"/spec/template/spec/containers/0/volumeMounts/-",'
-                f'"value":{{"name":"failure-script","mountPath":"/scripts"}}}}'
-                "]'"
-            )
-            self.kubectl.exec_command(patch_cmd)
+    @staticmethod
+    def _add_failure_script_mount(deployment: dict, configmap_name: str):
+        """Mount ``configmap_name`` at /scripts in the first container of a Deployment manifest."""
+        pod_spec = deployment["spec"]["template"]["spec"]
+        pod_spec.setdefault("volumes", []).append({"name": "failure-script", "configMap": {"name": configmap_name}})
+        pod_spec["containers"][0].setdefault("volumeMounts", []).append(
+            {"name": "failure-script", "mountPath": "/scripts"}
+        )
 
     @contextlib.contextmanager
-    def _rendered_deployment_configs(self) -> Iterator[Path]:
+    def _rendered_deployment_configs(self, mount_failure_scripts: bool = False) -> Iterator[Path]:
         """Render problem-specific env values before Kubernetes sees a Deployment.
 
         Most problems use the application manifests unchanged. A problem that
         needs a different, initially healthy runtime policy can provide exact
         Deployment/container overrides. Rendering a temporary manifest tree
         avoids a setup rollout and its misleading ReplicaSet history.
+
+        With ``mount_failure_scripts`` the failure-admin configmaps are mounted
+        into the MongoDB Deployments here too, so the whole app goes out in one
+        apply instead of being patched (and rolled out again) afterwards.
         """
-        if not self.deployment_env_overrides:
+        if not self.deployment_env_overrides and not mount_failure_scripts:
             yield Path(self.k8s_deploy_path)
             return
 
@@ -165,6 +162,9 @@ class HotelReservation(Application):
                     if not isinstance(document, dict) or document.get("kind") != "Deployment":
                         continue
                     deployment_name = document.get("metadata", {}).get("name")
+                    if mount_failure_scripts and deployment_name in self.FAILURE_SCRIPT_MOUNTS:
+                        self._add_failure_script_mount(document, self.FAILURE_SCRIPT_MOUNTS[deployment_name])
+                        changed = True
                     container_overrides = self.deployment_env_overrides.get(deployment_name)
                     if not container_overrides:
                         continue
@@ -200,11 +200,10 @@ class HotelReservation(Application):
         self.logger.info(f"Deploying Kubernetes configurations in namespace: {self.namespace}")
         self.create_namespace()
         self.create_configmaps()
-        with self._rendered_deployment_configs() as config_path:
-            self.kubectl.apply_configs(self.namespace, config_path)
         if self.mount_failure_scripts:
             self.populate_failure_configmaps()
-            self._patch_mongo_failure_script_mounts()
+        with self._rendered_deployment_configs(mount_failure_scripts=self.mount_failure_scripts) as config_path:
+            self.kubectl.apply_configs(self.namespace, config_path)
         self.kubectl.wait_for_ready(self.namespace)
 
     def delete(self):
@@ -214,8 +213,6 @@ class HotelReservation(Application):
     def cleanup(self):
         """Delete the entire namespace for the hotel reservation application."""
         self.kubectl.delete_namespace(self.namespace)
-
-        self.kubectl.wait_for_namespace_deletion(self.namespace)
         pvs = self.kubectl.exec_command(
             "kubectl get pv --no-headers | grep 'hotel-reservation' | awk '{print $1}'"
         ).splitlines()
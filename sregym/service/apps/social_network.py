@@ -2,6 +2,8 @@
 
 import logging
 
+from kubernetes.client.rest import ApiException
+
 from sregym.generators.workload.wrk2 import Wrk2, Wrk2WorkloadManager
 from sregym.paths import SOCIAL_NETWORK_METADATA, TARGET_MICROSERVICES
 from sregym.service.apps.base import Application
@@ -18,7 +20,7 @@ class SocialNetwork(Application):
     def __init__(self):
         super().__init__(SOCIAL_NETWORK_METADATA)
         self.load_app_json()
-        self.kubectl = KubeCtl()
+        self.kubectl = KubeCtl.instance()
         self.local_tls_path = TARGET_MICROSERVICES / "socialNetwork/helm-chart/socialnetwork"
 
         self.payload_script = TARGET_MICROSERVICES / "socialNetwork/wrk2/scripts/social-network/mixed-workload.lua"
@@ -33,14 +35,13 @@ class SocialNetwork(Application):
 
     def create_tls_secret(self):
         """Create TLS secret for MongoDB if it doesn't exist."""
-        check_sec = f"kubectl get secret mongodb-tls -n {self.namespace}"
-        result = self.kubectl.exec_command(check_sec)
-        result_lower = result.lower()
-
-        # Secret exists if we got a successful response (contains secret name without error)
-        if "mongodb-tls" in result and "error" not in result_lower:
+        try:
+            self.kubectl.core_v1_api.read_namespaced_secret("mongodb-tls", self.namespace)
             logger.debug("TLS secret already exists. Skipping creation.")
             return
+        except ApiException as e:
+            if e.status != 404:
+                raise
 
         create_sec_command = (
             f"kubectl create secret generic mongodb-tls "
@@ -89,7 +90,7 @@ class SocialNetwork(Application):
         if hasattr(self, "wrk"):
             # self.wrk.stop()
             self.kubectl.delete_job(label="job=workload", namespace=self.namespace)
-        self.kubectl.delete_namespace(self.namespace)
+        self.kubectl.delete_namespace(self.namespace, wait=False)
 
     def create_workload(
         self, rate: int = 100, dist: str = "exp", connections: int = 3, duration: int = 10, threads: int = 3
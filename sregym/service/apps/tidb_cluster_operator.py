@@ -1,19 +1,38 @@
+import concurrent.futures
+import hashlib
 import json
+import logging
 import os
 import subprocess
 import time
 from pathlib import Path
 from textwrap import dedent
 
-from sregym.paths import BASE_DIR
+from sregym.paths import TARGET_MICROSERVICES
 from sregym.service.helm import Helm
+from sregym.service.kubectl import KubeCtl
+from sregym.utils.cache import cached_manifest_path
+
+logger = logging.getLogger("all.sregym.tidb_cluster_operator")
+logger.propagate = True
+logger.setLevel(logging.DEBUG)
+
+FLEET_CAST_DIR = TARGET_MICROSERVICES / "FleetCast"
+TIDB_OPERATOR_VALUES_FILE = FLEET_CAST_DIR / "tidb-operator" / "values.yaml"
+TIDB_CLUSTER_FILE = FLEET_CAST_DIR / "tidb-operator" / "tidb-cluster.yaml"
+PROMETHEUS_CONFIG_FILE = FLEET_CAST_DIR / "prometheus" / "prometheus.yaml"
 
 
 class TiDBClusterDeployer:
+    CRD_HASH_ANNOTATION = "sregym/manifest-sha256"
+    TIDB_CLUSTER_CRD = "tidbclusters.pingcap.com"
+
     def __init__(self, metadata_path):
         with open(metadata_path) as f:
             self.metadata = json.load(f)
 
+        self.kubectl = KubeCtl.instance()
+
         self.name = self.metadata["Name"]
         self.namespace_tidb_cluster = self.metadata["K8S Config"]["namespace"]
         self.cluster_config_url = self.metadata["K8S Config"]["config_url"]
@@ -28,44 +47,49 @@ class TiDBClusterDeployer:
         self.operator_values_path = ""
         if env_path and Path(env_path).expanduser().exists():
             self.operator_values_path = str(Path(env_path).expanduser().resolve())
+        elif TIDB_OPERATOR_VALUES_FILE.exists():
+            self.operator_values_path = str(TIDB_OPERATOR_VALUES_FILE.resolve())
+
+        # Prefer local tidb-cluster.yaml over the (cached) remote URL
+        if TIDB_CLUSTER_FILE.exists():
+            self.cluster_config_path = str(TIDB_CLUSTER_FILE.resolve())
         else:
-            repo_root = Path(__file__).resolve().parents[3]
-            candidates = [
-                repo_root / "SREGym-applications/FleetCast/tidb-operator/values.yaml",
-            ]
-            for p in candidates:
-                if p.exists():
-                    self.operator_values_path = str(p.resolve())
-                    break
-
-        # Prefer local tidb-cluster.yaml over remote URL
-        repo_root = Path(__file__).resolve().parents[3]
-        local_cluster_yaml = repo_root / "SREGym-applications/FleetCast/tidb-operator/tidb-cluster.yaml"
-        if local_cluster_yaml.exists():
-            self.cluster_config_path = str(local_cluster_yaml.resolve())
-        else:
-            self.cluster_config_path = self.cluster_config_url
+            self.cluster_config_path = None
 
         self.tidb_service = self.metadata.get("TiDB Service", "basic-tidb")
         self.tidb_port = int(self.metadata.get("TiDB Port", 4000))
         self.tidb_user = self.metadata.get("TiDB User", "root")
 
     def run_cmd(self, cmd):
-        print(f"Running: {cmd}")
+        logger.debug(f"Running: {cmd}")
         subprocess.run(cmd, shell=True, check=True)
 
     def create_namespace(self, ns):
-        self.run_cmd(f"kubectl create ns {ns} --dry-run=client -o yaml | kubectl apply -f -")
+        self.kubectl.create_namespace_if_not_exist(ns)
 
     def install_crds(self):
-        print(f"Installing CRDs from {self.operator_crd_url} ...")
-        self.run_cmd(f"kubectl create -f {self.operator_crd_url} || kubectl replace -f {self.operator_crd_url}")
+        crd_path = cached_manifest_path(self.operator_crd_url)
+        crd_hash = hashlib.sha256(crd_path.read_bytes()).hexdigest()
+
+        # CRDs are cluster-scoped and outlive the namespaces, so skip the apply if this exact manifest is installed.
+        installed_hash = subprocess.run(
+            f"kubectl get crd {self.TIDB_CLUSTER_CRD} "
+            f"-o jsonpath='{{.metadata.annotations.{self.CRD_HASH_ANNOTATION}}}'",
+            shell=True,
+            capture_output=True,
+            text=True,
+        ).stdout.strip()
+        if installed_hash == crd_hash:
+            logger.info("TiDB operator CRDs are current; skipping install.")
+            return
+
+        logger.info(f"Installing CRDs from {self.operator_crd_url} ...")
+        self.run_cmd(f"kubectl create -f {crd_path} || kubectl replace -f {crd_path}")
+        self.run_cmd(f"kubectl annotate -f {crd_path} --overwrite {self.CRD_HASH_ANNOTATION}={crd_hash}")
 
     def apply_prometheus(self):
         ns = "observe"
-        prom_yml_path = BASE_DIR / "SREGym-applications/FleetCast/prometheus/prometheus.yaml"
-
-        prom_yml_path = str(prom_yml_path.resolve())
+        prom_yml_path = str(PROMETHEUS_CONFIG_FILE.resolve())
         if not os.path.isfile(prom_yml_path):
             raise FileNotFoundError(f"prometheus.yaml not found at {prom_yml_path}")
 
@@ -80,32 +104,32 @@ class TiDBClusterDeployer:
             "PF=$!; sleep 1; curl -s -X POST http://127.0.0.1:9090/-/reload >/dev/null; kill $PF || true"
         )
 
-        print(f"[ok] Prometheus config applied from {prom_yml_path}")
+        logger.info(f"Prometheus config applied from {prom_yml_path}")
 
     def install_operator_with_values(self):
-        print(f"Installing/upgrading TiDB Operator via Helm in namespace '{self.operator_namespace}'...")
-        self.create_namespace(self.operator_namespace)
+        # `helm upgrade --install --create-namespace` below creates the operator namespace if needed.
+        logger.info(f"Installing/upgrading TiDB Operator via Helm in namespace '{self.operator_namespace}'...")
 
         # Add pingcap repo with retry logic to handle transient DNS/network issues
         try:
             Helm.add_repo("pingcap", "https://charts.pingcap.org")
         except RuntimeError as e:
-            print(f"[warn] Failed to add pingcap repo after retries: {e}")
-            print("[info] Continuing with cached charts if available")
+            logger.warning(f"Failed to add pingcap repo after retries: {e}")
+            logger.info("Continuing with cached charts if available")
 
         # Update repos with retry logic
         try:
             Helm.repo_update()
         except RuntimeError as e:
-            print(f"[warn] Failed to update helm repos after retries: {e}")
-            print("[info] Continuing with cached charts if available")
+            logger.warning(f"Failed to update helm repos after retries: {e}")
+            logger.info("Continuing with cached charts if available")
 
         values_arg = ""
         if self.operator_values_path:
-            print(f"[info] Using values file: {self.operator_values_path}")
+            logger.info(f"Using values file: {self.operator_values_path}")
             values_arg = f"-f {self.operator_values_path}"
         else:
-            print("[warn] No values.yaml found; installing with chart defaults")
+            logger.warning("No values.yaml found; installing with chart defaults")
 
         self.run_cmd(
             f"helm upgrade --install {self.operator_release_name} {self.operator_chart} "
@@ -113,33 +137,21 @@ class TiDBClusterDeployer:
             f"--create-namespace {values_arg} "
         )
 
-    def wait_for_operator_ready(self):
-        print("Waiting for tidb-controller-manager pod to be running...")
+    def wait_for_operator_ready(self, timeout: int = 120):
+        # Wait on the Ready condition rather than phase=Running, which is reported before containers are ready.
+        # A single pod watch also covers the window before the Helm release has created the pod.
+        logger.info("Waiting for tidb-controller-manager pod to be ready...")
         label = "app.kubernetes.io/component=controller-manager"
-        for _ in range(24):
-            try:
-                status = (
-                    subprocess.check_output(
-                        f"kubectl get pods -n {self.operator_namespace} -l {label} -o jsonpath='{{.items[0].status.phase}}'",
-                        shell=True,
-                    )
-                    .decode()
-                    .strip()
-                )
-                if status == "Running":
-                    print(" tidb-controller-manager pod is running.")
-                    return
-            except subprocess.CalledProcessError:
-                pass
-            print("-- Pod not ready yet, retrying in 5 seconds...")
-            time.sleep(5)
-        raise RuntimeError("--------Timeout waiting for tidb-controller-manager pod")
+        if not self.kubectl.wait_for_pods_ready(self.operator_namespace, label, timeout=timeout):
+            raise RuntimeError("--------Timeout waiting for tidb-controller-manager pod")
+        logger.info("tidb-controller-manager pod is ready.")
 
     def deploy_tidb_cluster(self):
-        print(f"Creating TiDB cluster namespace '{self.namespace_tidb_cluster}'...")
+        logger.info(f"Creating TiDB cluster namespace '{self.namespace_tidb_cluster}'...")
         self.create_namespace(self.namespace_tidb_cluster)
-        print(f"Deploying TiDB cluster manifest from {self.cluster_config_path}...")
-        self.run_cmd(f"kubectl apply -f {self.cluster_config_path} -n {self.namespace_tidb_cluster}")
+        cluster_config_path = self.cluster_config_path or cached_manifest_path(self.cluster_config_url)
+        logger.info(f"Deploying TiDB cluster manifest from {cluster_config_path}...")
+        self.run_cmd(f"kubectl apply -f {cluster_config_path} -n {self.namespace_tidb_cluster}")
 
     def run_sql(self, sql_text: str):
         ns = self.namespace_tidb_cluster
@@ -147,23 +159,21 @@ class TiDBClusterDeployer:
         port = self.tidb_port
         user = self.tidb_user
 
-        self.run_cmd(f"kubectl -n {ns} delete pod/mysql-client --ignore-not-found")
-        self.run_cmd(
-            f"kubectl -n {ns} run mysql-client --image=mysql:8 --restart=Never --command -- sleep 3600 || true"
-        )
-        self.run_cmd(f"kubectl -n {ns} wait --for=condition=Ready pod/mysql-client --timeout=180s")
-
-        sql = dedent(sql_text).strip()
-        heredoc = f"""kubectl -n {ns} exec -i mysql-client -- bash -lc "cat <<'SQL' | mysql -h {svc} -P {port} -u{user}
-{sql}
-SQL"
-"""
-        self.run_cmd(heredoc)
+        # Clear a client pod left behind by an interrupted run, otherwise `kubectl run` fails on the name.
+        # Usually there is none, so look it up first rather than spawning a delete that finds nothing.
+        if self.kubectl.core_v1_api.list_namespaced_pod(ns, field_selector="metadata.name=mysql-client").items:
+            self.run_cmd(f"kubectl -n {ns} delete pod/mysql-client --ignore-not-found")
 
-        self.run_cmd(f"kubectl -n {ns} delete pod/mysql-client --wait=false || true")
+        # One short-lived client: the SQL goes in on stdin and --rm deletes the pod once mysql exits.
+        cmd = (
+            f"kubectl -n {ns} run mysql-client --rm -i --restart=Never --image=mysql:8 "
+            f"--pod-running-timeout=180s --command -- mysql -h {svc} -P {port} -u{user}"
+        )
+        logger.debug(f"Running: {cmd}")
+        subprocess.run(cmd, shell=True, check=True, input=dedent(sql_text).strip().encode())
 
     def init_schema_and_seed(self):
-        print("Initializing schema and seeding data in satellite_sim ...")
+        logger.info("Initializing schema and seeding data in satellite_sim ...")
         sql = """
         CREATE DATABASE IF NOT EXISTS satellite_sim;
         USE satellite_sim;
@@ -202,37 +212,15 @@ SQL"
         """
         self.run_sql(sql)
 
-    def wait_for_pods_ready(self, selector: str, poll: float = 1.0, timeout: float = 600):
+    def wait_for_pods_ready(self, selector: str, timeout: float = 600):
         """
-        Poll every `poll` seconds until ALL pods matching `selector` are Ready.
+        Watch pods matching `selector` until ALL of them are Ready.
         Raises RuntimeError if `timeout` seconds elapse without all pods becoming ready.
         """
         ns = self.namespace_tidb_cluster
-        deadline = time.time() + timeout
-        while time.time() < deadline:
-            try:
-                out = subprocess.check_output(
-                    f"kubectl -n {ns} get pods -l '{selector}' "
-                    "-o jsonpath='{range .items[*]}{.metadata.name} "
-                    '{range .status.containerStatuses[*]}{.ready} {end}{"\\n"}{end}\'',
-                    shell=True,
-                ).decode()
-
-                lines = [ln.strip() for ln in out.splitlines() if ln.strip()]
-                if lines:
-                    all_ready = True
-                    for ln in lines:
-                        parts = ln.split()
-                        if not parts or not all(p.lower() == "true" for p in parts[1:]):
-                            all_ready = False
-                            break
-                    if all_ready:
-                        print(f"[ok] All pods with selector '{selector}' are Ready.")
-                        return
-            except subprocess.CalledProcessError:
-                pass
-            time.sleep(poll)
-        raise RuntimeError(f"Timeout ({timeout}s) waiting for pods with selector '{selector}' in namespace '{ns}'")
+        if not self.kubectl.wait_for_pods_ready(ns, selector, timeout=timeout):
+            raise RuntimeError(f"Timeout ({timeout}s) waiting for pods with selector '{selector}' in namespace '{ns}'")
+        logger.info(f"All pods with selector '{selector}' are Ready.")
 
     def wait_for_basic_workloads(self):
         """
@@ -268,7 +256,7 @@ SQL"
         except subprocess.CalledProcessError:
             svc_name = self.tidb_service
 
-        print(f"[info] Using TiDB Service: {svc_name}")
+        logger.info(f"Using TiDB Service: {svc_name}")
         self.tidb_service = svc_name
         deadline = time.time() + 300  # 5 min timeout for endpoints
         while time.time() < deadline:
@@ -284,7 +272,7 @@ SQL"
                     .strip("'")
                 )
                 if eps:
-                    print(f"[ok] Service {svc_name} has endpoints:\n{eps}")
+                    logger.info(f"Service {svc_name} has endpoints:\n{eps}")
                     return
             except subprocess.CalledProcessError:
                 pass
@@ -292,15 +280,21 @@ SQL"
         raise RuntimeError(f"Timeout (300s) waiting for endpoints on service '{svc_name}' in namespace '{ns}'")
 
     def deploy_all(self):
-        print(f"----------Starting deployment: {self.name}")
-        self.create_namespace(self.namespace_tidb_cluster)
-        self.install_crds()
-        self.install_operator_with_values()
+        logger.info(f"Starting deployment: {self.name}")
+        # The CRDs and the operator release don't depend on each other; only the TidbCluster apply below
+        # (which creates its own namespace) needs both, so run them side by side.
+        with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [
+                executor.submit(self.install_crds),
+                executor.submit(self.install_operator_with_values),
+            ]
+            for future in concurrent.futures.as_completed(futures):
+                future.result()
         self.wait_for_operator_ready()
         self.deploy_tidb_cluster()
         self.wait_for_basic_workloads()
         self.init_schema_and_seed()
-        print("-------------TiDB cluster deployment complete.")
+        logger.info("TiDB cluster deployment complete.")
 
 
 if __name__ == "__main__":
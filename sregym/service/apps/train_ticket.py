@@ -1,9 +1,9 @@
 """Interface to the Train Ticket application"""
 
-import os
-import tempfile
 from pathlib import Path
 
+import yaml
+
 from sregym.generators.workload.locust import LocustWorkloadManager
 from sregym.paths import TARGET_MICROSERVICES, TRAIN_TICKET_METADATA
 from sregym.service.apps.base import Application
@@ -15,7 +15,7 @@ class TrainTicket(Application):
     def __init__(self):
         super().__init__(str(TRAIN_TICKET_METADATA))
         self.load_app_json()
-        self.kubectl = KubeCtl()
+        self.kubectl = KubeCtl.instance()
         self.workload_manager = None
 
     def load_app_json(self):
@@ -47,19 +47,12 @@ class TrainTicket(Application):
         # Helm.uninstall(**self.helm_configs) # Don't helm uninstall until cleanup job is fixed on train-ticket
         if self.namespace:
             self.kubectl.delete_namespace(self.namespace)
-        self.kubectl.wait_for_namespace_deletion(self.namespace)
 
     def _is_train_ticket_deployed(self):
         """Check if the train-ticket app is currently deployed."""
         try:
-            # Check if the namespace exists
-            namespace_exists = self.kubectl.exec_command(f"kubectl get namespace {self.namespace}")
-            if "not found" in namespace_exists or "No resources found" in namespace_exists:
-                return False
-
-            # Check if train-ticket deployment exists
-            deployment_exists = self.kubectl.exec_command(f"kubectl get deployment -n {self.namespace}")
-            return not ("No resources found" in deployment_exists or not deployment_exists.strip())
+            # A missing namespace lists as empty, which is reported as not deployed.
+            return self.kubectl.get_namespace_deployment_status(self.namespace)
         except Exception as e:
             print(f"[TrainTicket] Warning: Failed to check deployment status: {e}")
             return False
@@ -93,13 +86,17 @@ class TrainTicket(Application):
         try:
             flagd_templates_path = TARGET_MICROSERVICES / "train-ticket" / "templates"
 
-            if (flagd_templates_path / "flagd-deployment.yaml").exists():
-                result = self.kubectl.exec_command(f"kubectl apply -f {flagd_templates_path / 'flagd-deployment.yaml'}")
-                print(f"[TrainTicket] Deployed flagd service: {result}")
+            manifests = [
+                flagd_templates_path / name
+                for name in ("flagd-deployment.yaml", "flagd-config.yaml")
+                if (flagd_templates_path / name).exists()
+            ]
 
-            if (flagd_templates_path / "flagd-config.yaml").exists():
-                result = self.kubectl.exec_command(f"kubectl apply -f {flagd_templates_path / 'flagd-config.yaml'}")
-                print(f"[TrainTicket] Deployed flagd ConfigMap: {result}")
+            # One apply for all manifests: a single kubectl process and discovery round-trip.
+            if manifests:
+                file_args = " ".join(f"-f {path}" for path in manifests)
+                result = self.kubectl.exec_command(f"kubectl apply {file_args}")
+                print(f"[TrainTicket] Deployed flagd service and ConfigMap: {result}")
 
             print("[TrainTicket] flagd infrastructure deployed successfully")
 
@@ -108,28 +105,27 @@ class TrainTicket(Application):
 
     def _deploy_load_generator(self):
         try:
-            locustfile_path = Path(__file__).parent.parent.parent / "resources" / "trainticket" / "locustfile.py"
+            resources_path = Path(__file__).parent.parent.parent / "resources" / "trainticket"
+            locustfile_path = resources_path / "locustfile.py"
+            deployment_path = resources_path / "locust-deployment.yaml"
 
+            # The locustfile ConfigMap and the load generator go out in a single apply.
+            documents = []
             if locustfile_path.exists():
-                result = self.kubectl.exec_command(
-                    f"kubectl create configmap locustfile-config --from-file=locustfile.py={locustfile_path} -n {self.namespace} --dry-run=client -o yaml | kubectl apply -f -"
+                documents.append(
+                    {
+                        "apiVersion": "v1",
+                        "kind": "ConfigMap",
+                        "metadata": {"name": "locustfile-config", "namespace": self.namespace},
+                        "data": {"locustfile.py": locustfile_path.read_text()},
+                    }
                 )
-                print(f"[TrainTicket] Created ConfigMap from file: {result}")
-
-            deployment_path = (
-                Path(__file__).parent.parent.parent / "resources" / "trainticket" / "locust-deployment.yaml"
-            )
-
             if deployment_path.exists():
                 with open(deployment_path) as f:
-                    content = f.read()
-
-                with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as tmp:
-                    tmp.write(content)
-                    temp_path = tmp.name
+                    documents.extend(doc for doc in yaml.safe_load_all(f) if doc)
 
-                result = self.kubectl.exec_command(f"kubectl apply -f {temp_path}")
-                os.unlink(temp_path)
+            if documents:
+                result = self.kubectl.apply_documents(documents)
                 print(f"[TrainTicket] Deployed load generator: {result}")
 
             print("[TrainTicket] Load generator deployed with auto-start")
@@ -208,13 +208,19 @@ class ClusterStateManager:
         # 1. Delete unexpected namespaces
         current_namespaces = self._get_namespaces()
         unexpected_namespaces = current_namespaces - self.baseline.namespaces - PROTECTED_NAMESPACES
+        # Issue every delete first and wait afterwards, so the namespaces' finalizers run concurrently.
         for ns in unexpected_namespaces:
             logger.info(f"Deleting unexpected namespace: {ns}")
             try:
-                self.kubectl.delete_namespace(ns)
+                self.kubectl.delete_namespace(ns, wait=False)
                 changes["namespaces_deleted"].append(ns)
             except Exception as e:
                 logger.warning(f"Failed to delete namespace {ns}: {e}")
+        for ns in changes["namespaces_deleted"]:
+            try:
+                self.kubectl.wait_for_namespace_deletion(ns)
+            except Exception as e:
+                logger.warning(f"Namespace {ns} did not finish deleting: {e}")
 
         # 2. Delete unexpected ClusterRoles
         current_cluster_roles = self._get_cluster_roles()
@@ -2,6 +2,7 @@
 
 import logging
 import subprocess
+import threading
 import time
 
 from sregym.service.kubectl import KubeCtl
@@ -10,6 +11,12 @@ logger = logging.getLogger("all.infra.helm")
 logger.propagate = True
 logger.setLevel(logging.DEBUG)
 
+# Repos added by this process (name -> url) and whether the local index already
+# reflects all of them, so repeated deploys skip redundant helm round-trips.
+_added_repos: dict[str, str] = {}
+_repos_updated = False
+_repo_lock = threading.Lock()
+
 
 class Helm:
     @staticmethod
@@ -141,7 +148,7 @@ class Helm:
         Raises:
             Exception: If not deployed
         """
-        kubectl = KubeCtl()
+        kubectl = KubeCtl.instance()
         try:
             kubectl.wait_for_ready(namespace)
         except Exception as e:
@@ -220,6 +227,13 @@ class Helm:
         Raises:
             RuntimeError: If all retry attempts fail
         """
+        global _repos_updated
+
+        with _repo_lock:
+            if _added_repos.get(name) == url:
+                logger.debug(f"Helm repo {name} already added in this process, skipping")
+                return
+
         logger.info(f"Helm Repo Add: {name} with url {url}")
         command = f"helm repo add {name} {url}"
 
@@ -234,6 +248,9 @@ class Helm:
             # Success if returncode is 0 or if "already exists" in output
             if process.returncode == 0 or "already exists" in stderr or "already exists" in stdout:
                 logger.info(f"Helm repo {name} added successfully: {stdout}")
+                with _repo_lock:
+                    _added_repos[name] = url
+                    _repos_updated = False
                 return
 
             if attempt < max_retries - 1:
@@ -267,6 +284,13 @@ class Helm:
         Raises:
             RuntimeError: If all retry attempts fail
         """
+        global _repos_updated
+
+        with _repo_lock:
+            if _repos_updated:
+                logger.debug("Helm repos already updated in this process, skipping")
+                return
+
         logger.info("Helm Repo Update with retry logic")
         command = "helm repo update"
 
@@ -277,6 +301,8 @@ class Helm:
             if process.returncode == 0:
                 logger.info(f"Helm repo update successful on attempt {attempt + 1}")
                 logger.debug(output.decode("utf-8"))
+                with _repo_lock:
+                    _repos_updated = True
                 return
 
             # Log the error but continue retrying
@@ -190,7 +190,8 @@ class KubernetesAPIProxy:
             """HTTP request handler that proxies and filters Kubernetes API responses."""
 
             def log_message(self, format, *args):
-                logger.debug(f"Proxy: {format % args}")
+                # Called once per proxied request; let logging skip the formatting when DEBUG is off.
+                logger.debug("Proxy: " + format, *args)
 
             def _get_upstream_connection(self):
                 """Create HTTPS connection to upstream Kubernetes API."""
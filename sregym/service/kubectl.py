@@ -3,7 +3,9 @@
 import contextlib
 import json
 import logging
+import re
 import subprocess
+import threading
 import time
 
 logger = logging.getLogger("all.infra.kubectl")
@@ -17,16 +19,38 @@ except ModuleNotFoundError:
     exit(1)
 import os  # noqa: E402
 
-from kubernetes import dynamic  # noqa: E402
-from kubernetes.client import api_client  # noqa: E402
+import yaml  # noqa: E402
+from kubernetes import dynamic, watch  # noqa: E402
 from kubernetes.client.rest import ApiException  # noqa: E402
 
 from logger import console  # noqa: E402
 
 WAIT_FOR_POD_READY_TIMEOUT = int(os.getenv("WAIT_FOR_POD_READY_TIMEOUT", "600"))
+WATCH_RECONNECT_INTERVAL = 60
 
 
 class KubeCtl:
+    FIELD_MANAGER = "sregym"
+    # resourceVersion "0" lets the apiserver answer from its watch cache instead of a quorum read
+    # from etcd. Only use it for node facts that do not change while a problem runs (runtime,
+    # architecture, capacity, provider); the result may lag the latest write slightly.
+    CACHED_RESOURCE_VERSION = "0"
+
+    _instance = None
+    _instance_lock = threading.Lock()
+
+    @classmethod
+    def instance(cls) -> "KubeCtl":
+        """Return a process-wide shared KubeCtl, created on first use.
+
+        Avoids re-parsing the kubeconfig and rebuilding API clients for every app/problem/injector.
+        """
+        if cls._instance is None:
+            with cls._instance_lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
     def __init__(self):
         """Initialize the KubeCtl object and load the Kubernetes configuration."""
         try:
@@ -34,8 +58,12 @@ class KubeCtl:
         except Exception:
             logger.error("Missing kubeconfig. Please set up a cluster.")
             exit(1)
-        self.core_v1_api = client.CoreV1Api()
-        self.apps_v1_api = client.AppsV1Api()
+        # One ApiClient (and so one connection pool) behind every typed API, so requests reuse open connections.
+        self.api_client = client.ApiClient()
+        self.core_v1_api = client.CoreV1Api(self.api_client)
+        self.apps_v1_api = client.AppsV1Api(self.api_client)
+        self.batch_v1_api = client.BatchV1Api(self.api_client)
+        self.custom_api = client.CustomObjectsApi(self.api_client)
 
     def list_namespaces(self):
         """Return a list of all namespaces in the cluster."""
@@ -87,7 +115,7 @@ class KubeCtl:
         Retrieve the container runtime used by the cluster.
         If the cluster uses multiple container runtimes, the first one found will be returned.
         """
-        for node in self.core_v1_api.list_node().items:
+        for node in self.core_v1_api.list_node(resource_version=self.CACHED_RESOURCE_VERSION).items:
             for status in node.status.conditions:
                 if status.type == "Ready" and status.status == "True":
                     return node.status.node_info.container_runtime_version
@@ -97,10 +125,40 @@ class KubeCtl:
         pod_info = self.core_v1_api.list_namespaced_pod(namespace, label_selector=label_selector)
         return pod_info.items[0].metadata.name
 
+    def has_running_pod(self, namespace: str, label_selector: str) -> bool:
+        """Return whether at least one pod matching ``label_selector`` is in the Running phase."""
+        try:
+            pods = self.core_v1_api.list_namespaced_pod(
+                namespace, label_selector=label_selector, field_selector="status.phase=Running", limit=1
+            )
+        except ApiException as e:
+            logger.warning("Could not list pods in '%s' with selector '%s': %s", namespace, label_selector, e)
+            return False
+        return bool(pods.items)
+
     def get_pod_logs(self, pod_name, namespace):
         """Retrieve the logs of a specified pod within a namespace."""
         return self.core_v1_api.read_namespaced_pod_log(pod_name, namespace)
 
+    def find_pod_log_line(self, pod_name, namespace, prefix: str) -> str | None:
+        """Return the first log line of a pod that starts with `prefix`, or None if there is none.
+
+        The log is streamed and the read stops at the match, so a long (or still growing) log is never buffered whole.
+        """
+        response = self.core_v1_api.read_namespaced_pod_log(pod_name, namespace, _preload_content=False)
+        try:
+            pending = b""
+            for chunk in response.stream(4096):
+                *lines, pending = (pending + chunk).split(b"\n")
+                for line in lines:
+                    text = line.decode(errors="replace").strip()
+                    if text.startswith(prefix):
+                        return text
+            text = pending.decode(errors="replace").strip()
+            return text if text.startswith(prefix) else None
+        finally:
+            response.release_conn()
+
     def get_service_json(self, service_name, namespace, deserialize=True):
         """Retrieve the JSON description of a specified service within a namespace."""
         command = f"kubectl get service {service_name} -n {namespace} -o json"
@@ -119,7 +177,7 @@ class KubeCtl:
             return len(deployed_services.items) > 0
         except ApiException as e:
             if e.status == 404:
-                logger.warning(f"Namespace {namespace} doesn't exist.")
+                logger.warning("Namespace %s doesn't exist.", namespace)
                 return False
             else:
                 raise e
@@ -137,7 +195,7 @@ class KubeCtl:
 
     def get_service(self, name: str, namespace: str):
         """Fetch the service configuration."""
-        return client.CoreV1Api().read_namespaced_service(name=name, namespace=namespace)
+        return self.core_v1_api.read_namespaced_service(name=name, namespace=namespace)
 
     @staticmethod
     def _is_completed_job_pod(pod) -> bool:
@@ -161,11 +219,14 @@ class KubeCtl:
     ):
         """Wait for pods to be in a Ready state.
 
+        All selected pods are followed on one pod watch, so this returns on the event that makes
+        the last one ready rather than on the next poll.
+
         Args:
             namespace: The namespace to check
             service_names: If provided (str or list), only wait for pods belonging to these services.
                            If None, wait for all pods in the namespace.
-            sleep: Seconds between checks
+            sleep: Seconds to back off after an API error before watching again
             max_wait: Maximum seconds to wait
         """
 
@@ -178,13 +239,33 @@ class KubeCtl:
             services = service_names
 
         # Build label selectors from services
-        label_selectors = []
+        selectors = []
         for svc_name in services:
             svc = self.get_service(svc_name, namespace)
             selector_dict = svc.spec.selector or {}
             if not selector_dict:
                 raise ValueError(f"Service '{svc_name}' has no selector defined")
-            label_selectors.append(",".join(f"{k}={v}" for k, v in selector_dict.items()))
+            selectors.append(selector_dict)
+
+        # A single service's selector is applied server-side; several are matched against the namespace's pods.
+        label_selector = ",".join(f"{k}={v}" for k, v in selectors[0].items()) if len(selectors) == 1 else None
+
+        def selected(pod) -> bool:
+            labels = pod.metadata.labels or {}
+            return not selectors or any(all(labels.get(k) == v for k, v in sel.items()) for sel in selectors)
+
+        def all_ready(pods) -> bool:
+            selected_pods = [pod for pod in pods.values() if selected(pod)]
+            return bool(selected_pods) and all(
+                # Completed Job pods (e.g. k3s's helm-install-* pods in
+                # kube-system) finish "Succeeded" with terminated, never-ready
+                # containers — they're done, not pending — so don't block on
+                # them. Scoped to Job-owned pods so a stray Succeeded pod (or
+                # any Failed pod) still has to be accounted for.
+                self._is_completed_job_pod(pod)
+                or (pod.status.container_statuses and all(cs.ready for cs in pod.status.container_statuses))
+                for pod in selected_pods
+            )
 
         if services:
             display_name = f"services {services}" if len(services) > 1 else f"service '{services[0]}'"
@@ -193,62 +274,62 @@ class KubeCtl:
 
         console.log(f"[bold yellow]Waiting for all pods in {display_name} to be ready...")
 
-        wait = 0
-
-        while wait < max_wait:
+        deadline = time.monotonic() + max_wait
+        while (remaining := deadline - time.monotonic()) > 0:
             try:
-                if label_selectors:
-                    # Collect pods from all services
-                    all_pods = []
-                    for selector in label_selectors:
-                        pod_list = self.core_v1_api.list_namespaced_pod(namespace=namespace, label_selector=selector)
-                        all_pods.extend(pod_list.items)
-                else:
-                    all_pods = self.list_pods(namespace).items or []
-
-                if all_pods:
-                    ready_pods = [
-                        pod
-                        for pod in all_pods
-                        # Completed Job pods (e.g. k3s's helm-install-* pods in
-                        # kube-system) finish "Succeeded" with terminated, never-ready
-                        # containers — they're done, not pending — so don't block on
-                        # them. Scoped to Job-owned pods so a stray Succeeded pod (or
-                        # any Failed pod) still has to be accounted for.
-                        if self._is_completed_job_pod(pod)
-                        or (pod.status.container_statuses and all(cs.ready for cs in pod.status.container_statuses))
-                    ]
-
-                    if len(ready_pods) == len(all_pods):
-                        console.log(f"[bold green]All pods in {display_name} are ready.")
-                        return
-
+                if self._watch_pods(namespace, label_selector, all_ready, max(1, int(remaining))):
+                    console.log(f"[bold green]All pods in {display_name} are ready.")
+                    return
             except Exception as e:
                 console.log(f"[red]Error checking pod statuses: {e}")
-
-            time.sleep(sleep)
-            wait += sleep
+                time.sleep(sleep)
 
         raise Exception(
             f"[red]Timeout: Not all pods in {display_name} reached the Ready state within {max_wait} seconds."
         )
 
-    def wait_for_namespace_deletion(self, namespace, sleep=2, max_wait=300):
-        """Wait for a namespace to be fully deleted before proceeding."""
+    def wait_for_namespace_deletion(self, namespace, max_wait=300):
+        """Wait for a namespace to be fully deleted before proceeding.
+
+        The namespace is watched by name, so this returns on its DELETED event instead of
+        re-reading it on a fixed interval.
+        """
 
         console.log("[bold yellow]Waiting for namespace deletion...")
 
-        wait = 0
+        field_selector = f"metadata.name={namespace}"
 
-        while wait < max_wait:
+        def relist():
+            namespaces = self.core_v1_api.list_namespace(field_selector=field_selector)
+            return not namespaces.items, namespaces.metadata.resource_version
+
+        deleted, resource_version = relist()
+        deadline = time.monotonic() + max_wait
+        while not deleted and (remaining := deadline - time.monotonic()) > 0:
+            w = watch.Watch()
             try:
-                self.core_v1_api.read_namespace(name=namespace)
-            except Exception:
-                console.log(f"[bold green]Namespace '{namespace}' has been deleted.")
-                return
+                for event in w.stream(
+                    self.core_v1_api.list_namespace,
+                    field_selector=field_selector,
+                    resource_version=resource_version,
+                    timeout_seconds=max(1, int(min(remaining, WATCH_RECONNECT_INTERVAL))),
+                ):
+                    if event["type"] == "DELETED":
+                        deleted = True
+                        break
+                    if event["type"] in ("ADDED", "MODIFIED"):
+                        resource_version = event["object"].metadata.resource_version
+            except ApiException as e:
+                if e.status != 410:
+                    raise
+                # The resourceVersion fell out of the watch cache; resync from a fresh list.
+                deleted, resource_version = relist()
+            finally:
+                w.stop()
 
-            time.sleep(sleep)
-            wait += sleep
+        if deleted:
+            console.log(f"[bold green]Namespace '{namespace}' has been deleted.")
+            return
 
         raise Exception(f"[red]Timeout: Namespace '{namespace}' was not deleted within {max_wait} seconds.")
 
@@ -298,9 +379,166 @@ class KubeCtl:
 
         raise Exception(f"[red]Timeout: Namespace '{namespace}' was not deleted within {max_wait} seconds.")
 
+    def get_deployment_label_selector(self, name: str, namespace: str) -> str:
+        """Return the deployment's pod selector as a ``key=value,...`` label selector string."""
+        match_labels = self.get_deployment(name, namespace).spec.selector.match_labels or {}
+        return ",".join(f"{k}={v}" for k, v in match_labels.items())
+
+    def _watch_pods(self, namespace: str, label_selector: str | None, done, timeout: int) -> bool:
+        """Stream pod events until ``done(pods)`` holds, where ``pods`` maps name -> latest V1Pod.
+
+        Returns False if ``timeout`` seconds elapse first; see ``_watch_objects``.
+        """
+        return self._watch_objects(self.core_v1_api.list_namespaced_pod, namespace, label_selector, done, timeout)
+
+    def _watch_objects(self, list_func, namespace: str, label_selector: str | None, done, timeout: int) -> bool:
+        """Stream events from ``list_func`` until ``done(objects)`` holds, where ``objects`` maps name -> latest object.
+
+        The object set is seeded with a list call and the watch resumes from its resourceVersion,
+        so no event between the two is missed. Each watch request is capped at
+        WATCH_RECONNECT_INTERVAL seconds and reopened from the last seen resourceVersion, so a
+        dropped or expired stream costs a reconnect rather than the rest of the timeout.
+        Returns False if ``timeout`` seconds elapse first.
+        """
+
+        def relist():
+            object_list = list_func(namespace, label_selector=label_selector)
+            return {obj.metadata.name: obj for obj in object_list.items}, object_list.metadata.resource_version
+
+        objects, resource_version = relist()
+        if done(objects):
+            return True
+
+        deadline = time.monotonic() + timeout
+        while (remaining := deadline - time.monotonic()) > 0:
+            w = watch.Watch()
+            try:
+                for event in w.stream(
+                    list_func,
+                    namespace=namespace,
+                    label_selector=label_selector,
+                    resource_version=resource_version,
+                    timeout_seconds=max(1, int(min(remaining, WATCH_RECONNECT_INTERVAL))),
+                ):
+                    obj = event["object"]
+                    if event["type"] == "DELETED":
+                        objects.pop(obj.metadata.name, None)
+                    elif event["type"] in ("ADDED", "MODIFIED"):
+                        objects[obj.metadata.name] = obj
+                    else:
+                        continue
+                    resource_version = obj.metadata.resource_version
+                    if done(objects):
+                        return True
+            except ApiException as e:
+                if e.status != 410:
+                    raise
+                # The resourceVersion fell out of the watch cache; resync from a fresh list.
+                objects, resource_version = relist()
+                if done(objects):
+                    return True
+            finally:
+                w.stop()
+        return False
+
+    def wait_for_pods_condition(
+        self, namespace: str, label_selector: str | None, condition, timeout: int = WAIT_FOR_POD_READY_TIMEOUT
+    ) -> bool:
+        """Wait on a single watch stream until ``condition(pods)`` holds.
+
+        ``pods`` maps pod name -> latest V1Pod for the pods matching ``label_selector``.
+        Returns False if the condition is not met within ``timeout`` seconds.
+        """
+        return self._watch_pods(namespace, label_selector, condition, timeout)
+
+    def wait_for_pods_deleted(self, namespace: str, label_selector: str | None = None, timeout: int = 60) -> bool:
+        """Wait until no pods matching ``label_selector`` remain in the namespace.
+
+        Returns as soon as the last pod is gone instead of sleeping a fixed interval;
+        returns False if pods are still present after ``timeout`` seconds.
+        """
+        if self._watch_pods(namespace, label_selector, lambda pods: not pods, timeout):
+            return True
+        logger.warning("Pods matching '%s' in %s still present after %ss", label_selector, namespace, timeout)
+        return False
+
+    @staticmethod
+    def _pod_has_ready_condition(pod) -> bool:
+        return any(cond.type == "Ready" and cond.status == "True" for cond in (pod.status.conditions or []))
+
+    def wait_for_pods_ready(
+        self,
+        namespace: str,
+        label_selector: str | None = None,
+        count: int | None = None,
+        timeout: int = WAIT_FOR_POD_READY_TIMEOUT,
+    ) -> bool:
+        """Wait on a single watch stream until matching pods report the Ready condition.
+
+        If ``count`` is given, return once at least that many matching pods are ready;
+        otherwise wait until every matching pod (and at least one) is ready.
+        Returns False if the condition is not met within ``timeout`` seconds.
+        """
+
+        def done(pods):
+            ready = sum(1 for pod in pods.values() if self._pod_has_ready_condition(pod))
+            if count is not None:
+                return ready >= count
+            return bool(pods) and ready == len(pods)
+
+        if self._watch_pods(namespace, label_selector, done, timeout):
+            return True
+        logger.warning("Pods matching '%s' in %s not ready after %ss", label_selector, namespace, timeout)
+        return False
+
+    @staticmethod
+    def _deployment_rolled_out(deployment) -> bool:
+        """Mirror ``kubectl rollout status``: the latest spec is observed and every replica is updated and available."""
+        status = deployment.status
+        replicas = deployment.spec.replicas if deployment.spec.replicas is not None else 1
+        return (
+            (status.observed_generation or 0) >= (deployment.metadata.generation or 0)
+            and (status.updated_replicas or 0) == replicas
+            and (status.replicas or 0) == replicas
+            and (status.available_replicas or 0) == replicas
+        )
+
+    def wait_for_deployments_rolled_out(self, namespace: str, names: list[str], timeout: int = 300) -> bool:
+        """Wait on one deployment watch until every deployment in ``names`` has finished rolling out.
+
+        Returns False if any is still rolling out (or missing) after ``timeout`` seconds.
+        """
+
+        def done(deployments):
+            return all(name in deployments and self._deployment_rolled_out(deployments[name]) for name in names)
+
+        if self._watch_objects(self.apps_v1_api.list_namespaced_deployment, namespace, None, done, timeout):
+            return True
+        logger.warning("Deployments %s in %s not rolled out after %ss", ", ".join(names), namespace, timeout)
+        return False
+
+    @staticmethod
+    def _pod_is_unschedulable(pod) -> bool:
+        return any(
+            cond.type == "PodScheduled" and cond.status == "False" and cond.reason == "Unschedulable"
+            for cond in (pod.status.conditions or [])
+        )
+
+    def wait_for_pods_unschedulable(self, namespace: str, label_selector: str | None = None, timeout: int = 60) -> bool:
+        """Wait until the scheduler marks any pod matching ``label_selector`` as Unschedulable.
+
+        Returns False if no such pod appears within ``timeout`` seconds.
+        """
+        if self._watch_pods(
+            namespace, label_selector, lambda pods: any(map(self._pod_is_unschedulable, pods.values())), timeout
+        ):
+            return True
+        logger.warning("No unschedulable pod matching '%s' in %s after %ss", label_selector, namespace, timeout)
+        return False
+
     def delete_job(self, job_name: str = None, label: str = None, namespace: str = "default"):
         """Delete a Kubernetes Job."""
-        api_instance = client.BatchV1Api()
+        api_instance = self.batch_v1_api
         try:
             if job_name:
                 api_instance.delete_namespaced_job(
@@ -349,7 +587,7 @@ class KubeCtl:
                 default (proxy-pointed) kubeconfig — useful for the workload oracle which
                 needs to access workload-generator jobs that are hidden from the agent.
         """
-        api_instance = client.BatchV1Api(api_client=api_client) if api_client else client.BatchV1Api()
+        api_instance = client.BatchV1Api(api_client=api_client) if api_client else self.batch_v1_api
         start_time = time.time()
 
         console.log(f"[yellow]Waiting for job '{job_name}' to complete...")
@@ -409,7 +647,7 @@ class KubeCtl:
             api_response = self.core_v1_api.patch_namespaced_service(name, namespace, body)
             return api_response
         except ApiException as e:
-            logger.error(f"Exception when patching service: {e}\n")
+            logger.error("Exception when patching service: %s\n", e)
             return None
 
     def patch_custom_object(self, group, version, namespace, plural, name, body):
@@ -427,8 +665,8 @@ class KubeCtl:
             if e.status == 404:
                 return self.create_new_configmap(name, namespace, data)
             else:
-                logger.error(f"Exception when updating configmap: {e}\n")
-                logger.error(f"Exception status code: {e.status}\n")
+                logger.error("Exception when updating configmap: %s\n", e)
+                logger.error("Exception status code: %s\n", e.status)
                 return None
 
     def create_new_configmap(self, name, namespace, data):
@@ -442,7 +680,7 @@ class KubeCtl:
         try:
             return self.core_v1_api.create_namespaced_config_map(namespace, config_map)
         except ApiException as e:
-            logger.error(f"Exception when creating configmap: {e}\n")
+            logger.error("Exception when creating configmap: %s\n", e)
             return None
 
     def create_or_update_configmap(self, name: str, namespace: str, data: dict):
@@ -452,15 +690,15 @@ class KubeCtl:
             # ConfigMap exists, update it
             existing_configmap.data = data
             self.core_v1_api.replace_namespaced_config_map(name, namespace, existing_configmap)
-            logger.info(f"ConfigMap '{name}' updated in namespace '{namespace}'")
+            logger.info("ConfigMap '%s' updated in namespace '%s'", name, namespace)
         except ApiException as e:
             if e.status == 404:
                 # ConfigMap doesn't exist, create it
                 body = client.V1ConfigMap(metadata=client.V1ObjectMeta(name=name), data=data)
                 self.core_v1_api.create_namespaced_config_map(namespace, body)
-                logger.info(f"ConfigMap '{name}' created in namespace '{namespace}'")
+                logger.info("ConfigMap '%s' created in namespace '%s'", name, namespace)
             else:
-                logger.error(f"Error creating/updating ConfigMap '{name}': {e}")
+                logger.error("Error creating/updating ConfigMap '%s': %s", name, e)
 
     def update_configmap(self, name, namespace, data):
         """Update existing configmap with the provided data."""
@@ -473,39 +711,61 @@ class KubeCtl:
         try:
             return self.core_v1_api.replace_namespaced_config_map(name, namespace, config_map)
         except ApiException as e:
-            logger.error(f"Exception when updating configmap: {e}\n")
+            logger.error("Exception when updating configmap: %s\n", e)
             return
 
     def apply_configs(self, namespace: str, config_path: str):
         """Apply Kubernetes configurations from a specified path to a namespace."""
-        command = f"kubectl apply -Rf {config_path} -n {namespace}"
-        self.exec_command(command)
+        self.run_silent(["apply", "-Rf", str(config_path)], namespace=namespace)
+
+    def apply_documents(self, documents: list[dict], namespace: str | None = None) -> str:
+        """Server-side apply several manifests with one kubectl process.
+
+        The documents are streamed on stdin as one multi-document YAML, so discovery runs once
+        and the merge happens on the API server instead of in a client-side three-way diff.
+        """
+        namespace_arg = f" -n {namespace}" if namespace else ""
+        return self.exec_command(
+            f"kubectl apply --server-side --field-manager={self.FIELD_MANAGER} --force-conflicts{namespace_arg} -f -",
+            input_data=yaml.safe_dump_all(documents, sort_keys=False),
+        )
 
     def delete_configs(self, namespace: str, config_path: str):
         """Delete Kubernetes configurations from a specified path in a namespace."""
         try:
             exists_resource = self.exec_command(f"kubectl get all -n {namespace} -o name")
             if exists_resource:
-                logger.info(f"Deleting K8S configs in namespace: {namespace}")
-                command = f"kubectl delete -Rf {config_path} -n {namespace} --timeout=10s"
-                self.exec_command(command)
+                logger.info("Deleting K8S configs in namespace: %s", namespace)
+                self.run_silent(["delete", "-Rf", str(config_path), "--timeout=10s"], namespace=namespace)
             else:
-                logger.warning(f"No resources found in: {namespace}. Skipping deletion.")
+                logger.warning("No resources found in: %s. Skipping deletion.", namespace)
         except subprocess.CalledProcessError as e:
-            logger.error(f"Error deleting K8S configs: {e}")
-            logger.error(f"Command output: {e.output}")
+            logger.error("Error deleting K8S configs: %s", e)
+            logger.error("Command output: %s", e.output)
 
-    def delete_namespace(self, namespace: str):
-        """Delete a specified namespace."""
+    def delete_namespace(self, namespace: str, wait: bool = True):
+        """Delete a specified namespace.
+
+        With ``wait=False`` the delete is only issued and the namespace is left Terminating;
+        ``create_namespace_if_not_exist`` waits out a Terminating namespace before recreating it.
+        """
         try:
             self.core_v1_api.delete_namespace(name=namespace)
+            if not wait:
+                logger.info("Namespace '%s' deletion requested.", namespace)
+                return
             self.wait_for_namespace_deletion(namespace)
-            logger.info(f"Namespace '{namespace}' deleted successfully.")
+            logger.info("Namespace '%s' deleted successfully.", namespace)
         except ApiException as e:
             if e.status == 404:
-                logger.warning(f"Namespace '{namespace}' not found.")
+                logger.warning("Namespace '%s' not found.", namespace)
+            elif e.status == 409:
+                # Already Terminating, e.g. from an earlier non-blocking cleanup.
+                logger.info("Namespace '%s' is already being deleted.", namespace)
+                if wait:
+                    self.wait_for_namespace_deletion(namespace)
             else:
-                logger.error(f"Error deleting namespace '{namespace}': {e}")
+                logger.error("Error deleting namespace '%s': %s", namespace, e)
 
     def gc_orphan_localpv_dirs(
         self,
@@ -537,21 +797,23 @@ class KubeCtl:
         try:
             live_pv_names = {pv.metadata.name for pv in self.core_v1_api.list_persistent_volume().items}
         except Exception as e:
-            logger.warning(f"[gc_localpv] Could not list PVs, skipping GC: {e}")
+            logger.warning("[gc_localpv] Could not list PVs, skipping GC: %s", e)
             return results
 
         try:
             node_names = [n.metadata.name for n in self.list_nodes().items]
         except Exception as e:
-            logger.warning(f"[gc_localpv] Could not list nodes, skipping GC: {e}")
+            logger.warning("[gc_localpv] Could not list nodes, skipping GC: %s", e)
             return results
 
         if not node_names:
             return results
 
         logger.info(
-            f"[gc_localpv] Sweeping {localpv_path} on {len(node_names)} node(s) "
-            f"(preserving {len(live_pv_names)} live PV dir(s))"
+            "[gc_localpv] Sweeping %s on %d node(s) (preserving %d live PV dir(s))",
+            localpv_path,
+            len(node_names),
+            len(live_pv_names),
         )
 
         # Pass the keep-list to the pod via a single env var. Newline-delimited
@@ -583,11 +845,11 @@ class KubeCtl:
                 )
                 results[node_name] = count
                 if count:
-                    logger.info(f"[gc_localpv] {node_name}: removed {count} orphan dir(s)")
+                    logger.info("[gc_localpv] %s: removed %s orphan dir(s)", node_name, count)
                 else:
-                    logger.debug(f"[gc_localpv] {node_name}: nothing to remove")
+                    logger.debug("[gc_localpv] %s: nothing to remove", node_name)
             except Exception as e:
-                logger.warning(f"[gc_localpv] Failed on {node_name}: {e}")
+                logger.warning("[gc_localpv] Failed on %s: %s", node_name, e)
                 results[node_name] = -1
 
         return results
@@ -674,24 +936,25 @@ class KubeCtl:
             else:
                 raise TimeoutError(f"GC pod {pod_name} on {node_name} did not finish within {timeout}s (phase={phase})")
 
-            logs = ""
-            try:
-                logs = self.core_v1_api.read_namespaced_pod_log(name=pod_name, namespace=namespace)
-            except ApiException as e:
-                logger.debug(f"[gc_localpv] Could not read logs for {pod_name}: {e}")
-
             if phase != "Succeeded":
+                logs = ""
+                try:
+                    logs = self.core_v1_api.read_namespaced_pod_log(name=pod_name, namespace=namespace)
+                except ApiException as e:
+                    logger.debug("[gc_localpv] Could not read logs for %s: %s", pod_name, e)
                 raise RuntimeError(
                     f"GC pod {pod_name} on {node_name} ended with phase={phase}; logs: {logs.strip()[:500]}"
                 )
 
             removed = 0
-            for line in (logs or "").splitlines():
-                line = line.strip()
-                if line.startswith("GC_REMOVED="):
-                    with contextlib.suppress(ValueError):
-                        removed = int(line.split("=", 1)[1])
-                    break
+            try:
+                line = self.find_pod_log_line(pod_name, namespace, "GC_REMOVED=")
+            except ApiException as e:
+                logger.debug("[gc_localpv] Could not read logs for %s: %s", pod_name, e)
+                line = None
+            if line:
+                with contextlib.suppress(ValueError):
+                    removed = int(line.split("=", 1)[1])
             return removed
         finally:
             with contextlib.suppress(ApiException):
@@ -700,16 +963,23 @@ class KubeCtl:
     def create_namespace_if_not_exist(self, namespace: str):
         """Create a namespace if it doesn't exist."""
         try:
-            self.core_v1_api.read_namespace(name=namespace)
-            logger.info(f"Namespace '{namespace}' already exists when you want to create.")
+            ns = self.core_v1_api.read_namespace(name=namespace)
+            if ns.status and ns.status.phase == "Terminating":
+                # Left behind by a non-blocking delete; it has to be gone before it can be recreated.
+                logger.info("Namespace '%s' is still terminating. Waiting before recreating it.", namespace)
+                self.wait_for_namespace_deletion(namespace)
+                self.core_v1_api.create_namespace(body=client.V1Namespace(metadata=client.V1ObjectMeta(name=namespace)))
+                logger.info("Namespace '%s' created successfully.", namespace)
+                return
+            logger.info("Namespace '%s' already exists when you want to create.", namespace)
         except ApiException as e:
             if e.status == 404:
-                logger.info(f"Namespace '{namespace}' not found. Creating namespace.")
+                logger.info("Namespace '%s' not found. Creating namespace.", namespace)
                 body = client.V1Namespace(metadata=client.V1ObjectMeta(name=namespace))
                 self.core_v1_api.create_namespace(body=body)
-                logger.info(f"Namespace '{namespace}' created successfully.")
+                logger.info("Namespace '%s' created successfully.", namespace)
             else:
-                logger.error(f"Error checking/creating namespace '{namespace}': {e}")
+                logger.error("Error checking/creating namespace '%s': %s", namespace, e)
 
     def exec_command(self, command: str, input_data=None):
         """Execute an arbitrary kubectl command."""
@@ -747,29 +1017,62 @@ class KubeCtl:
 
         return out.stdout.decode("utf-8")
 
+    def run(
+        self,
+        args: list[str],
+        namespace: str | None = None,
+        input_data: str | None = None,
+        timeout: float | None = None,
+    ) -> subprocess.CompletedProcess:
+        """Run ``kubectl <args>`` from an argv list, without a shell in between.
+
+        ``namespace`` is passed as ``-n``. The process result is returned whatever the exit status,
+        so callers check ``returncode`` themselves.
+        """
+        command = ["kubectl", *(["-n", namespace] if namespace else []), *args]
+        return subprocess.run(command, capture_output=True, text=True, input=input_data, timeout=timeout)
+
+    def run_silent(self, args: list[str], namespace: str | None = None, timeout: float | None = None) -> int:
+        """Run ``kubectl <args>`` for its effect only and return the exit code.
+
+        stdout goes straight to /dev/null instead of being buffered into a Python string,
+        which matters for commands like ``apply -R`` whose output grows with the manifest
+        count. stderr is kept so a failure is still logged.
+        """
+        command = ["kubectl", *(["-n", namespace] if namespace else []), *args]
+        result = subprocess.run(command, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, timeout=timeout)
+        if result.returncode != 0:
+            logger.error(
+                "Command failed (exit %d): %s\n  stderr: %s",
+                result.returncode,
+                " ".join(command),
+                result.stderr.strip(),
+            )
+        return result.returncode
+
     def get_node_architectures(self):
         """Return a set of CPU architectures from all nodes in the cluster."""
         architectures = set()
         try:
-            nodes = self.core_v1_api.list_node()
+            nodes = self.core_v1_api.list_node(resource_version=self.CACHED_RESOURCE_VERSION)
             for node in nodes.items:
                 arch = node.status.node_info.architecture
                 architectures.add(arch)
         except ApiException as e:
-            logger.error(f"Exception when retrieving node architectures: {e}\n")
+            logger.error("Exception when retrieving node architectures: %s\n", e)
         return architectures
 
     def get_node_memory_capacity(self):
         max_capacity = 0
         try:
-            nodes = self.core_v1_api.list_node()
+            nodes = self.core_v1_api.list_node(resource_version=self.CACHED_RESOURCE_VERSION)
             for node in nodes.items:
                 capacity = node.status.capacity.get("memory")
                 capacity = self.parse_k8s_quantity(capacity) if capacity else 0
                 max_capacity = max(max_capacity, capacity)
             return max_capacity
         except ApiException as e:
-            logger.error(f"Exception when retrieving node memory capacity: {e}\n")
+            logger.error("Exception when retrieving node memory capacity: %s\n", e)
             return {}
 
     def parse_k8s_quantity(self, mem_str):
@@ -789,8 +1092,6 @@ class KubeCtl:
             "E": 1000**5,
         }
 
-        import re
-
         match = re.match(r"^([0-9.]+)([a-zA-Z]+)?$", mem_str)
         if not match:
             raise ValueError(f"Invalid Kubernetes quantity: {mem_str}")
@@ -811,7 +1112,7 @@ class KubeCtl:
 
     def is_emulated_cluster(self) -> bool:
         try:
-            nodes = self.core_v1_api.list_node()
+            nodes = self.core_v1_api.list_node(resource_version=self.CACHED_RESOURCE_VERSION)
             for node in nodes.items:
                 provider_id = (node.spec.provider_id or "").lower()
                 runtime = node.status.node_info.container_runtime_version.lower()
@@ -829,7 +1130,7 @@ class KubeCtl:
 
             return False
         except Exception as e:
-            logger.error(f"Error detecting cluster type: {e}")
+            logger.error("Error detecting cluster type: %s", e)
             return False
 
     def get_matching_replicasets(self, namespace: str, deployment_name: str) -> list[client.V1ReplicaSet]:
@@ -855,12 +1156,12 @@ class KubeCtl:
                 namespace=namespace,
                 body=body,
             )
-            logger.info(f"✅ Deleted ReplicaSet '{name}' in namespace '{namespace}'")
+            logger.info("✅ Deleted ReplicaSet '%s' in namespace '%s'", name, namespace)
         except client.exceptions.ApiException as e:
             raise RuntimeError(f"Failed to delete ReplicaSet {name} in {namespace}: {e}") from e
 
     def apply_resource(self, manifest: dict):
-        dyn_client = dynamic.DynamicClient(api_client.ApiClient())
+        dyn_client = dynamic.DynamicClient(self.api_client)
 
         gvk = {
             ("v1", "ResourceQuota"): dyn_client.resources.get(api_version="v1", kind="ResourceQuota"),
@@ -871,17 +1172,14 @@ class KubeCtl:
         if key not in gvk:
             raise ValueError(f"Unsupported resource type: {key}")
 
-        resource = gvk[key]
-        namespace = manifest["metadata"].get("namespace")
-
-        try:
-            resource.get(name=manifest["metadata"]["name"], namespace=namespace)
-            # If exists, patch it
-            resource.patch(body=manifest, name=manifest["metadata"]["name"], namespace=namespace)
-            logger.info(f"✅ Patched existing {manifest['kind']} '{manifest['metadata']['name']}'")
-        except dynamic.exceptions.NotFoundError:
-            resource.create(body=manifest, namespace=namespace)
-            logger.info(f"✅ Created new {manifest['kind']} '{manifest['metadata']['name']}'")
+        # Server-side apply creates or updates in one request, with no read and no client-side merge.
+        gvk[key].server_side_apply(
+            body=manifest,
+            namespace=manifest["metadata"].get("namespace"),
+            field_manager=self.FIELD_MANAGER,
+            force_conflicts=True,
+        )
+        logger.info("✅ Applied %s '%s'", manifest["kind"], manifest["metadata"]["name"])
 
     def get_resource_quotas(self, namespace: str) -> list:
         try:
@@ -895,7 +1193,7 @@ class KubeCtl:
             self.core_v1_api.delete_namespaced_resource_quota(
                 name=name, namespace=namespace, body=client.V1DeleteOptions(propagation_policy="Foreground")
             )
-            logger.info(f"✅ Deleted resource quota '{name}' in namespace '{namespace}'")
+            logger.info("✅ Deleted resource quota '%s' in namespace '%s'", name, namespace)
         except client.exceptions.ApiException as e:
             raise RuntimeError(f"❌ Failed to delete resource quota '{name}' in namespace '{namespace}': {e}") from e
 
@@ -903,7 +1201,7 @@ class KubeCtl:
         try:
             body = {"spec": {"replicas": replicas}}
             self.apps_v1_api.patch_namespaced_deployment(name=name, namespace=namespace, body=body)
-            logger.info(f"✅ Scaled deployment '{name}' in namespace '{namespace}' to {replicas} replicas.")
+            logger.info("✅ Scaled deployment '%s' in namespace '%s' to %s replicas.", name, namespace, replicas)
         except client.exceptions.ApiException as e:
             raise RuntimeError(f"❌ Failed to scale deployment '{name}' in namespace '{namespace}': {e}") from e
 
@@ -920,7 +1218,16 @@ class KubeCtl:
         return result
 
     def trigger_rollout(self, deployment_name: str, namespace: str):
-        self.exec_command(f"kubectl rollout restart deployment {deployment_name} -n {namespace}")
+        """Restart a deployment's pods the way `kubectl rollout restart` does, without spawning kubectl."""
+        restarted_at = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+        body = {
+            "spec": {"template": {"metadata": {"annotations": {"kubectl.kubernetes.io/restartedAt": restarted_at}}}}
+        }
+        try:
+            return self.apps_v1_api.patch_namespaced_deployment(name=deployment_name, namespace=namespace, body=body)
+        except ApiException as e:
+            logger.error("Exception when restarting deployment '%s' in '%s': %s", deployment_name, namespace, e)
+            return None
 
     def trigger_scale(self, deployment_name: str, namespace: str, replicas: int):
         self.exec_command(f"kubectl scale deployment {deployment_name} -n {namespace} --replicas={replicas}")
@@ -18,7 +18,7 @@ class MCPServer:
         self.service_name = "mcp-server"
         self.port = 9954
         self.port_forward_process = None
-        self.kubectl = KubeCtl()
+        self.kubectl = KubeCtl.instance()
 
     def _is_running(self) -> bool:
         """Check if the MCP server deployment already exists and is ready."""
@@ -32,9 +32,12 @@ class MCPServer:
 
     def _ensure_rbac(self):
         """Ensure RBAC resources exist even if the MCP server pod is already running."""
-        rbac_dir = MCP_SERVER_K8S
-        for resource in ["clusterrole.yaml", "clusterrolebinding.yaml"]:
-            self.kubectl.exec_command(f"kubectl apply -f {rbac_dir / resource}")
+        file_args = " ".join(
+            f"-f {MCP_SERVER_K8S / resource}" for resource in ["clusterrole.yaml", "clusterrolebinding.yaml"]
+        )
+        self.kubectl.exec_command(
+            f"kubectl apply --server-side --field-manager={KubeCtl.FIELD_MANAGER} --force-conflicts {file_args}"
+        )
         logger.info("MCP server RBAC resources ensured.")
 
     def deploy(self):
@@ -92,6 +95,24 @@ class MCPServer:
             except Exception as e:
                 logger.warning(f"Failed to kill stale port-forward: {e}")
 
+    def _wait_for_port_forward(self, timeout: float = 3) -> bool:
+        """Wait for the port-forward to start listening, backing off exponentially between checks.
+
+        Returns as soon as the local port accepts connections instead of always sleeping `timeout`.
+        If it is still not listening by then, falls back to whether kubectl is still running.
+        """
+        deadline = time.monotonic() + timeout
+        delay = 0.1
+        while self.port_forward_process.poll() is None:
+            if self.is_port_in_use(self.port):
+                return True
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return True
+            time.sleep(min(delay, remaining))
+            delay *= 2
+        return False
+
     def start_port_forward(self):
         """Starts port-forwarding to access the MCP server."""
         self._kill_stale_port_forward()
@@ -114,9 +135,8 @@ class MCPServer:
                 stderr=subprocess.PIPE,
                 text=True,
             )
-            time.sleep(3)
 
-            if self.port_forward_process.poll() is None:
+            if self._wait_for_port_forward():
                 os.environ["MCP_SERVER_PORT"] = str(self.port)
                 logger.info(f"Port forwarding established at {self.port}. MCP_SERVER_PORT set.")
                 break
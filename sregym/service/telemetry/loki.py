@@ -107,8 +107,8 @@ class Loki:
         """Add Grafana Helm repository for Loki chart."""
         self.logger.info("Adding Grafana Helm repository...")
         try:
-            KubeCtl().exec_command("helm repo add grafana https://grafana.github.io/helm-charts")
-            KubeCtl().exec_command("helm repo update")
+            Helm.add_repo("grafana", "https://grafana.github.io/helm-charts")
+            Helm.repo_update()
         except Exception as e:
             self.logger.warning(f"Failed to add Grafana Helm repo (may already exist): {e}")
 
@@ -123,16 +123,16 @@ class Loki:
     def _apply_pvc(self):
         """Apply the PersistentVolumeClaim configuration."""
         self.logger.info(f"Applying PersistentVolumeClaim from {self.pvc_config_file}")
-        KubeCtl().exec_command(f"kubectl apply -f {self.pvc_config_file} -n {self.namespace}")
+        KubeCtl.instance().exec_command(f"kubectl apply -f {self.pvc_config_file} -n {self.namespace}")
 
     def _delete_pvc(self):
         """Delete the PersistentVolume and associated PersistentVolumeClaim."""
         pvc_name = self._get_pvc_name_from_file(self.pvc_config_file)
-        result = KubeCtl().exec_command(f"kubectl get pvc {pvc_name} --ignore-not-found")
+        result = KubeCtl.instance().exec_command(f"kubectl get pvc {pvc_name} --ignore-not-found")
 
         if result:
             self.logger.info(f"Deleting PersistentVolumeClaim {pvc_name}")
-            KubeCtl().exec_command(f"kubectl delete pvc {pvc_name}")
+            KubeCtl.instance().exec_command(f"kubectl delete pvc {pvc_name}")
             self.logger.info(f"Successfully deleted PersistentVolumeClaim from {pvc_name}")
         else:
             self.logger.warning(f"PersistentVolumeClaim {pvc_name} not found. Skipping deletion.")
@@ -147,7 +147,7 @@ class Loki:
         """Check if the PersistentVolumeClaim exists."""
         command = f"kubectl get pvc {pvc_name}"
         try:
-            result = KubeCtl().exec_command(command)
+            result = KubeCtl.instance().exec_command(command)
             if "No resources found" in result or "Error" in result:
                 return False
         except subprocess.CalledProcessError:
@@ -156,14 +156,7 @@ class Loki:
 
     def _is_loki_running(self) -> bool:
         """Check if Loki is already running in the cluster."""
-        command = f"kubectl get pods -n {self.namespace} -l app.kubernetes.io/name=loki"
-        try:
-            result = KubeCtl().exec_command(command)
-            if "Running" in result:
-                return True
-        except subprocess.CalledProcessError:
-            return False
-        return False
+        return KubeCtl.instance().has_running_pod(self.namespace, "app.kubernetes.io/name=loki")
 
     def _deploy_promtail(self):
         if self._is_promtail_running():
@@ -182,11 +175,4 @@ class Loki:
 
     def _is_promtail_running(self) -> bool:
         """Check if Promtail is already running in the cluster."""
-        command = f"kubectl get pods -n {self.namespace} -l app.kubernetes.io/name=promtail"
-        try:
-            result = KubeCtl().exec_command(command)
-            if "Running" in result:
-                return True
-        except subprocess.CalledProcessError:
-            return False
-        return False
+        return KubeCtl.instance().has_running_pod(self.namespace, "app.kubernetes.io/name=promtail")
@@ -95,16 +95,16 @@ class Prometheus:
     def _apply_pvc(self):
         """Apply the PersistentVolumeClaim configuration."""
         self.logger.info(f"Applying PersistentVolumeClaim from {self.pvc_config_file}")
-        KubeCtl().exec_command(f"kubectl apply -f {self.pvc_config_file} -n {self.namespace}")
+        KubeCtl.instance().exec_command(f"kubectl apply -f {self.pvc_config_file} -n {self.namespace}")
 
     def _delete_pvc(self):
         """Delete the PersistentVolume and associated PersistentVolumeClaim."""
         pvc_name = self._get_pvc_name_from_file(self.pvc_config_file)
-        result = KubeCtl().exec_command(f"kubectl get pvc {pvc_name} --ignore-not-found")
+        result = KubeCtl.instance().exec_command(f"kubectl get pvc {pvc_name} --ignore-not-found")
 
         if result:
             self.logger.info(f"Deleting PersistentVolumeClaim {pvc_name}")
-            KubeCtl().exec_command(f"kubectl delete pvc {pvc_name}")
+            KubeCtl.instance().exec_command(f"kubectl delete pvc {pvc_name}")
             self.logger.info(f"Successfully deleted PersistentVolumeClaim from {pvc_name}")
         else:
             self.logger.warning(f"PersistentVolumeClaim {pvc_name} not found. Skipping deletion.")
@@ -119,7 +119,7 @@ class Prometheus:
         """Check if the PersistentVolumeClaim exists."""
         command = f"kubectl get pvc {pvc_name}"
         try:
-            result = KubeCtl().exec_command(command)
+            result = KubeCtl.instance().exec_command(command)
             if "No resources found" in result or "Error" in result:
                 return False
         except subprocess.CalledProcessError:
@@ -136,15 +136,8 @@ class Prometheus:
         )
         if result.stdout.strip() == "Terminating":
             self.logger.info(f"Namespace '{self.namespace}' is terminating, waiting for full deletion...")
-            KubeCtl().wait_for_namespace_deletion(self.namespace)
+            KubeCtl.instance().wait_for_namespace_deletion(self.namespace)
 
     def _is_prometheus_running(self) -> bool:
         """Check if Prometheus is already running in the cluster."""
-        command = f"kubectl get pods -n {self.namespace} -l app.kubernetes.io/name=prometheus"
-        try:
-            result = KubeCtl().exec_command(command)
-            if "Running" in result:
-                return True
-        except subprocess.CalledProcessError:
-            return False
-        return False
+        return KubeCtl.instance().has_running_pod(self.namespace, "app.kubernetes.io/name=prometheus")
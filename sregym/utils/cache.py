@@ -1,7 +1,17 @@
+import hashlib
 import json
+import logging
 import os
+import time
+import urllib.request
+from pathlib import Path
 
-from sregym.paths import CACHE_DIR, LLM_CACHE_FILE
+from sregym.paths import CACHE_DIR, LLM_CACHE_FILE, MANIFEST_CACHE_DIR
+
+logger = logging.getLogger("all.sregym.cache")
+
+# Cached manifests older than this are re-downloaded, so unpinned URLs (e.g. releases/latest) still pick up updates.
+MANIFEST_CACHE_TTL = 24 * 60 * 60
 
 
 class LLMCache:
@@ -34,3 +44,34 @@ class LLMCache:
     def save_cache(self):
         with open(LLM_CACHE_FILE, "w") as f:
             json.dump(self.cache_dict, f, indent=4)
+
+
+def cached_manifest_path(
+    url: str, timeout: float = 60, max_age: float | None = MANIFEST_CACHE_TTL, refresh: bool = False
+) -> Path:
+    """Return a local copy of the manifest at ``url``, downloading it only on a cache miss.
+
+    Files are keyed by the sha256 of the URL, so a manifest is fetched at most once per
+    ``max_age`` seconds (never again if ``None``) instead of on every deployment. ``refresh``
+    forces a download. If a refresh fails, the stale copy is used rather than failing the deploy.
+    """
+    path = MANIFEST_CACHE_DIR / f"{hashlib.sha256(url.encode()).hexdigest()}.yaml"
+    if path.exists() and not refresh:
+        if max_age is None or time.time() - path.stat().st_mtime < max_age:
+            return path
+
+    os.makedirs(MANIFEST_CACHE_DIR, exist_ok=True)
+    try:
+        with urllib.request.urlopen(url, timeout=timeout) as resp:
+            content = resp.read()
+    except OSError as e:
+        if not path.exists():
+            raise
+        logger.warning("Could not refresh cached manifest %s, using the cached copy: %s", url, e)
+        return path
+
+    # Write then rename so a concurrent reader never sees a partial manifest.
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    tmp_path.write_bytes(content)
+    os.replace(tmp_path, path)
+    return path
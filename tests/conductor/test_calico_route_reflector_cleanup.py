@@ -31,7 +31,7 @@ def _conductor(fake_kubectl, monkeypatch):
         error=lambda *args, **kwargs: None,
         warning=lambda *args, **kwargs: None,
     )
-    monkeypatch.setattr(conductor_module, "KubeCtl", lambda: fake_kubectl)
+    monkeypatch.setattr(conductor_module, "KubeCtl", SimpleNamespace(instance=lambda: fake_kubectl))
     return conductor
 
 
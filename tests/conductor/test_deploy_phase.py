@@ -0,0 +1,35 @@
+from types import SimpleNamespace
+
+import pytest
+
+import sregym.conductor.conductor as conductor_module
+from sregym.conductor.conductor import Conductor
+
+
+def _conductor(records):
+    conductor = object.__new__(Conductor)
+    conductor.logger = SimpleNamespace(info=lambda message, *args: records.append((message, args)))
+    return conductor
+
+
+def test_deploy_phase_logs_lazily_with_its_duration(monkeypatch):
+    clock = iter([10.0, 12.5])
+    monkeypatch.setattr(conductor_module.time, "perf_counter", lambda: next(clock))
+    records = []
+
+    with _conductor(records)._deploy_phase("Prometheus"):
+        pass
+
+    assert records == [
+        ("[DEPLOY] Deploying %s…", ("Prometheus",)),
+        ("[DEPLOY] %s deployed in %.1fs", ("Prometheus", 2.5)),
+    ]
+
+
+def test_failed_deploy_phase_does_not_report_success():
+    records = []
+
+    with pytest.raises(RuntimeError), _conductor(records)._deploy_phase("Jaeger"):
+        raise RuntimeError("helm install failed")
+
+    assert records == [("[DEPLOY] Deploying %s…", ("Jaeger",))]
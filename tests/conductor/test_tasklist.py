@@ -0,0 +1,38 @@
+import os
+
+import yaml
+
+from sregym.conductor import utils as utils_module
+from sregym.conductor.utils import load_tasklist
+
+
+def test_missing_tasklist_loads_as_none(tmp_path):
+    assert load_tasklist(tmp_path / "tasklist.yml") is None
+
+
+def test_tasklist_is_parsed_once_per_file_version(tmp_path, monkeypatch):
+    path = tmp_path / "tasklist.yml"
+    path.write_text(yaml.safe_dump({"all": {"problems": {"incorrect_image": ["diagnosis"]}}}))
+    parses = []
+    real_load = utils_module.yaml.load
+    monkeypatch.setattr(
+        utils_module.yaml, "load", lambda *args, **kwargs: parses.append(1) or real_load(*args, **kwargs)
+    )
+
+    first = load_tasklist(path)
+    assert load_tasklist(path) is first
+    assert len(parses) == 1
+
+    path.write_text(yaml.safe_dump({"all": {"problems": {"kubelet_crash": ["mitigation"]}}}))
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert list(load_tasklist(path)["all"]["problems"]) == ["kubelet_crash"]
+    assert len(parses) == 2
+
+
+def test_empty_tasklist_loads_as_empty_dict(tmp_path):
+    path = tmp_path / "tasklist.yml"
+    path.write_text("")
+
+    assert load_tasklist(path) == {}
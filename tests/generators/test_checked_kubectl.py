@@ -30,3 +30,37 @@ def test_checked_command_raises_on_timeout(monkeypatch):
 
     with pytest.raises(RuntimeError, match="timed out after 30s"):
         KubeCtl().exec_command_checked("kubectl exec pod -- command", timeout=30)
+
+
+def test_run_passes_an_argv_list_without_a_shell(monkeypatch):
+    calls = []
+
+    def record(command, **kwargs):
+        calls.append((command, kwargs))
+        return subprocess.CompletedProcess(args=command, returncode=0, stdout="ok\n", stderr="")
+
+    monkeypatch.setattr(subprocess, "run", record)
+
+    result = object.__new__(KubeCtl).run(["logs", "deployment/frontend", "--tail=50"], namespace="hotel reservation")
+
+    [(command, kwargs)] = calls
+    assert command == ["kubectl", "-n", "hotel reservation", "logs", "deployment/frontend", "--tail=50"]
+    assert "shell" not in kwargs
+    assert result.stdout == "ok\n"
+
+
+def test_run_silent_discards_stdout_and_reports_the_exit_code(monkeypatch):
+    calls = []
+
+    def record(command, **kwargs):
+        calls.append((command, kwargs))
+        return subprocess.CompletedProcess(args=command, returncode=1, stdout=None, stderr="not found")
+
+    monkeypatch.setattr(subprocess, "run", record)
+
+    assert object.__new__(KubeCtl).run_silent(["delete", "-Rf", "manifests/"], namespace="hotel-reservation") == 1
+
+    [(command, kwargs)] = calls
+    assert command == ["kubectl", "-n", "hotel-reservation", "delete", "-Rf", "manifests/"]
+    assert kwargs["stdout"] is subprocess.DEVNULL
+    assert kwargs["stderr"] is subprocess.PIPE
@@ -0,0 +1,82 @@
+import json
+
+from sregym.generators.fault.inject_virtual import VirtualizationFaultInjector
+
+DEPLOYMENTS = {
+    "items": [
+        {
+            "metadata": {"name": "frontend"},
+            "spec": {"template": {"spec": {"containers": [{"name": "frontend"}]}}},
+        },
+        {
+            "metadata": {"name": "geo"},
+            "spec": {
+                "template": {
+                    "spec": {
+                        "containers": [
+                            {"name": "geo", "env": [{"name": "JAEGER_SAMPLE_RATIO", "value": "1"}]},
+                            {"name": "sidecar", "env": [{"name": "PORT"}, {"name": "GOGC", "value": "50"}]},
+                        ]
+                    }
+                }
+            },
+        },
+    ]
+}
+
+
+class _RecordingKubeCtl:
+    def __init__(self):
+        self.lists = []
+        self.commands = []
+
+    def exec_command_checked(self, command):
+        self.lists.append(command)
+        return json.dumps(DEPLOYMENTS)
+
+    def exec_command(self, command):
+        self.commands.append(command)
+        return ""
+
+
+def _injector():
+    injector = object.__new__(VirtualizationFaultInjector)
+    injector.namespace = "hotel-reservation"
+    injector.kubectl = _RecordingKubeCtl()
+    return injector
+
+
+def _patches(commands):
+    return {
+        command.split()[3]: json.loads(command.split("-p=", 1)[1].strip("'"))
+        for command in commands
+        if command.startswith("kubectl patch")
+    }
+
+
+def test_gogc_patch_is_built_from_one_deployment_list():
+    injector = _injector()
+
+    injector.inject_gogc_env_variable_patch("10")
+
+    assert injector.kubectl.lists == ["kubectl get deployments -n hotel-reservation -o json"]
+    assert _patches(injector.kubectl.commands) == {
+        "frontend": [
+            {"op": "add", "path": "/spec/template/spec/containers/0/env", "value": [{"name": "GOGC", "value": "10"}]}
+        ],
+        "geo": [
+            {"op": "add", "path": "/spec/template/spec/containers/0/env/-", "value": {"name": "GOGC", "value": "10"}},
+            {"op": "replace", "path": "/spec/template/spec/containers/1/env/1/value", "value": "10"},
+        ],
+    }
+
+
+def test_gogc_recovery_only_resets_containers_that_set_it():
+    injector = _injector()
+
+    injector.recover_gogc_env_variable_patch()
+
+    assert injector.kubectl.lists == ["kubectl get deployments -n hotel-reservation -o json"]
+    assert _patches(injector.kubectl.commands) == {
+        "geo": [{"op": "replace", "path": "/spec/template/spec/containers/1/env/1/value", "value": "100"}]
+    }
@@ -1,5 +1,7 @@
 from types import SimpleNamespace
 
+import pytest
+
 from sregym.generators.fault.inject_kafka import (
     CONSUMER_SCRIPT,
     PRODUCER_SCRIPT,
@@ -33,9 +35,9 @@ class _RecordingKubeCtl:
         ]
         return SimpleNamespace(items=pods)
 
-    def exec_command(self, command, input_data=None):
-        self.commands.append((command, input_data))
-        return "\n__STREAM_ADMIN_OK__\n"
+    def run(self, args, namespace=None, input_data=None):
+        self.commands.append((namespace, args, input_data))
+        return SimpleNamespace(returncode=0, stdout="", stderr="")
 
 
 def test_pipeline_scripts_do_not_publish_injection_or_hidden_repair_controls():
@@ -54,13 +56,25 @@ def test_broker_commands_use_bounded_heap_and_stream_records_over_stdin():
 
     broker.publish_lines("orders-fulfillment", ['{"order_id":"ORD-1"}'])
 
-    command, input_data = kubectl.commands[0]
-    assert "kubectl exec -i" in command
-    assert "KAFKA_HEAP_OPTS=-Xms32m -Xmx64m" in command
-    assert "KAFKA_OPTS=" in command
-    assert "kafka-console-producer.sh" in command
+    namespace, args, input_data = kubectl.commands[0]
+    assert namespace == "astronomy-shop"
+    assert args[:3] == ["exec", "-i", "kafka-abc123"]
+    assert "KAFKA_HEAP_OPTS=-Xms32m -Xmx64m" in args
+    assert "KAFKA_OPTS=" in args
+    assert "/opt/kafka/bin/kafka-console-producer.sh" in args
     assert input_data == '{"order_id":"ORD-1"}\n'
-    assert "ORD-1" not in command
+    assert not any("ORD-1" in arg for arg in args)
+
+
+def test_failed_broker_command_raises_with_its_stderr():
+    kubectl = _RecordingKubeCtl()
+    kubectl.run = lambda args, namespace=None, input_data=None: SimpleNamespace(
+        returncode=1, stdout="", stderr="TopicExistsException"
+    )
+    broker = KafkaBrokerClient(kubectl, "astronomy-shop")
+
+    with pytest.raises(RuntimeError, match="TopicExistsException"):
+        broker.publish_lines("orders-fulfillment", ['{"order_id":"ORD-1"}'])
 
 
 def test_recovery_resets_inactive_group_without_patching_consumer_template():
@@ -83,3 +97,29 @@ def test_recovery_resets_inactive_group_without_patching_consumer_template():
         ("scale", 1),
         ("ready", "orders-validator"),
     ]
+
+
+def test_pipeline_teardown_waits_on_a_pod_watch():
+    calls = []
+    injector = object.__new__(KafkaFaultInjector)
+    injector.namespace = "kafka"
+    injector.kubectl = SimpleNamespace(
+        wait_for_pods_deleted=lambda namespace, selector, timeout: calls.append((namespace, selector)) or True
+    )
+
+    injector._wait_pipeline_pods_gone()
+    injector._wait_consumer_pods_gone()
+
+    assert calls == [
+        ("kafka", "app in (order-stream, orders-validator, orders-archiver)"),
+        ("kafka", "app=orders-validator"),
+    ]
+
+
+def test_pipeline_teardown_times_out_when_pods_linger():
+    injector = object.__new__(KafkaFaultInjector)
+    injector.namespace = "kafka"
+    injector.kubectl = SimpleNamespace(wait_for_pods_deleted=lambda namespace, selector, timeout: False)
+
+    with pytest.raises(TimeoutError, match="orders-validator"):
+        injector._wait_consumer_pods_gone()
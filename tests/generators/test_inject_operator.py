@@ -0,0 +1,66 @@
+from types import SimpleNamespace
+
+import yaml
+
+import sregym.generators.fault.inject_operator as inject_operator_module
+from sregym.generators.fault.inject_operator import K8SOperatorFaultInjector
+
+
+class _RecordingKubeCtl:
+    def __init__(self):
+        self.commands = []
+
+    def list_pods(self, namespace):
+        pod = SimpleNamespace(
+            metadata=SimpleNamespace(name="tidb-controller-manager-abc123"),
+            spec=SimpleNamespace(containers=[SimpleNamespace(name="tidb-operator")]),
+        )
+        return SimpleNamespace(items=[pod])
+
+    def exec_command(self, command):
+        self.commands.append(command)
+        return "configured\n"
+
+
+def _injector(tmp_path):
+    injector = object.__new__(K8SOperatorFaultInjector)
+    injector.namespace = "tidb-cluster"
+    injector.kubectl = _RecordingKubeCtl()
+    injector.YAML_PATH_TEMPLATE = str(tmp_path / "{}.yaml")
+    return injector
+
+
+def test_fault_overrides_only_touch_their_component(tmp_path):
+    injector = _injector(tmp_path)
+
+    injector.inject_overload_replicas()
+
+    cr = yaml.safe_load((tmp_path / "overload-tidbcluster.yaml").read_text())
+    assert cr["metadata"] == {"name": "basic", "namespace": "tidb-cluster"}
+    assert cr["spec"]["tidb"]["replicas"] == 100000
+    assert cr["spec"]["tidb"]["service"] == {"type": "ClusterIP"}
+    assert cr["spec"]["pd"] == injector._tidb_cluster_cr()["spec"]["pd"]
+    assert cr["spec"]["tikv"]["replicas"] == 3
+
+
+def test_wrong_operator_image_is_applied_in_the_operator_namespace(tmp_path):
+    injector = _injector(tmp_path)
+
+    injector.inject_wrong_operator_image()
+
+    pod = yaml.safe_load((tmp_path / "wrong-operator-image-fault.yaml").read_text())
+    assert pod["metadata"] == {"name": "tidb-controller-manager-abc123", "namespace": "tidb-operator"}
+    assert pod["spec"]["containers"] == [{"name": "tidb-operator", "image": "pingcap/tidb-operatorr:v1.6.3"}]
+    assert injector.kubectl.commands[-1].endswith("-n tidb-operator")
+
+
+def test_waiting_deletes_get_an_overall_timeout_and_requests_a_request_timeout(tmp_path, monkeypatch):
+    monkeypatch.setattr(inject_operator_module, "cached_manifest_path", lambda url: tmp_path / "clean.yaml")
+    injector = _injector(tmp_path)
+
+    injector.recover_non_existent_storage()
+
+    *deletes, apply = injector.kubectl.commands
+    assert all(command.startswith("timeout 600 kubectl delete ") for command in deletes)
+    assert "--request-timeout" not in " ".join(deletes)
+    assert apply == f"kubectl --request-timeout=10s apply -f {tmp_path / 'clean.yaml'} -n tidb-cluster"
@@ -2,6 +2,7 @@ import json
 
 import pytest
 
+import sregym.generators.fault.inject_remote_os as inject_remote_os_module
 from sregym.generators.fault.inject_remote_os import RemoteOSFaultInjector
 
 
@@ -105,3 +106,35 @@ def test_recover_disk_pressure_all_skips_remote_cluster_without_inventory():
     injector.recover_disk_pressure = lambda node_name: pytest.fail("should not recover without inventory")
 
     injector.recover_disk_pressure_all()
+
+
+class _LogKubectl:
+    def __init__(self, outputs):
+        self.outputs = list(outputs)
+        self.commands = []
+
+    def exec_command(self, command):
+        self.commands.append(command)
+        return self.outputs.pop(0)
+
+
+def test_pod_log_retry_backs_off_exponentially(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(inject_remote_os_module.time, "sleep", sleeps.append)
+    monkeypatch.setattr(inject_remote_os_module.random, "uniform", lambda a, b: 0)
+    injector = _injector([])
+    injector.kubectl = _LogKubectl(["Unable to connect to the server", "", "DISCOVERED_SERVICES: chrony"])
+
+    assert injector._read_pod_logs_with_retry("node-probe") == "DISCOVERED_SERVICES: chrony"
+    assert sleeps == [0.5, 1.0]
+
+
+def test_pod_log_retry_gives_up_on_missing_pod(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(inject_remote_os_module.time, "sleep", sleeps.append)
+    injector = _injector([])
+    injector.kubectl = _LogKubectl(['Error from server (NotFound): pods "node-probe" not found'])
+
+    assert injector._read_pod_logs_with_retry("node-probe") == ""
+    assert len(injector.kubectl.commands) == 1
+    assert sleeps == []
@@ -0,0 +1,66 @@
+from types import SimpleNamespace
+
+import yaml
+
+import sregym.generators.fault.inject_tt as inject_tt_module
+from sregym.generators.fault.inject_tt import TrainTicketFaultInjector
+
+FLAGS = {"flags": {"tt-feat-17": {"defaultVariant": "off"}, "tt-feat-22": {"defaultVariant": "off"}}}
+
+
+class _KubeCtl:
+    def __init__(self, rollout_ok=True):
+        self.data = {"flags.yaml": yaml.dump(FLAGS)}
+        self.rollout_ok = rollout_ok
+        self.restarted = []
+        self.commands = []
+        self.core_v1_api = SimpleNamespace(read_namespaced_config_map=self._read)
+
+    def _read(self, name, namespace):
+        return SimpleNamespace(to_dict=lambda: {"data": dict(self.data)})
+
+    def update_configmap(self, name, namespace, data):
+        self.data = data
+        return SimpleNamespace(data=data)
+
+    def trigger_rollout(self, deployment_name, namespace):
+        self.restarted.append(deployment_name)
+        return SimpleNamespace() if self.rollout_ok else None
+
+    def exec_command_checked(self, command):
+        self.commands.append(command)
+        return ""
+
+
+def _injector(kubectl):
+    injector = object.__new__(TrainTicketFaultInjector)
+    injector.namespace = "train-ticket"
+    injector.kubectl = kubectl
+    injector.configmap_name = "flagd-config"
+    injector.flagd_deployment = "flagd"
+    injector.supported_faults = {"tt-feat-17", "tt-feat-22"}
+    return injector
+
+
+def test_flag_change_waits_for_flagd_rollout_instead_of_sleeping(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(inject_tt_module.time, "sleep", sleeps.append)
+    kubectl = _KubeCtl()
+
+    assert _injector(kubectl)._set_fault_state("tt-feat-17", "on") is True
+
+    assert yaml.safe_load(kubectl.data["flags.yaml"])["flags"]["tt-feat-17"]["defaultVariant"] == "on"
+    assert kubectl.restarted == ["flagd"]
+    assert kubectl.commands == ["kubectl rollout status deployment/flagd -n train-ticket --timeout=60s"]
+    assert sleeps == []
+
+
+def test_failed_restart_falls_back_to_fixed_delay(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(inject_tt_module.time, "sleep", sleeps.append)
+    kubectl = _KubeCtl(rollout_ok=False)
+
+    assert _injector(kubectl)._set_fault_state("tt-feat-22", "on") is True
+
+    assert kubectl.commands == []
+    assert sleeps == [20]
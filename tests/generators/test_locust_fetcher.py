@@ -0,0 +1,56 @@
+from types import SimpleNamespace
+
+from sregym.generators.workload.locust import LocustWorkloadManager
+
+
+class _KubeCtl:
+    def __init__(self, ready=True, deleted=True):
+        self.ready = ready
+        self.deleted = deleted
+        self.waits = []
+
+    def wait_for_pods_deleted(self, namespace, label_selector=None, timeout=60):
+        self.waits.append(("deleted", namespace, label_selector))
+        return self.deleted
+
+    def wait_for_pods_ready(self, namespace, label_selector=None, count=None, timeout=600):
+        self.waits.append(("ready", namespace, label_selector))
+        return self.ready
+
+
+def _manager(existing_pods):
+    manager = object.__new__(LocustWorkloadManager)
+    manager.namespace = "astronomy-shop"
+    manager.locust_url = "load-generator:8089"
+    manager.kubectl = _KubeCtl()
+    manager.created = []
+    manager.core_v1_api = SimpleNamespace(
+        list_namespaced_pod=lambda namespace, label_selector: SimpleNamespace(
+            items=[SimpleNamespace(metadata=SimpleNamespace(name=name)) for name in existing_pods]
+        ),
+        delete_namespaced_pod=lambda name, namespace, body: None,
+        create_namespaced_pod=lambda namespace, body: manager.created.append(body),
+    )
+    return manager
+
+
+def test_fetcher_replacement_waits_on_pod_events_instead_of_polling():
+    manager = _manager(existing_pods=["locust-fetcher"])
+
+    manager.create_fetcher()
+
+    assert manager.kubectl.waits == [
+        ("deleted", "astronomy-shop", "app=locust-fetcher"),
+        ("ready", "astronomy-shop", "app=locust-fetcher"),
+    ]
+    assert manager.created[0]["metadata"]["name"] == "locust-fetcher"
+
+
+def test_fetcher_is_not_recreated_while_the_old_pod_is_still_terminating():
+    manager = _manager(existing_pods=["locust-fetcher"])
+    manager.kubectl.deleted = False
+
+    manager.create_fetcher()
+
+    assert manager.kubectl.waits == [("deleted", "astronomy-shop", "app=locust-fetcher")]
+    assert manager.created == []
@@ -0,0 +1,128 @@
+import copy
+from types import SimpleNamespace
+
+import pytest
+import yaml
+from kubernetes.client.rest import ApiException
+
+from sregym.generators.fault.inject_virtual import VirtualizationFaultInjector
+
+
+def _node(name):
+    return SimpleNamespace(metadata=SimpleNamespace(name=name, labels={}))
+
+
+def _deployment(name, labels=None, node_selector=None):
+    template = {"metadata": {"labels": {"app": name, **(labels or {})}}, "spec": {"containers": [{"name": name}]}}
+    if node_selector:
+        template["spec"]["nodeSelector"] = node_selector
+    return {"metadata": {"name": name}, "spec": {"template": template}}
+
+
+class _RecordingKubeCtl:
+    def __init__(self, deployments, chaos=()):
+        self.deployments = deployments
+        self.chaos = list(chaos)
+        self.commands = []
+        self.node_labels = {}
+        self.applied = []
+        self.created = []
+        self.api_client = SimpleNamespace(sanitize_for_serialization=copy.deepcopy)
+        self.apps_v1_api = SimpleNamespace(
+            list_namespaced_deployment=lambda namespace: SimpleNamespace(items=self.deployments)
+        )
+        self.core_v1_api = SimpleNamespace(patch_node=self._patch_node)
+        self.custom_api = SimpleNamespace(
+            list_namespaced_custom_object=self._list_chaos,
+            create_namespaced_custom_object=lambda group, version, namespace, plural, body: self.created.append(body),
+            delete_namespaced_custom_object=self._delete_chaos,
+        )
+
+    def _patch_node(self, name, body):
+        self.node_labels.setdefault(name, []).append(body["metadata"]["labels"])
+
+    def _list_chaos(self, group, version, namespace, plural):
+        return {"items": [{"metadata": {"name": name}} for name in self.chaos]}
+
+    def _delete_chaos(self, group, version, namespace, plural, name):
+        if name not in self.chaos:
+            raise ApiException(status=404)
+        self.chaos.remove(name)
+
+    def list_nodes(self):
+        return SimpleNamespace(items=[_node("worker-1"), _node("worker-2"), _node("worker-3")])
+
+    def exec_command(self, command):
+        self.commands.append(command)
+        if command.startswith("kubectl apply -f /tmp/tor-deployments"):
+            with open(command.split()[3]) as file:
+                self.applied = list(yaml.safe_load_all(file))
+        return ""
+
+    def wait_for_deployments_rolled_out(self, namespace, names):
+        self.commands.append(f"wait {' '.join(names)}")
+        return True
+
+
+def _injector(deployments, chaos=()):
+    injector = object.__new__(VirtualizationFaultInjector)
+    injector.namespace = "hotel-reservation"
+    injector.kubectl = _RecordingKubeCtl(deployments, chaos)
+    return injector
+
+
+def test_partition_labels_nodes_and_creates_chaos_through_the_api():
+    injector = _injector([_deployment("frontend"), _deployment("geo")])
+
+    injector.inject_tor_network_partition(["frontend"])
+
+    kubectl = injector.kubectl
+    assert kubectl.node_labels == {
+        "worker-1": [{"network-segment": "segment-a"}],
+        "worker-2": [{"network-segment": "segment-b"}],
+        "worker-3": [{"network-segment": "segment-b"}],
+    }
+    assert {dep["metadata"]["name"]: dep["spec"]["template"]["spec"]["nodeSelector"] for dep in kubectl.applied} == {
+        "frontend": {"network-segment": "segment-a"},
+        "geo": {"network-segment": "segment-b"},
+    }
+    assert all(dep["kind"] == "Deployment" and dep["apiVersion"] == "apps/v1" for dep in kubectl.applied)
+    assert [chaos["metadata"]["name"] for chaos in kubectl.created] == ["network-segment-policy"]
+    assert kubectl.commands == [
+        "kubectl delete deployment frontend geo -n hotel-reservation --ignore-not-found=true",
+        "kubectl apply -f /tmp/tor-deployments_modified.yaml -n hotel-reservation",
+        "wait frontend geo",
+    ]
+
+
+def test_recovery_redeploys_only_partitioned_deployments_in_one_batch():
+    segment = {"network-segment": "segment-a"}
+    injector = _injector(
+        [_deployment("frontend", labels=segment, node_selector=segment), _deployment("geo")],
+        chaos=["network-segment-policy"],
+    )
+
+    injector.recover_tor_network_partition(["frontend"])
+
+    kubectl = injector.kubectl
+    assert kubectl.chaos == []
+    assert kubectl.commands[0] == "kubectl delete deployment frontend -n hotel-reservation --ignore-not-found=true"
+    assert kubectl.commands[-1] == "wait frontend"
+    assert [dep["metadata"]["name"] for dep in kubectl.applied] == ["frontend"]
+    assert "nodeSelector" not in kubectl.applied[0]["spec"]["template"]["spec"]
+    assert set(kubectl.node_labels) == {"worker-1", "worker-2", "worker-3"}
+    assert all(labels == [{"network-segment": None}] for labels in kubectl.node_labels.values())
+
+
+def test_failed_node_label_patch_is_raised():
+    injector = _injector([_deployment("frontend")])
+
+    def reject(name, body):
+        if name == "worker-2":
+            raise ApiException(status=403)
+
+    injector.kubectl.core_v1_api.patch_node = reject
+
+    with pytest.raises(ApiException):
+        injector.inject_tor_network_partition(["frontend"])
+    assert injector.kubectl.created == []
@@ -8,16 +8,16 @@ class _KubeCtl:
         self.config_output = config_output
         self.ping_output = ping_output
         self.cart_available = cart_available
+        self.commands = []
 
     def list_pods(self, namespace):
         pod = SimpleNamespace(metadata=SimpleNamespace(name="valkey-cart-abc123"))
         return SimpleNamespace(items=[pod])
 
     def exec_command(self, command):
-        if command.endswith("CONFIG GET requirepass"):
-            return self.config_output
-        if command.endswith("valkey-cli PING"):
-            return self.ping_output
+        self.commands.append(command)
+        if "valkey-cli CONFIG GET requirepass" in command and command.endswith("valkey-cli PING'"):
+            return f"{self.config_output}{ValkeyAuthMitigation.OUTPUT_SEPARATOR}\n{self.ping_output}"
         raise AssertionError(f"Unexpected command: {command}")
 
     def get_deployment(self, name, namespace):
@@ -58,3 +58,11 @@ def test_requires_unauthenticated_ping():
 
 def test_requires_the_cart_deployment_to_recover():
     assert _evaluate("requirepass\n\n", cart_available=0) is False
+
+
+def test_checks_password_and_ping_in_a_single_exec():
+    kubectl = _KubeCtl("requirepass\n\n")
+    problem = SimpleNamespace(namespace="astronomy-shop", kubectl=kubectl)
+
+    assert ValkeyAuthMitigation(problem).evaluate()["success"] is True
+    assert len(kubectl.commands) == 1
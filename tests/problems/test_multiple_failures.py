@@ -0,0 +1,59 @@
+import threading
+
+import pytest
+
+from sregym.conductor.problems.multiple_failures import MultipleIndependentFailures
+
+
+class _Problem:
+    def __init__(self, namespace, log, barrier=None, fail=False):
+        self.namespace = namespace
+        self.log = log
+        self.barrier = barrier
+        self.fail = fail
+
+    def inject_fault(self):
+        if self.barrier is not None:
+            # Only returns if the other namespace's problem is injecting at the same time.
+            self.barrier.wait(timeout=5)
+        self.log.append((self.namespace, id(self)))
+        if self.fail:
+            raise RuntimeError(f"boom in {self.namespace}")
+
+    recover_fault = inject_fault
+
+
+def _multi(problems):
+    multi = object.__new__(MultipleIndependentFailures)
+    multi.problems = problems
+    multi.namespaces = [p.namespace for p in problems]
+    return multi
+
+
+def test_problems_in_different_namespaces_are_injected_concurrently():
+    log = []
+    barrier = threading.Barrier(2)
+    multi = _multi([_Problem("hotel-reservation", log, barrier), _Problem("social-network", log, barrier)])
+
+    multi.inject_fault()
+
+    assert sorted(namespace for namespace, _ in log) == ["hotel-reservation", "social-network"]
+
+
+def test_problems_sharing_a_namespace_keep_their_order():
+    log = []
+    first, second = _Problem("hotel-reservation", log), _Problem("hotel-reservation", log)
+
+    _multi([first, second])._run_on_problems("inject_fault")
+
+    assert log == [("hotel-reservation", id(first)), ("hotel-reservation", id(second))]
+
+
+def test_one_failure_does_not_stop_the_others():
+    log = []
+    multi = _multi([_Problem("a", log, fail=True), _Problem("a", log), _Problem("b", log, fail=True)])
+
+    with pytest.raises(RuntimeError, match=r"inject_fault failed for 2 problem\(s\)"):
+        multi._run_on_problems("inject_fault")
+
+    assert len(log) == 3
@@ -0,0 +1,32 @@
+import threading
+
+from sregym.conductor.problems.mutating_webhook_resource_limits import MutatingWebhookResourceLimits
+
+
+def _problem(events):
+    lock = threading.Lock()
+
+    def record(name):
+        def step():
+            with lock:
+                events.append(name)
+
+        return step
+
+    problem = object.__new__(MutatingWebhookResourceLimits)
+    problem.namespace = "social-network"
+    problem.faulty_service = "nginx-thrift"
+    problem._remove_active_webhook = record("webhook")
+    problem._remove_decoy_webhooks = record("decoys")
+    problem._remove_webhook_backend = record("backend")
+    problem._restart_target_deployment = record("restart")
+    return problem
+
+
+def test_recovery_restarts_only_after_every_webhook_is_removed():
+    events = []
+
+    _problem(events).recover_fault()
+
+    assert sorted(events[:2]) == ["decoys", "webhook"]
+    assert sorted(events[2:]) == ["backend", "restart"]
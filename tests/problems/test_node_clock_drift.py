@@ -0,0 +1,60 @@
+from types import SimpleNamespace
+
+import pytest
+
+from sregym.conductor.problems.node_clock_drift import NodeClockDriftHotelReservation
+
+
+def _pod(node, ready=True, containers=("hotel-reserv-frontend", "tls-health-check")):
+    return SimpleNamespace(
+        spec=SimpleNamespace(node_name=node, containers=[SimpleNamespace(name=name) for name in containers]),
+        status=SimpleNamespace(phase="Running", container_statuses=[SimpleNamespace(ready=ready) for _ in containers]),
+    )
+
+
+class _KubeCtl:
+    def __init__(self, snapshots):
+        self.snapshots = snapshots
+        self.calls = []
+
+    def wait_for_pods_condition(self, namespace, label_selector, condition, timeout):
+        self.calls.append((namespace, label_selector, timeout))
+        return any(condition(pods) for pods in self.snapshots)
+
+
+def _problem(kubectl, control_plane=("control-plane",)):
+    problem = object.__new__(NodeClockDriftHotelReservation)
+    problem.namespace = "hotel-reservation"
+    problem.kubectl = kubectl
+    problem.node_lookups = []
+
+    def is_control_plane(node):
+        problem.node_lookups.append(node)
+        return node in control_plane
+
+    problem._is_control_plane_node = is_control_plane
+    return problem
+
+
+def test_sidecar_rollout_waits_for_a_ready_pod_on_a_worker():
+    kubectl = _KubeCtl(
+        [
+            {"frontend-old": _pod("worker-1", containers=("hotel-reserv-frontend",))},
+            {"frontend-new": _pod("control-plane")},
+            {"frontend-new": _pod("worker-1", ready=False)},
+            {"frontend-new": _pod("worker-1")},
+        ]
+    )
+    problem = _problem(kubectl)
+
+    problem._wait_for_sidecar_rollout(timeout=30)
+
+    assert kubectl.calls == [("hotel-reservation", "io.kompose.service=frontend", 30)]
+    assert problem.node_lookups == ["control-plane", "worker-1"]
+
+
+def test_sidecar_rollout_times_out():
+    problem = _problem(_KubeCtl([{"frontend": _pod("control-plane")}]))
+
+    with pytest.raises(RuntimeError, match="Timed out after 5s"):
+        problem._wait_for_sidecar_rollout(timeout=5)
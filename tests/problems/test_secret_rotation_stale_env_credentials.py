@@ -1,6 +1,8 @@
 import json
 from types import SimpleNamespace
 
+import pytest
+
 from sregym.conductor.problems.secret_rotation_stale_env_credentials import (
     SecretRotationStaleEnvCredentialsAstronomyShop,
 )
@@ -126,3 +128,17 @@ def test_ambiguous_rotation_response_is_accepted_after_password_verification():
     problem._rotate_postgres_password("old-password", "new-password")
 
     assert len(calls) == 1
+
+
+def test_set_env_failure_is_detected_by_exit_status_not_output_text():
+    problem = _problem(_KubeCtl())
+
+    def exec_command_checked(command):
+        raise RuntimeError("Command failed (exit 1): kubectl set env: deployments.apps not found")
+
+    problem.kubectl.exec_command_checked = exec_command_checked
+    with pytest.raises(RuntimeError, match=r"^Failed to set DB_CONNECTION_STRING from Secret: Command failed"):
+        problem._set_product_catalog_secret_env()
+
+    problem.kubectl.exec_command_checked = lambda command: "deployment.apps/product-catalog env updated: no errors\n"
+    problem._set_product_catalog_secret_env()
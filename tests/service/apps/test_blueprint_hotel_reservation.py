@@ -0,0 +1,19 @@
+from sregym.service.apps.blueprint_hotel_reservation import BlueprintHotelReservation
+
+
+class _KubeCtl:
+    def __init__(self):
+        self.deleted = []
+
+    def delete_namespace(self, namespace, wait=True):
+        self.deleted.append((namespace, wait))
+
+
+def test_cleanup_does_not_block_on_namespace_deletion():
+    app = object.__new__(BlueprintHotelReservation)
+    app.namespace = "hotel-reservation"
+    app.kubectl = _KubeCtl()
+
+    app.cleanup()
+
+    assert app.kubectl.deleted == [("hotel-reservation", False)]
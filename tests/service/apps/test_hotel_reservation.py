@@ -72,3 +72,37 @@ def test_deployment_env_overrides_reject_unknown_targets(tmp_path):
         assert "deployment/missing:container" in str(exc)
     else:
         raise AssertionError("missing override target was accepted")
+
+
+def test_failure_script_mounts_are_rendered_into_the_single_apply(tmp_path):
+    (tmp_path / "mongodb-geo.yaml").write_text(
+        """\
+apiVersion: apps/v1
+kind: Deployment
+metadata:
+  name: mongodb-geo
+spec:
+  template:
+    spec:
+      containers:
+        - name: hotel-reserv-geo-mongo
+          volumeMounts:
+            - name: geo
+              mountPath: /data/db
+      volumes:
+        - name: geo
+          persistentVolumeClaim:
+            claimName: geo-pvc
+"""
+    )
+    app = HotelReservation.__new__(HotelReservation)
+    app.k8s_deploy_path = tmp_path
+    app.deployment_env_overrides = {}
+
+    with app._rendered_deployment_configs(mount_failure_scripts=True) as rendered_path:
+        pod_spec = yaml.safe_load((Path(rendered_path) / "mongodb-geo.yaml").read_text())["spec"]["template"]["spec"]
+
+    assert pod_spec["volumes"][-1] == {"name": "failure-script", "configMap": {"name": "failure-admin-geo"}}
+    assert pod_spec["containers"][0]["volumeMounts"][-1] == {"name": "failure-script", "mountPath": "/scripts"}
+    with app._rendered_deployment_configs() as rendered_path:
+        assert Path(rendered_path) == tmp_path
@@ -0,0 +1,33 @@
+import threading
+
+from sregym.service.apps.tidb_cluster_operator import TiDBClusterDeployer
+
+
+def test_deploy_prelude_runs_concurrently_before_the_cluster_apply():
+    deployer = object.__new__(TiDBClusterDeployer)
+    deployer.name = "FleetCast"
+    deployer.namespace_tidb_cluster = "tidb-cluster"
+    prelude = threading.Barrier(2, timeout=5)
+    calls = []
+
+    def step(name):
+        def run(*args):
+            prelude.wait()
+            calls.append(name)
+
+        return run
+
+    deployer.install_crds = step("crds")
+    deployer.install_operator_with_values = step("operator")
+    for name in ("wait_for_operator_ready", "deploy_tidb_cluster", "wait_for_basic_workloads", "init_schema_and_seed"):
+        setattr(deployer, name, lambda name=name: calls.append(name))
+
+    deployer.deploy_all()
+
+    assert sorted(calls[:2]) == ["crds", "operator"]
+    assert calls[2:] == [
+        "wait_for_operator_ready",
+        "deploy_tidb_cluster",
+        "wait_for_basic_workloads",
+        "init_schema_and_seed",
+    ]
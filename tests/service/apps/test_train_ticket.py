@@ -0,0 +1,61 @@
+from types import SimpleNamespace
+
+import yaml
+from kubernetes.client.rest import ApiException
+
+from sregym.service.apps.train_ticket import TrainTicket
+from sregym.service.kubectl import KubeCtl
+
+
+class _RecordingKubeCtl(KubeCtl):
+    def __init__(self):
+        self.commands = []
+
+    def exec_command(self, command, input_data=None):
+        self.commands.append((command, input_data))
+        return "applied"
+
+
+def test_load_generator_and_locustfile_are_applied_in_one_server_side_call():
+    app = object.__new__(TrainTicket)
+    app.namespace = "train-ticket"
+    app.kubectl = _RecordingKubeCtl()
+
+    app._deploy_load_generator()
+
+    [(command, stdin)] = app.kubectl.commands
+    assert command == "kubectl apply --server-side --field-manager=sregym --force-conflicts -f -"
+    documents = list(yaml.safe_load_all(stdin))
+    assert documents[0]["kind"] == "ConfigMap"
+    assert documents[0]["metadata"] == {"name": "locustfile-config", "namespace": "train-ticket"}
+    assert "locustfile.py" in documents[0]["data"]
+    assert {"Service", "Deployment"} <= {doc["kind"] for doc in documents[1:]}
+
+
+class _AppsV1:
+    def __init__(self, items=(), status=None):
+        self.items = list(items)
+        self.status = status
+
+    def list_namespaced_deployment(self, namespace):
+        if self.status is not None:
+            raise ApiException(status=self.status)
+        return SimpleNamespace(items=self.items)
+
+
+def _deployed(apps_v1_api):
+    app = object.__new__(TrainTicket)
+    app.namespace = "train-ticket"
+    app.kubectl = _RecordingKubeCtl()
+    app.kubectl.apps_v1_api = apps_v1_api
+    return app._is_train_ticket_deployed()
+
+
+def test_deployed_check_uses_the_api_instead_of_kubectl():
+    assert _deployed(_AppsV1(items=["ts-ui-dashboard"])) is True
+    # A namespace that doesn't exist lists no deployments rather than returning a 404.
+    assert _deployed(_AppsV1()) is False
+
+
+def test_deployed_check_defensively_treats_a_404_as_not_deployed():
+    assert _deployed(_AppsV1(status=404)) is False
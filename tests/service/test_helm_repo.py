@@ -0,0 +1,40 @@
+import pytest
+
+from sregym.service import helm as helm_module
+from sregym.service.helm import Helm
+
+
+class FakePopen:
+    commands: list[str] = []
+
+    def __init__(self, command, **kwargs):
+        self.commands.append(command)
+        self.returncode = 0
+
+    def communicate(self):
+        return b"", b""
+
+
+@pytest.fixture(autouse=True)
+def fake_helm(monkeypatch):
+    FakePopen.commands = []
+    monkeypatch.setattr(helm_module.subprocess, "Popen", FakePopen)
+    monkeypatch.setattr(helm_module, "_added_repos", {})
+    monkeypatch.setattr(helm_module, "_repos_updated", False)
+
+
+def test_repo_add_and_update_run_once_per_process():
+    for _ in range(3):
+        Helm.add_repo("pingcap", "https://charts.pingcap.org")
+        Helm.repo_update()
+
+    assert FakePopen.commands == ["helm repo add pingcap https://charts.pingcap.org", "helm repo update"]
+
+
+def test_new_repo_invalidates_update():
+    Helm.add_repo("pingcap", "https://charts.pingcap.org")
+    Helm.repo_update()
+    Helm.add_repo("fleetcast", "https://yimingsu01.github.io/FleetCast")
+    Helm.repo_update()
+
+    assert FakePopen.commands.count("helm repo update") == 2
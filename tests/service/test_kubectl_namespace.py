@@ -0,0 +1,114 @@
+from types import SimpleNamespace
+
+import pytest
+from kubernetes.client.rest import ApiException
+
+from sregym.service import kubectl as kubectl_module
+from sregym.service.kubectl import KubeCtl
+
+
+class _CoreV1:
+    def __init__(self, delete_status=None):
+        self.delete_status = delete_status
+        self.deleted = []
+
+    def delete_namespace(self, name):
+        if self.delete_status is not None:
+            raise ApiException(status=self.delete_status)
+        self.deleted.append(name)
+
+
+def _kubectl(core_v1_api):
+    kubectl = object.__new__(KubeCtl)
+    kubectl.core_v1_api = core_v1_api
+    kubectl.waited = []
+    kubectl.wait_for_namespace_deletion = kubectl.waited.append
+    return kubectl
+
+
+def test_non_blocking_delete_does_not_wait():
+    kubectl = _kubectl(_CoreV1())
+
+    kubectl.delete_namespace("astronomy-shop", wait=False)
+
+    assert kubectl.core_v1_api.deleted == ["astronomy-shop"]
+    assert kubectl.waited == []
+
+
+def test_delete_of_terminating_namespace_waits_only_when_asked():
+    kubectl = _kubectl(_CoreV1(delete_status=409))
+
+    kubectl.delete_namespace("astronomy-shop", wait=False)
+    assert kubectl.waited == []
+
+    kubectl.delete_namespace("astronomy-shop")
+    assert kubectl.waited == ["astronomy-shop"]
+
+
+def test_delete_of_missing_namespace_is_a_no_op():
+    kubectl = _kubectl(SimpleNamespace(delete_namespace=_CoreV1(delete_status=404).delete_namespace))
+
+    kubectl.delete_namespace("astronomy-shop")
+
+    assert kubectl.waited == []
+
+
+def _namespace_list(*names):
+    return SimpleNamespace(
+        items=[SimpleNamespace(metadata=SimpleNamespace(name=name)) for name in names],
+        metadata=SimpleNamespace(resource_version="100"),
+    )
+
+
+class _Watch:
+    def __init__(self, events):
+        self.events = events
+        self.streams = []
+
+    def stream(self, func, **kwargs):
+        self.streams.append(kwargs)
+        yield from self.events
+
+    def stop(self):
+        pass
+
+
+def _waiter(monkeypatch, namespace_list, events):
+    fake_watch = _Watch(events)
+    monkeypatch.setattr(kubectl_module.watch, "Watch", lambda: fake_watch)
+    kubectl = object.__new__(KubeCtl)
+    kubectl.core_v1_api = SimpleNamespace(list_namespace=lambda **kwargs: namespace_list)
+    return kubectl, fake_watch
+
+
+def test_namespace_deletion_wait_returns_on_the_deleted_event(monkeypatch):
+    terminating = SimpleNamespace(metadata=SimpleNamespace(resource_version="101"))
+    kubectl, fake_watch = _waiter(
+        monkeypatch,
+        _namespace_list("astronomy-shop"),
+        [{"type": "MODIFIED", "object": terminating}, {"type": "DELETED", "object": terminating}],
+    )
+
+    kubectl.wait_for_namespace_deletion("astronomy-shop")
+
+    [stream] = fake_watch.streams
+    assert stream["field_selector"] == "metadata.name=astronomy-shop"
+    assert stream["resource_version"] == "100"
+
+
+def test_namespace_deletion_wait_skips_the_watch_when_already_gone(monkeypatch):
+    kubectl, fake_watch = _waiter(monkeypatch, _namespace_list(), [])
+
+    kubectl.wait_for_namespace_deletion("astronomy-shop")
+
+    assert fake_watch.streams == []
+
+
+def test_namespace_deletion_wait_times_out(monkeypatch):
+    clock = SimpleNamespace(now=0.0)
+    monkeypatch.setattr(kubectl_module.time, "monotonic", lambda: clock.now)
+    kubectl, fake_watch = _waiter(monkeypatch, _namespace_list("astronomy-shop"), [])
+    fake_watch.stop = lambda: setattr(clock, "now", clock.now + 60)
+
+    with pytest.raises(Exception, match="was not deleted within 120 seconds"):
+        kubectl.wait_for_namespace_deletion("astronomy-shop", max_wait=120)
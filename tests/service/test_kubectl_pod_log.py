@@ -0,0 +1,37 @@
+from sregym.service.kubectl import KubeCtl
+
+
+class _StreamingLog:
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.read = 0
+        self.released = False
+
+    def stream(self, amt):
+        for chunk in self.chunks:
+            self.read += 1
+            yield chunk
+
+    def release_conn(self):
+        self.released = True
+
+
+def _kubectl(response):
+    kubectl = object.__new__(KubeCtl)
+    kubectl.core_v1_api = type("CoreV1", (), {"read_namespaced_pod_log": lambda self, *a, **kw: response})()
+    return kubectl
+
+
+def test_marker_split_across_chunks_stops_the_read():
+    response = _StreamingLog([b"Discovering...\nDISCOVERED_", b"SERVICES:chronyd ntpd\nStop", b"ping chronyd\n"])
+
+    line = _kubectl(response).find_pod_log_line("node-probe", "default", "DISCOVERED_SERVICES:")
+
+    assert line == "DISCOVERED_SERVICES:chronyd ntpd"
+    assert response.read == 2
+    assert response.released
+
+
+def test_unterminated_last_line_and_missing_marker():
+    assert _kubectl(_StreamingLog([b"x\nGC_REMOVED=3"])).find_pod_log_line("gc", "ns", "GC_REMOVED=") == "GC_REMOVED=3"
+    assert _kubectl(_StreamingLog([b"x\ny\n"])).find_pod_log_line("gc", "ns", "GC_REMOVED=") is None
@@ -0,0 +1,288 @@
+from types import SimpleNamespace
+
+import pytest
+from kubernetes.client.rest import ApiException
+
+from sregym.service import kubectl as kubectl_module
+from sregym.service.kubectl import KubeCtl
+
+
+def _meta(name):
+    return SimpleNamespace(name=name, resource_version="1")
+
+
+def _pod(name):
+    return SimpleNamespace(metadata=_meta(name))
+
+
+def _pod_list(*names, resource_version="100"):
+    return SimpleNamespace(
+        items=[_pod(name) for name in names],
+        metadata=SimpleNamespace(resource_version=resource_version),
+    )
+
+
+class FakeWatch:
+    """Replays ``events`` on the first stream; later streams are empty. Each stream ends by
+    advancing the fake clock by its timeout, like a server-side watch timeout."""
+
+    clock = SimpleNamespace(now=0.0)
+
+    def __init__(self, events):
+        self.events = events
+        self.stream_kwargs = None
+        self.stream_calls = 0
+        self.stopped = False
+
+    def stream(self, func, **kwargs):
+        self.stream_kwargs = kwargs
+        self.stream_calls += 1
+        if self.stream_calls == 1:
+            yield from self.events
+        FakeWatch.clock.now += kwargs["timeout_seconds"]
+
+    def stop(self):
+        self.stopped = True
+
+
+@pytest.fixture(autouse=True)
+def fake_clock(monkeypatch):
+    clock = SimpleNamespace(now=0.0)
+    monkeypatch.setattr(FakeWatch, "clock", clock)
+    monkeypatch.setattr(kubectl_module.time, "monotonic", lambda: clock.now)
+    return clock
+
+
+def _kubectl(pod_list):
+    kubectl = object.__new__(KubeCtl)
+    kubectl.core_v1_api = SimpleNamespace(list_namespaced_pod=lambda *args, **kwargs: pod_list)
+    return kubectl
+
+
+def test_wait_for_pods_deleted_returns_without_watch_when_no_pods(monkeypatch):
+    def no_watch():
+        raise AssertionError("watch should not be opened")
+
+    monkeypatch.setattr(kubectl_module.watch, "Watch", no_watch)
+
+    assert _kubectl(_pod_list()).wait_for_pods_deleted("ns", "app=a") is True
+
+
+def test_wait_for_pods_deleted_returns_on_last_delete_event(monkeypatch):
+    fake = FakeWatch(
+        [
+            {"type": "DELETED", "object": _pod("a-1")},
+            {"type": "MODIFIED", "object": _pod("a-2")},
+            {"type": "DELETED", "object": _pod("a-2")},
+            {"type": "ADDED", "object": _pod("never-reached")},
+        ]
+    )
+    monkeypatch.setattr(kubectl_module.watch, "Watch", lambda: fake)
+
+    assert _kubectl(_pod_list("a-1", "a-2")).wait_for_pods_deleted("ns", "app=a", timeout=5) is True
+    assert fake.stream_kwargs["resource_version"] == "100"
+    assert fake.stream_kwargs["timeout_seconds"] == 5
+    assert fake.stopped
+
+
+def test_wait_for_pods_deleted_reports_timeout(monkeypatch):
+    fake = FakeWatch([{"type": "DELETED", "object": _pod("a-1")}])
+    monkeypatch.setattr(kubectl_module.watch, "Watch", lambda: fake)
+
+    assert _kubectl(_pod_list("a-1", "a-2")).wait_for_pods_deleted("ns", "app=a") is False
+
+
+def _ready_pod(name, ready):
+    condition = SimpleNamespace(type="Ready", status="True" if ready else "False")
+    return SimpleNamespace(metadata=_meta(name), status=SimpleNamespace(conditions=[condition]))
+
+
+def test_wait_for_pods_ready_returns_once_count_pods_are_ready(monkeypatch):
+    pod_list = SimpleNamespace(
+        items=[_ready_pod("a-1", False)],
+        metadata=SimpleNamespace(resource_version="7"),
+    )
+    fake = FakeWatch(
+        [
+            {"type": "ADDED", "object": _ready_pod("a-2", False)},
+            {"type": "MODIFIED", "object": _ready_pod("a-1", True)},
+            {"type": "MODIFIED", "object": _ready_pod("a-2", True)},
+        ]
+    )
+    monkeypatch.setattr(kubectl_module.watch, "Watch", lambda: fake)
+
+    assert _kubectl(pod_list).wait_for_pods_ready("ns", "app=a", count=2, timeout=5) is True
+    assert fake.stopped
+
+
+def test_wait_for_pods_ready_without_count_requires_every_pod(monkeypatch):
+    pod_list = SimpleNamespace(
+        items=[_ready_pod("a-1", True), _ready_pod("a-2", False)],
+        metadata=SimpleNamespace(resource_version="7"),
+    )
+    fake = FakeWatch([{"type": "BOOKMARK", "object": {}}])
+    monkeypatch.setattr(kubectl_module.watch, "Watch", lambda: fake)
+
+    assert _kubectl(pod_list).wait_for_pods_ready("ns", "app=a", timeout=5) is False
+
+
+def _scheduled_pod(name, unschedulable):
+    condition = SimpleNamespace(
+        type="PodScheduled",
+        status="False" if unschedulable else "True",
+        reason="Unschedulable" if unschedulable else None,
+    )
+    return SimpleNamespace(metadata=_meta(name), status=SimpleNamespace(conditions=[condition]))
+
+
+def test_wait_for_pods_unschedulable_returns_on_first_unschedulable_pod(monkeypatch):
+    pod_list = SimpleNamespace(items=[_scheduled_pod("a-1", False)], metadata=SimpleNamespace(resource_version="3"))
+    fake = FakeWatch(
+        [
+            {"type": "ADDED", "object": _scheduled_pod("a-2", False)},
+            {"type": "MODIFIED", "object": _scheduled_pod("a-2", True)},
+        ]
+    )
+    monkeypatch.setattr(kubectl_module.watch, "Watch", lambda: fake)
+
+    assert _kubectl(pod_list).wait_for_pods_unschedulable("ns", "app=a", timeout=5) is True
+
+
+def _deployment(name, generation, observed, updated, available):
+    return SimpleNamespace(
+        metadata=SimpleNamespace(name=name, resource_version="1", generation=generation),
+        spec=SimpleNamespace(replicas=2),
+        status=SimpleNamespace(
+            observed_generation=observed, updated_replicas=updated, replicas=2, available_replicas=available
+        ),
+    )
+
+
+def test_wait_for_deployments_rolled_out_returns_once_every_named_deployment_is_done(monkeypatch):
+    deployment_list = SimpleNamespace(
+        items=[_deployment("frontend", 1, 0, 0, 0), _deployment("other", 1, 0, 0, 0)],
+        metadata=SimpleNamespace(resource_version="5"),
+    )
+    fake = FakeWatch(
+        [
+            {"type": "MODIFIED", "object": _deployment("frontend", 1, 1, 2, 1)},
+            {"type": "ADDED", "object": _deployment("geo", 1, 1, 2, 2)},
+            {"type": "MODIFIED", "object": _deployment("frontend", 1, 1, 2, 2)},
+            {"type": "MODIFIED", "object": _deployment("never-reached", 1, 1, 2, 2)},
+        ]
+    )
+    monkeypatch.setattr(kubectl_module.watch, "Watch", lambda: fake)
+    kubectl = object.__new__(KubeCtl)
+    kubectl.apps_v1_api = SimpleNamespace(list_namespaced_deployment=lambda *args, **kwargs: deployment_list)
+
+    assert kubectl.wait_for_deployments_rolled_out("ns", ["frontend", "geo"], timeout=5) is True
+    assert fake.stream_kwargs["resource_version"] == "5"
+    assert fake.stopped
+
+
+def test_instance_returns_one_shared_kubectl(monkeypatch):
+    created = []
+    monkeypatch.setattr(KubeCtl, "_instance", None)
+    monkeypatch.setattr(KubeCtl, "__init__", lambda self: created.append(self))
+
+    assert KubeCtl.instance() is KubeCtl.instance()
+    assert len(created) == 1
+
+
+def test_watch_reconnects_from_last_resource_version(monkeypatch):
+    pod_list = _pod_list("a-1", "a-2")
+    watches = []
+
+    class ReconnectingWatch(FakeWatch):
+        def stream(self, func, **kwargs):
+            watches.append(kwargs)
+            if len(watches) == 1:
+                deleted = _pod("a-1")
+                deleted.metadata.resource_version = "150"
+                yield {"type": "DELETED", "object": deleted}
+                FakeWatch.clock.now += kwargs["timeout_seconds"]
+            else:
+                yield {"type": "DELETED", "object": _pod("a-2")}
+
+    monkeypatch.setattr(kubectl_module.watch, "Watch", lambda: ReconnectingWatch([]))
+
+    assert _kubectl(pod_list).wait_for_pods_deleted("ns", "app=a", timeout=120) is True
+    assert [w["timeout_seconds"] for w in watches] == [60, 60]
+    assert [w["resource_version"] for w in watches] == ["100", "150"]
+
+
+def test_watch_relists_when_resource_version_expires(monkeypatch):
+    lists = iter([_pod_list("a-1"), _pod_list()])
+
+    class ExpiredWatch(FakeWatch):
+        def stream(self, func, **kwargs):
+            raise ApiException(status=410, reason="Gone")
+            yield
+
+    kubectl = object.__new__(KubeCtl)
+    kubectl.core_v1_api = SimpleNamespace(list_namespaced_pod=lambda *args, **kwargs: next(lists))
+    monkeypatch.setattr(kubectl_module.watch, "Watch", lambda: ExpiredWatch([]))
+
+    assert kubectl.wait_for_pods_deleted("ns", "app=a", timeout=30) is True
+
+
+def _labelled_pod(name, labels, ready):
+    return SimpleNamespace(
+        metadata=SimpleNamespace(name=name, resource_version="1", labels=labels, owner_references=None),
+        status=SimpleNamespace(phase="Running", container_statuses=[SimpleNamespace(ready=ready)]),
+    )
+
+
+def test_wait_for_ready_follows_several_services_on_one_watch(monkeypatch):
+    pod_list = SimpleNamespace(
+        items=[_labelled_pod("geo-1", {"app": "geo"}, True), _labelled_pod("rate-1", {"app": "rate"}, False)],
+        metadata=SimpleNamespace(resource_version="9"),
+    )
+    fake = FakeWatch(
+        [
+            {"type": "MODIFIED", "object": _labelled_pod("other-1", {"app": "other"}, False)},
+            {"type": "MODIFIED", "object": _labelled_pod("rate-1", {"app": "rate"}, True)},
+        ]
+    )
+    monkeypatch.setattr(kubectl_module.watch, "Watch", lambda: fake)
+    kubectl = _kubectl(pod_list)
+    kubectl.get_service = lambda name, namespace: SimpleNamespace(spec=SimpleNamespace(selector={"app": name}))
+
+    kubectl.wait_for_ready("ns", ["geo", "rate"], max_wait=5)
+
+    assert fake.stream_calls == 1
+    assert fake.stream_kwargs["label_selector"] is None
+
+
+def test_has_running_pod_asks_the_server_for_one_running_pod():
+    calls = []
+
+    def list_namespaced_pod(namespace, **kwargs):
+        calls.append((namespace, kwargs))
+        return _pod_list("loki-0")
+
+    kubectl = object.__new__(KubeCtl)
+    kubectl.core_v1_api = SimpleNamespace(list_namespaced_pod=list_namespaced_pod)
+
+    assert kubectl.has_running_pod("observe", "app.kubernetes.io/name=loki") is True
+    assert calls == [
+        (
+            "observe",
+            {"label_selector": "app.kubernetes.io/name=loki", "field_selector": "status.phase=Running", "limit": 1},
+        )
+    ]
+
+
+def test_static_node_facts_are_read_from_the_watch_cache():
+    node = SimpleNamespace(status=SimpleNamespace(node_info=SimpleNamespace(architecture="arm64")))
+    calls = []
+
+    def list_node(**kwargs):
+        calls.append(kwargs)
+        return SimpleNamespace(items=[node])
+
+    kubectl = object.__new__(KubeCtl)
+    kubectl.core_v1_api = SimpleNamespace(list_node=list_node)
+
+    assert kubectl.get_node_architectures() == {"arm64"}
+    assert calls == [{"resource_version": "0"}]
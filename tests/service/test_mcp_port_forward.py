@@ -0,0 +1,39 @@
+from types import SimpleNamespace
+
+from sregym.service import mcp_server as mcp_server_module
+from sregym.service.mcp_server import MCPServer
+
+
+def _server(listening_after, exit_code=None):
+    server = object.__new__(MCPServer)
+    server.port = 9954
+    checks = iter(range(100))
+    server.is_port_in_use = lambda port: next(checks) >= listening_after
+    server.port_forward_process = SimpleNamespace(poll=lambda: exit_code)
+    return server
+
+
+def test_returns_once_the_port_listens_with_growing_delays(monkeypatch):
+    sleeps = []
+    monkeypatch.setattr(mcp_server_module.time, "sleep", sleeps.append)
+
+    assert _server(listening_after=3)._wait_for_port_forward() is True
+    assert sleeps == [0.1, 0.2, 0.4]
+
+
+def test_exited_kubectl_is_a_failure(monkeypatch):
+    monkeypatch.setattr(mcp_server_module.time, "sleep", lambda s: None)
+
+    assert _server(listening_after=0, exit_code=1)._wait_for_port_forward() is False
+
+
+def test_rbac_manifests_are_applied_in_one_call():
+    server = object.__new__(MCPServer)
+    commands = []
+    server.kubectl = SimpleNamespace(exec_command=commands.append)
+
+    server._ensure_rbac()
+
+    assert len(commands) == 1
+    assert commands[0].startswith("kubectl apply --server-side ")
+    assert "clusterrole.yaml" in commands[0] and "clusterrolebinding.yaml" in commands[0]
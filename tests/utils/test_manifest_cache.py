@@ -0,0 +1,63 @@
+import io
+import os
+import urllib.error
+
+import pytest
+
+from sregym.utils import cache
+
+
+def test_cached_manifest_path_downloads_once(monkeypatch, tmp_path):
+    calls = []
+
+    def fake_urlopen(url, timeout=None):
+        calls.append(url)
+        return io.BytesIO(b"kind: CustomResourceDefinition\n")
+
+    monkeypatch.setattr(cache, "MANIFEST_CACHE_DIR", tmp_path)
+    monkeypatch.setattr(cache.urllib.request, "urlopen", fake_urlopen)
+
+    url = "https://example.com/v1.0.0/crd.yaml"
+    first = cache.cached_manifest_path(url)
+    second = cache.cached_manifest_path(url)
+
+    assert first == second
+    assert first.parent == tmp_path
+    assert first.read_bytes() == b"kind: CustomResourceDefinition\n"
+    assert calls == [url]
+
+
+def test_cached_manifest_path_keys_by_url(monkeypatch, tmp_path):
+    monkeypatch.setattr(cache, "MANIFEST_CACHE_DIR", tmp_path)
+    monkeypatch.setattr(cache.urllib.request, "urlopen", lambda url, timeout=None: io.BytesIO(url.encode()))
+
+    assert cache.cached_manifest_path("https://a/crd.yaml") != cache.cached_manifest_path("https://b/crd.yaml")
+
+
+def test_cached_manifest_path_refreshes_after_ttl(monkeypatch, tmp_path):
+    contents = iter([b"v1\n", b"v2\n"])
+    monkeypatch.setattr(cache, "MANIFEST_CACHE_DIR", tmp_path)
+    monkeypatch.setattr(cache.urllib.request, "urlopen", lambda url, timeout=None: io.BytesIO(next(contents)))
+
+    url = "https://example.com/releases/latest/components.yaml"
+    path = cache.cached_manifest_path(url, max_age=60)
+    assert cache.cached_manifest_path(url, max_age=60).read_bytes() == b"v1\n"
+
+    os.utime(path, (path.stat().st_atime, path.stat().st_mtime - 120))
+    assert cache.cached_manifest_path(url, max_age=60).read_bytes() == b"v2\n"
+
+
+def test_cached_manifest_path_falls_back_to_stale_copy(monkeypatch, tmp_path):
+    monkeypatch.setattr(cache, "MANIFEST_CACHE_DIR", tmp_path)
+    monkeypatch.setattr(cache.urllib.request, "urlopen", lambda url, timeout=None: io.BytesIO(b"v1\n"))
+    url = "https://example.com/releases/latest/components.yaml"
+    cache.cached_manifest_path(url)
+
+    def unreachable(url, timeout=None):
+        raise urllib.error.URLError("offline")
+
+    monkeypatch.setattr(cache.urllib.request, "urlopen", unreachable)
+
+    assert cache.cached_manifest_path(url, refresh=True).read_bytes() == b"v1\n"
+    with pytest.raises(urllib.error.URLError):
+        cache.cached_manifest_path("https://example.com/other.yaml")